@@ -15,9 +15,23 @@ Deprecation policy:
 
 __version__ = "0.3.1"
 
-from gatehouse.engine import ScanResult, Violation, scan_file
 from gatehouse.exceptions import GatehouseViolationError, PluginError
 
+# The engine pulls in libcst; load it on first use so importing a light
+# submodule (gatehouse.auto, gatehouse.cli) does not pay for it.
+_ENGINE_EXPORTS = ("ScanResult", "Violation", "scan_file")
+
+
+def __getattr__(name: str) -> object:
+    """Resolve the engine exports lazily on first attribute access."""
+    if name in _ENGINE_EXPORTS:
+        from gatehouse import engine
+
+        value = getattr(engine, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     "__version__",
     "scan_file",
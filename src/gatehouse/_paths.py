@@ -8,10 +8,13 @@ Environment variables:
     GATE_HOME — Override the default gate home directory. When set to
         an existing directory path, all rule/schema/plugin lookups use
         that directory instead of the package-internal default.
+    GATEHOUSE_CACHE_DIR — Opt-in directory where parsed YAML documents
+        are persisted between processes.  Unset means no on-disk cache.
 """
 
 import os
 from pathlib import Path
+from typing import Optional
 
 _PACKAGE_DIR = Path(__file__).resolve().parent
 
@@ -68,3 +71,9 @@ def config_dir() -> Path:
 def theme_path() -> Path:
     """Return the path to cli/theme.yaml."""
     return cli_dir() / _cfg("filenames.theme")
+
+
+def yaml_cache_dir() -> Optional[Path]:
+    """Return the on-disk YAML cache directory, or None if not enabled."""
+    env = os.environ.get(_cfg("env_vars.cache_dir"))
+    return Path(env) if env else None
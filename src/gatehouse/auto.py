@@ -26,6 +26,7 @@ Environment variables:
 
 from __future__ import annotations
 
+import functools
 import importlib.abc
 import importlib.machinery
 import importlib.util
@@ -33,12 +34,14 @@ import os
 import sys
 import warnings
 from pathlib import Path
-from typing import Any, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Optional, Sequence
 
-from gatehouse.engine import ScanResult, scan_file
 from gatehouse.exceptions import GatehouseParseError, GatehouseViolationError
 from gatehouse.lib import config
 
+if TYPE_CHECKING:
+    from gatehouse.engine import ScanResult
+
 _PACKAGE_DIR = Path(__file__).resolve().parent
 
 
@@ -95,6 +98,28 @@ def _find_schema_path() -> Optional[str]:
     return None
 
 
+# The marker variable's last seen value and its entries, so each import
+# re-splits the variable only when another file has been marked since.
+_SCANNED_CACHE: tuple[str, frozenset[str]] = ("", frozenset())
+
+
+def _scanned_entries(scanned_raw: str, separator: str) -> frozenset[str]:
+    """Return the filepaths listed in the marker variable's value.
+
+    Args:
+        scanned_raw: Current value of the marker environment variable.
+        separator: Separator between filepaths.
+
+    Returns:
+        The recorded filepaths.
+    """
+    global _SCANNED_CACHE  # noqa: PLW0603
+    if _SCANNED_CACHE[0] != scanned_raw:
+        entries = scanned_raw.split(separator) if scanned_raw else []
+        _SCANNED_CACHE = (scanned_raw, frozenset(entries))
+    return _SCANNED_CACHE[1]
+
+
 def _already_scanned(filepath: str) -> bool:
     """Check if this filepath was already scanned in this process.
 
@@ -114,8 +139,7 @@ def _already_scanned(filepath: str) -> bool:
     scanned_raw = os.environ.get(env_key, "")
     if not scanned_raw:
         return False
-    scanned_set = set(scanned_raw.split(separator))
-    return filepath in scanned_set
+    return filepath in _scanned_entries(scanned_raw, separator)
 
 
 def _mark_scanned(filepath: str) -> None:
@@ -128,18 +152,38 @@ def _mark_scanned(filepath: str) -> None:
     separator = config.get_str("defaults.marker_separator")
     scanned_raw = os.environ.get(env_key, "")
     if scanned_raw:
-        entries = set(scanned_raw.split(separator))
-        entries.add(filepath)
-        os.environ[env_key] = separator.join(entries)
+        if filepath not in _scanned_entries(scanned_raw, separator):
+            os.environ[env_key] = scanned_raw + separator + filepath
     else:
         os.environ[env_key] = filepath
 
 
+@functools.lru_cache(maxsize=None)
+def _skip_rules(defaults_id: int) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Build the path markers and prefixes that exclude a file from scanning.
+
+    Args:
+        defaults_id: Identity of the loaded config, so a config reload
+            rebuilds the rules.
+
+    Returns:
+        Substrings marking third-party packages, and the path prefixes of
+        gatehouse itself and the standard library.
+    """
+    markers = (
+        config.get_str("skip_markers.site_packages"),
+        config.get_str("skip_markers.dist_packages"),
+    )
+    prefixes = (str(_PACKAGE_DIR), os.path.dirname(os.__file__))
+    return markers, prefixes
+
+
 def _should_skip(filepath: str) -> bool:
     """Determine if a file should be skipped from scanning.
 
     Skips gatehouse's own modules, non-existent files, non-.py files,
-    and files in standard library or site-packages.
+    and files in standard library or site-packages.  The path checks run
+    before the existence check so most skipped imports cost no stat call.
 
     Args:
         filepath: Path to the module file.
@@ -147,33 +191,25 @@ def _should_skip(filepath: str) -> bool:
     Returns:
         True if the file should not be scanned.
     """
-    # Skip non-Python or missing files — nothing to validate.
+    # Skip non-Python files — nothing to validate.
     if not filepath or not filepath.endswith(".py"):
         return True
 
-    if not os.path.isfile(filepath):
-        return True
-
+    markers, prefixes = _skip_rules(id(config.load_defaults()))
     normalized = os.path.normpath(filepath)
 
     # Skip third-party packages — they are outside the user's control.
-    site_pkg = config.get_str("skip_markers.site_packages")
-    dist_pkg = config.get_str("skip_markers.dist_packages")
-    if site_pkg in normalized or dist_pkg in normalized:
+    if any(marker in normalized for marker in markers):
         return True
 
     # Skip gatehouse itself — scanning our own code during import would
-    # cause infinite recursion.
-    package_prefix = str(_PACKAGE_DIR)
-    if normalized.startswith(package_prefix):
+    # cause infinite recursion — and the standard library, which is not
+    # user code.
+    if normalized.startswith(prefixes):
         return True
 
-    # Skip the standard library — not user code.
-    stdlib_path = os.path.dirname(os.__file__)
-    if normalized.startswith(stdlib_path):
-        return True
-
-    return False
+    # Skip missing files.
+    return not os.path.isfile(filepath)
 
 
 class GatehouseImportHook(importlib.abc.MetaPathFinder):
@@ -258,12 +294,21 @@ class GatehouseImportHook(importlib.abc.MetaPathFinder):
         except (OSError, UnicodeDecodeError):
             return
 
+        # Deferred so activating the hook (or leaving it off) does not pay
+        # for importing libcst and the rule engine.
+        from gatehouse.engine import scan_file
+
+        # Hard mode only needs the verdict, so rule evaluation stops at the
+        # first blocking rule and only that rule's violations are reported
+        # (fix them and re-import to see the next).  Soft mode reports
+        # everything.
         try:
             result: ScanResult = scan_file(
                 source,
                 filepath,
                 self._schema_path,
                 output_format=fmt_stderr,
+                fail_fast=self._mode == mode_hard,
             )
         except GatehouseParseError as exc:
             error_line = config.get_int("defaults.error_line")
@@ -15,6 +15,7 @@ Subcommands:
     activate      Print shell commands to activate Gatehouse.
     deactivate    Print shell commands to deactivate Gatehouse.
     lint-rules    Validate all rule YAML files for correctness.
+    scan          Scan Python files against the project schema.
 """
 
 from __future__ import annotations
@@ -36,7 +37,7 @@ from gatehouse._paths import (
 from gatehouse.cli.wizard import cmd_new_rule  # noqa: F401 — re-exported
 from gatehouse.lib import config
 from gatehouse.lib.theme import colorize
-from gatehouse.lib.yaml_loader import load_yaml
+from gatehouse.lib.yaml_loader import dump_yaml, load_yaml
 
 
 # -------------------------------------------------------------------------
@@ -311,8 +312,6 @@ def cmd_disable_rule(args: argparse.Namespace) -> None:
     err_color = config.get_str("colors.error")
     ok_color = config.get_str("colors.success")
 
-    import yaml
-
     local_schema = Path.cwd() / project_cfg_name
     if not local_schema.exists():
         print(_color(
@@ -325,8 +324,7 @@ def cmd_disable_rule(args: argparse.Namespace) -> None:
     schema_data.setdefault("rule_overrides", {})
     schema_data["rule_overrides"][rule_id] = {"severity": sev_off}
 
-    with open(str(local_schema), "w", encoding="utf-8") as fh:
-        yaml.dump(schema_data, fh, default_flow_style=False, sort_keys=False)
+    dump_yaml(schema_data, local_schema)
 
     print(_color(
         f"\u2713 Disabled rule '{rule_id}' in {project_cfg_name} (project-local)",
@@ -348,8 +346,6 @@ def cmd_enable_rule(args: argparse.Namespace) -> None:
     err_color = config.get_str("colors.error")
     ok_color = config.get_str("colors.success")
 
-    import yaml
-
     local_schema = Path.cwd() / project_cfg_name
     if not local_schema.exists():
         print(_color(
@@ -367,8 +363,7 @@ def cmd_enable_rule(args: argparse.Namespace) -> None:
 
     del overrides[rule_id]
 
-    with open(str(local_schema), "w", encoding="utf-8") as fh:
-        yaml.dump(schema_data, fh, default_flow_style=False, sort_keys=False)
+    dump_yaml(schema_data, local_schema)
 
     print(_color(
         f"\u2713 Enabled rule '{rule_id}' (override removed from {project_cfg_name})",
@@ -706,3 +701,44 @@ def cmd_lint_rules(args: argparse.Namespace) -> None:
                 ok_color,
             )
         )
+
+
+# -------------------------------------------------------------------------
+# Batch scanning
+# -------------------------------------------------------------------------
+
+
+def cmd_scan(args: argparse.Namespace) -> None:
+    """Scan Python files against the project schema in one process tree.
+
+    Rules, schemas and the project config are loaded once per worker
+    instead of once per file, which is what a per-file ``python_gate``
+    run pays.  Exit with the engine's blocked or error code if any file
+    is rejected or cannot be parsed.
+
+    Args:
+        args: Parsed CLI arguments.  Uses ``args.paths``, ``args.schema``,
+            ``args.format`` and ``args.jobs``.
+    """
+    # The engine pulls in the parser; other commands should not pay for it.
+    from gatehouse.engine import expand_paths, scan_files
+
+    schema_path = args.schema or config.get_str("filenames.project_config")
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    exit_blocked = config.get_int("exit_codes.blocked")
+    exit_error = config.get_int("exit_codes.error")
+
+    results = scan_files(
+        expand_paths(args.paths),
+        schema_path,
+        output_format=args.format,
+        workers=jobs,
+    )
+    exit_code = config.get_int("exit_codes.ok")
+    for result in results:
+        if result is None:
+            exit_code = max(exit_code, exit_error)
+        elif result.blocking_count > 0:
+            exit_code = max(exit_code, exit_blocked)
+    if exit_code:
+        sys.exit(exit_code)
@@ -17,6 +17,7 @@ Usage::
     gatehouse activate [--mode hard|soft]
     gatehouse deactivate
     gatehouse lint-rules
+    gatehouse scan <paths...> [--schema <path>] [--jobs N]
 """
 
 from __future__ import annotations
@@ -34,6 +35,7 @@ from gatehouse.cli.commands import (
     cmd_lint_rules,
     cmd_list_rules,
     cmd_new_rule,
+    cmd_scan,
     cmd_status,
     cmd_test_rule,
 )
@@ -55,6 +57,9 @@ def main() -> None:
         config.get_str("modes.hard"),
         config.get_str("modes.soft"),
     ]
+    project_config = config.get_str("filenames.project_config")
+    fmt_stderr = config.get_str("formats.stderr")
+    fmt_json = config.get_str("formats.json")
 
     parser = argparse.ArgumentParser(prog=prog, description=desc)
     parser.add_argument(
@@ -118,6 +123,31 @@ def main() -> None:
         "lint-rules", help="Validate all rule YAML files for correctness"
     )
 
+    sub_scan = subparsers.add_parser(
+        "scan", help="Scan Python files against the project schema",
+        fromfile_prefix_chars="@",
+    )
+    sub_scan.add_argument(
+        "paths", nargs="+",
+        help="Files or glob patterns to scan (@list.txt reads them from a file)",
+    )
+    sub_scan.add_argument(
+        "--schema",
+        help=f"Path to the project config (default: {project_config})",
+    )
+    sub_scan.add_argument(
+        "--format",
+        choices=[fmt_stderr, fmt_json],
+        default=fmt_stderr,
+        help="Output format",
+    )
+    sub_scan.add_argument(
+        "--jobs",
+        type=int,
+        default=config.get_int("defaults.scan_workers"),
+        help="Worker processes (0 = one per CPU)",
+    )
+
     args = parser.parse_args()
 
     dispatch = {
@@ -131,6 +161,7 @@ def main() -> None:
         "activate": cmd_activate,
         "deactivate": cmd_deactivate,
         "lint-rules": cmd_lint_rules,
+        "scan": cmd_scan,
     }
 
     handler = dispatch.get(args.command)
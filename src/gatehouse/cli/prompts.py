@@ -9,6 +9,7 @@ evaluator supports conditional prompt visibility.
 
 from __future__ import annotations
 
+import functools
 import re
 import sys
 from typing import Any, Optional
@@ -157,6 +158,36 @@ def prompt_severity() -> str:
 # -------------------------------------------------------------------------
 
 
+_SHOW_IF_EQ = re.compile(r"(\w+)\s*==\s*['\"](.+?)['\"]")
+_SHOW_IF_IN = re.compile(r"(\w+)\s+in\s+\[(.+?)\]")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_show_if(show_if_expr: str) -> Optional[tuple[str, tuple[str, ...]]]:
+    """Parse a show_if expression into its field name and allowed values.
+
+    Args:
+        show_if_expr: The condition expression string.
+
+    Returns:
+        ``(field_name, allowed_values)``, or None if the expression matches
+        neither supported pattern.
+    """
+    eq_match = _SHOW_IF_EQ.match(show_if_expr)
+    if eq_match:
+        return eq_match.group(1), (eq_match.group(2),)
+
+    in_match = _SHOW_IF_IN.match(show_if_expr)
+    if in_match:
+        allowed = tuple(
+            item.strip().strip("'\"")
+            for item in in_match.group(2).split(",")
+        )
+        return in_match.group(1), allowed
+
+    return None
+
+
 def evaluate_show_if(
     show_if_expr: str,
     collected_values: dict[str, Any],
@@ -177,20 +208,8 @@ def evaluate_show_if(
     if not show_if_expr:
         return True
 
-    eq_match = re.match(r"(\w+)\s*==\s*['\"](.+?)['\"]", show_if_expr)
-    if eq_match:
-        field_name = eq_match.group(1)
-        expected = eq_match.group(2)
-        return collected_values.get(field_name) == expected
-
-    in_match = re.match(r"(\w+)\s+in\s+\[(.+?)\]", show_if_expr)
-    if in_match:
-        field_name = in_match.group(1)
-        raw_items = in_match.group(2)
-        allowed = [
-            item.strip().strip("'\"")
-            for item in raw_items.split(",")
-        ]
-        return collected_values.get(field_name) in allowed
-
-    return True
+    compiled = _compile_show_if(show_if_expr)
+    if compiled is None:
+        return True
+    field_name, allowed = compiled
+    return collected_values.get(field_name) in allowed
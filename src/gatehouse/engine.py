@@ -13,38 +13,51 @@ Design notes:
 
 from __future__ import annotations
 
-import json
+import contextlib
+import functools
+import glob
+import io
+import os
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Iterable, Optional, Sequence, TextIO, Union
 
 from gatehouse import __version__ as VERSION
 from gatehouse.exceptions import GatehouseParseError
-from gatehouse.lib import config
-from gatehouse.lib.checks import run_check
+from gatehouse.lib import config, json_encoder
+from gatehouse.lib.analyzer import SourceAnalyzer
+from gatehouse.lib.checks import bind_check, check_cost
 from gatehouse.lib.formatter import (
+    compile_template,
     format_summary_stderr,
     format_violation_stderr,
     format_violations_json,
-    inject_variables,
+    render_template,
 )
 from gatehouse.lib.logger import log_scan
 from gatehouse.lib.rules import (
-    apply_project_overrides,
     find_gate_home,
+    get_active_rules,
     load_project_config,
     load_schema,
-    resolve_rules,
 )
 from gatehouse.lib.scope import is_file_in_scope, resolve_effective_schema
 
 
+# (gate_home, schema_name) pairs already reported as missing.
+_WARNED_SCHEMAS: set[tuple[str, str]] = set()
+
+
 @dataclass
 class Violation:
     """A single rule violation found during scanning."""
 
+    # Written out rather than dataclass(slots=True), which needs 3.10.
+    __slots__ = ("rule_id", "severity", "line", "source", "message", "fix")
+
     rule_id: str
     severity: str
     line: int
@@ -66,25 +79,157 @@ class ScanResult:
     schema_version: str = ""
 
 
+def _run_rule(
+    rule_obj: dict[str, Any],
+    check: Optional[Callable[[SourceAnalyzer], list[dict[str, Any]]]],
+    analyzer: SourceAnalyzer,
+    diagnostics: list[str],
+) -> list[dict[str, Any]]:
+    """Run one rule's check, converting unexpected errors into a violation.
+
+    Args:
+        rule_obj: Resolved rule object to evaluate.
+        check: The rule's bound check from ``bind_check``, or None if the
+            check type is unknown.
+        analyzer: The SourceAnalyzer for the file being checked.
+        diagnostics: Buffer that receives the stderr message for a rule
+            that raised; the caller writes it out in one go.
+
+    Returns:
+        List of violation dicts. Empty list means the rule passed.
+    """
+    if check is None:
+        return []
+    try:
+        return check(analyzer)
+    except Exception as exc:
+        msg = config.get_str("messages.rule_exception")
+        diagnostics.append(
+            "  " + msg.format(
+                rule_id=rule_obj["id"],
+                error=type(exc).__name__,
+                detail=str(exc),
+            ) + "\n"
+        )
+        err_msg = config.get_str("messages.internal_rule_error")
+        return [
+            {
+                "line": config.get_int("defaults.error_line"),
+                "source": err_msg.format(rule_id=rule_obj["id"]),
+            }
+        ]
+
+
+def _evaluate_rules(
+    active_rules: tuple[dict[str, Any], ...],
+    gate_home: Path,
+    analyzer: SourceAnalyzer,
+    *,
+    fail_fast: bool,
+    parallel: int,
+    sev_block: str,
+) -> tuple[
+    list[tuple[dict[str, Any], list[dict[str, Any]]]], list[str], list[str]
+]:
+    """Run every active rule's check against one analyzed file.
+
+    Args:
+        active_rules: Rules to evaluate, in order.
+        gate_home: The gate home directory, for resolving plugin checks.
+        analyzer: The SourceAnalyzer for the file being checked.
+        fail_fast: Run the cheapest checks first and stop after the first
+            rule with a blocking violation.
+        parallel: Number of worker threads; see ``scan_file``.
+        sev_block: The blocking severity name.
+
+    Returns:
+        The (rule, violations) pairs for rules that reported violations,
+        the IDs of rules that passed, and the stderr diagnostics for rules
+        that raised.
+    """
+    rules: Sequence[dict[str, Any]] = active_rules
+    if fail_fast:
+        # Only the verdict matters, so cheap checks run first: a blocking
+        # violation they find spares the costlier ones.
+        rules = sorted(active_rules, key=check_cost)
+    bound_checks = [bind_check(r, gate_home) for r in rules]
+    all_rule_violations: list[tuple[dict[str, Any], list[dict[str, Any]]]] = []
+    passed_rules: list[str] = []
+    # One buffer per rule, so diagnostics come out in rule order even when
+    # worker threads finish out of order.
+    rule_diagnostics: list[list[str]] = [[] for _ in rules]
+
+    executor: Optional[ThreadPoolExecutor] = None
+    if parallel > 1 and len(active_rules) >= config.get_int(
+        "defaults.parallel_rule_threshold"
+    ):
+        # Run the shared CST walk once up front so worker threads reuse
+        # its results instead of racing to compute them.
+        analyzer.collect_facts()
+        executor = ThreadPoolExecutor(max_workers=parallel)
+        rule_results = executor.map(
+            lambda r, c, d: _run_rule(r, c, analyzer, d),
+            rules,
+            bound_checks,
+            rule_diagnostics,
+        )
+    else:
+        rule_results = (
+            _run_rule(r, c, analyzer, d)
+            for r, c, d in zip(rules, bound_checks, rule_diagnostics)
+        )
+
+    evaluated = 0
+    for rule_obj, violations in zip(rules, rule_results):
+        evaluated += 1
+        if violations:
+            all_rule_violations.append((rule_obj, violations))
+            if fail_fast and rule_obj["severity"] == sev_block:
+                break
+        else:
+            passed_rules.append(rule_obj["id"])
+
+    if executor is not None:
+        executor.shutdown(cancel_futures=True)
+    diagnostics = [
+        msg for messages in rule_diagnostics[:evaluated] for msg in messages
+    ]
+    return all_rule_violations, passed_rules, diagnostics
+
+
 def scan_file(
-    source: str,
+    source: Union[str, bytes],
     filepath: str,
     schema_path: str,
     *,
     output_format: str = "",
     skip_scope: bool = False,
+    fail_fast: bool = False,
+    parallel: int = 1,
 ) -> ScanResult:
     """Scan a Python source string against the schema.
 
     This is the primary entry point for Gatehouse enforcement.
 
     Args:
-        source: Python source code as a string.
+        source: Python source code, as text or as undecoded bytes (the
+            encoding is then detected from the PEP 263 cookie or BOM).
         filepath: Path to the file (used for scope checking and templates).
         schema_path: Path to the .gate_schema.yaml project config.
         output_format: 'stderr' for human output, 'json' for structured.
             Defaults to the value from config.
         skip_scope: If True, skip gated_paths scope checking.
+        fail_fast: If True, evaluate rules cheapest check type first and
+            stop after the first rule that reports a blocking violation.
+            The result (and stderr output) then holds only that rule's
+            violations, not every violation in the file.  Useful when
+            only the pass/fail verdict matters, as in the hard-mode
+            import hook.  Ignored when scan logging is enabled so log
+            entries stay complete.
+        parallel: Number of worker threads used to evaluate rules.  The
+            pool is only used when the schema has at least
+            ``defaults.parallel_rule_threshold`` active rules; results
+            are collected in rule order either way.
 
     Returns:
         ScanResult with status, violations, and timing.
@@ -93,18 +238,17 @@ def scan_file(
         output_format = config.get_str("formats.default")
 
     status_passed = config.get_str("statuses.passed")
-    sev_off = config.get_str("severities.off")
     sev_block = config.get_str("severities.block")
     sev_warn = config.get_str("severities.warn")
     status_rejected = config.get_str("statuses.rejected")
     fallback_line = config.get_int("defaults.fallback_line")
-    error_line = config.get_int("defaults.error_line")
     default_version = config.get_str("defaults.schema_version")
     fmt_json = config.get_str("formats.json")
     violation_sep = config.get_str("formatting.violation_separator")
     json_indent = config.get_int("defaults.json_indent")
+    default_violation = config.get_str("messages.default_violation")
 
-    start = time.time()
+    start = time.perf_counter_ns()
 
     # 1. Resolve gate home and project config
     gate_home = find_gate_home()
@@ -122,8 +266,12 @@ def scan_file(
 
     schema_data = load_schema(schema_name, gate_home)
     if not schema_data:
-        msg = config.get_str("messages.schema_not_found")
-        sys.stderr.write(msg.format(name=schema_name, path="") + "\n")
+        # Warn once per missing schema, not once per scanned file.
+        missing_key = (str(gate_home), schema_name)
+        if missing_key not in _WARNED_SCHEMAS:
+            _WARNED_SCHEMAS.add(missing_key)
+            msg = config.get_str("messages.schema_not_found")
+            sys.stderr.write(msg.format(name=schema_name, path="") + "\n")
         return ScanResult(status=status_passed)
 
     # 3. Check file scope (early exit if out of scope)
@@ -131,76 +279,141 @@ def scan_file(
         return ScanResult(status=status_passed)
 
     # 4. Load and filter active rules
-    rules = resolve_rules(schema_data, gate_home)
-    rules = apply_project_overrides(rules, project_config)
-    active_rules = [r for r in rules if r["enabled"] and r["severity"] != sev_off]
+    active_rules = get_active_rules(
+        schema_name, schema_data, gate_home, project_config
+    )
+
+    logging_config = project_config.get("logging", {})
+    log_dir = logging_config.get("directory", "")
+    log_enabled = bool(logging_config.get("enabled", False) and log_dir)
+    fail_fast = fail_fast and not log_enabled
 
     # 5. Parse source and run checks against each rule
     # Wrap parse errors so callers get a GatehouseParseError instead of
     # an opaque LibCST exception they cannot handle.
     try:
-        from gatehouse.lib.analyzer import SourceAnalyzer
-
         analyzer = SourceAnalyzer(source, filepath)
     except Exception as exc:
         raise GatehouseParseError(filepath, exc) from exc
 
-    all_rule_violations: list[tuple[dict[str, Any], list[dict[str, Any]]]] = []
-    passed_rules: list[str] = []
-    violations_log: list[dict[str, Any]] = []
-    variables = analyzer.build_variables()
-
-    for rule_obj in active_rules:
-        try:
-            violations = run_check(rule_obj, analyzer, gate_home)
-        except Exception as exc:
-            msg = config.get_str("messages.rule_exception")
-            sys.stderr.write(
-                "  " + msg.format(
-                    rule_id=rule_obj["id"],
-                    error=type(exc).__name__,
-                    detail=str(exc),
-                ) + "\n"
+    # Rule outcomes depend only on the content, the path (visible to
+    # plugins) and the active rules, so unchanged content re-scanned
+    # against the same rules reuses them.  Rule sets with custom checks
+    # are not memoized: an edited plugin file is reloaded on its next
+    # call, which a replayed outcome would skip.
+    custom_type = config.get_str("check_types.custom")
+    memoize = not any(
+        r["rule_data"].get("check", {}).get("type") == custom_type
+        for r in active_rules
+    )
+    memo = analyzer.result_memo
+    memo_key = (filepath, fail_fast)
+    cached = memo.get(memo_key) if memoize else None
+    if cached is not None and cached[0] is active_rules:
+        _, all_rule_violations, passed_rules, diagnostics = cached
+    else:
+        all_rule_violations, passed_rules, diagnostics = _evaluate_rules(
+            active_rules, gate_home, analyzer,
+            fail_fast=fail_fast, parallel=parallel, sev_block=sev_block,
+        )
+        if memoize:
+            if len(memo) >= config.get_int("defaults.result_memo_size"):
+                memo.clear()
+            memo[memo_key] = (
+                active_rules, all_rule_violations, passed_rules, diagnostics
             )
-            err_msg = config.get_str("messages.internal_rule_error")
-            violations = [
-                {
-                    "line": error_line,
-                    "source": err_msg.format(rule_id=rule_obj["id"]),
-                }
-            ]
+    if diagnostics:
+        sys.stderr.write("".join(diagnostics))
 
-        if violations:
-            all_rule_violations.append((rule_obj, violations))
-            for v in violations:
-                # Merge analyzer variables with per-violation overrides so
-                # that template strings in error messages can reference both.
-                merged = dict(variables)
-                merged.update(v)
-                violations_log.append({
-                    "rule": rule_obj["id"],
-                    "severity": rule_obj["severity"],
-                    "line": v.get("line", fallback_line),
-                })
-        else:
-            passed_rules.append(rule_obj["id"])
+    # Template variables only feed violation messages, so clean files
+    # skip building them.
+    if all_rule_violations:
+        variables = analyzer.build_variables()
+    else:
+        variables = {"filepath": filepath}
 
-    # 6. Compute timing and violation counts
-    scan_ms = int((time.time() - start) * 1000)
+    schema_version = schema_data.get("schema", {}).get("version", default_version)
 
-    blocking_count = sum(
-        len(vs) for ro, vs in all_rule_violations if ro["severity"] == sev_block
-    )
-    warning_count = sum(
-        len(vs) for ro, vs in all_rule_violations if ro["severity"] == sev_warn
-    )
+    # 6. Single pass over the violations: count severities and build the
+    # structured result, the log entries and the stderr output together.
+    # In JSON mode the templates are interpolated once, by
+    # format_violations_json, and the structured result reuses its output.
+    emit_stderr = output_format != fmt_json
+    blocking_count = 0
+    warning_count = 0
+    structured_violations: list[Violation] = []
+    violations_log: list[dict[str, Any]] = []
+    output_parts: list[str] = []
+
+    for rule_obj, violations in all_rule_violations:
+        rule_id = rule_obj["id"]
+        severity = rule_obj["severity"]
+        if severity == sev_block:
+            blocking_count += len(violations)
+        elif severity == sev_warn:
+            warning_count += len(violations)
+
+        error_config = rule_obj["rule_data"].get("error", {})
+        message_tpl = compile_template(error_config.get("message", ""))
+        fix_tpl = compile_template(error_config.get("fix", ""))
+        # Stderr falls back to a generic message when the rule has none;
+        # otherwise the rendered message is shared with the Violation.
+        stderr_message = (
+            None if "message" in error_config
+            else default_violation.format(rule_id=rule_id)
+        )
+        for v in violations:
+            line = v.get("line", fallback_line)
+            violations_log.append({
+                "rule": rule_id,
+                "severity": severity,
+                "line": line,
+            })
+            if not emit_stderr:
+                continue
+            # Violation-specific fields (e.g. line, source) shadow the
+            # analyzer's template variables (e.g. filename, line_count)
+            # without merging the two mappings per violation.
+            message = render_template(message_tpl, variables, overrides=v)
+            fix = render_template(fix_tpl, variables, overrides=v)
+            structured_violations.append(Violation(
+                rule_id=rule_id,
+                severity=severity,
+                line=line,
+                source=v.get("source", ""),
+                message=message,
+                fix=fix,
+            ))
+            output_parts.append(format_violation_stderr(
+                rule_obj, v, variables,
+                message=stderr_message if stderr_message is not None else message,
+                fix=fix,
+            ))
+
+    json_data: Optional[dict[str, Any]] = None
+    if not emit_stderr:
+        json_data = format_violations_json(
+            all_rule_violations, variables, schema_name, schema_version
+        )
+        structured_violations = [
+            Violation(
+                rule_id=jv["rule"],
+                severity=jv["severity"],
+                line=jv["line"],
+                source=jv["source"],
+                message=jv["message"],
+                fix=jv["fix"],
+            )
+            for jv in json_data["violations"]
+        ]
+
+    # 7. Compute timing and status
+    scan_ms = (time.perf_counter_ns() - start) // 1_000_000
 
     status = status_rejected if blocking_count > 0 else status_passed
-    schema_version = schema_data.get("schema", {}).get("version", default_version)
 
-    # 7. Log scan results (if enabled)
-    log_dir = project_config.get("logging", {}).get("directory", "")
-    if project_config.get("logging", {}).get("enabled", False) and log_dir:
+    # 8. Log scan results (if enabled)
+    if log_enabled:
         log_scan(
             log_dir,
             filepath,
@@ -210,30 +423,12 @@ def scan_file(
             violations_log,
             passed_rules,
             len(active_rules),
-            source,
+            analyzer.source_bytes,
             scan_ms,
+            line_count=analyzer.line_count(),
         )
 
-    # 8. Format output and return result
-    structured_violations: list[Violation] = []
-    for rule_obj, violations in all_rule_violations:
-        rule_data = rule_obj["rule_data"]
-        error_config = rule_data.get("error", {})
-        for v in violations:
-            # Build a merged dict so template variables from the analyzer
-            # (e.g. filename, line_count) coexist with violation-specific
-            # fields (e.g. line, source) for message interpolation.
-            merged = dict(variables)
-            merged.update(v)
-            structured_violations.append(Violation(
-                rule_id=rule_obj["id"],
-                severity=rule_obj["severity"],
-                line=v.get("line", fallback_line),
-                source=v.get("source", ""),
-                message=inject_variables(error_config.get("message", ""), merged),
-                fix=inject_variables(error_config.get("fix", ""), merged),
-            ))
-
+    # 9. Format output and return result
     result = ScanResult(
         status=status,
         violations=structured_violations,
@@ -244,18 +439,9 @@ def scan_file(
         schema_version=schema_version,
     )
 
-    if output_format == fmt_json:
-        json_data = format_violations_json(
-            all_rule_violations, variables, schema_name, schema_version
-        )
-        sys.stderr.write(json.dumps(json_data, indent=json_indent))
-    elif all_rule_violations:
-        output_parts: list[str] = []
-        for rule_obj, violations in all_rule_violations:
-            for v in violations:
-                merged = dict(variables)
-                merged.update(v)
-                output_parts.append(format_violation_stderr(rule_obj, v, merged))
+    if json_data is not None:
+        sys.stderr.write(json_encoder.dumps(json_data, indent=json_indent) + "\n")
+    elif output_parts:
         output_parts.append(
             format_summary_stderr(
                 schema_name, schema_version, blocking_count, warning_count
@@ -266,6 +452,186 @@ def scan_file(
     return result
 
 
+def _init_scan_worker(schema_path: str) -> None:
+    """Warm a batch worker's caches before it receives any files.
+
+    Args:
+        schema_path: Path to the .gate_schema.yaml project config.
+    """
+    config.load_defaults()
+    find_gate_home()
+    load_project_config(schema_path)
+
+
+def _write_file_error(
+    stream: TextIO, filepath: str, message: str, output_format: str
+) -> None:
+    """Report a file that could not be read or parsed.
+
+    Args:
+        stream: Where the report is written.
+        filepath: Path to the file that failed.
+        message: Human-readable error message.
+        output_format: 'json' writes a structured error object; anything
+            else writes the message as an indented line.
+    """
+    if output_format == config.get_str("formats.json"):
+        error_data = {
+            "status": config.get_str("statuses.error"),
+            "file": filepath,
+            "error": message,
+        }
+        indent = config.get_int("defaults.json_indent")
+        stream.write(json_encoder.dumps(error_data, indent=indent) + "\n")
+    else:
+        stream.write(f"  {message}\n")
+
+
+def _scan_path(
+    filepath: str,
+    schema_path: str,
+    output_format: str,
+    skip_scope: bool,
+) -> tuple[Optional[ScanResult], str]:
+    """Read and scan one file, capturing what the scan writes to stderr.
+
+    Args:
+        filepath: Path to the Python file to check.
+        schema_path: Path to the .gate_schema.yaml project config.
+        output_format: 'stderr' for human output, 'json' for structured.
+        skip_scope: If True, skip gated_paths scope checking.
+
+    Returns:
+        Tuple of the ScanResult (None if the file could not be read or
+        parsed) and the captured stderr text.
+    """
+    buffer = io.StringIO()
+    try:
+        with open(filepath, "rb") as fh:
+            source = fh.read()
+    except OSError as exc:
+        message = config.get_str("messages.read_error").format(
+            filepath=filepath, error=exc.strerror or exc
+        )
+        _write_file_error(buffer, filepath, message, output_format)
+        return None, buffer.getvalue()
+    with contextlib.redirect_stderr(buffer):
+        try:
+            result: Optional[ScanResult] = scan_file(
+                source,
+                filepath,
+                schema_path,
+                output_format=output_format,
+                skip_scope=skip_scope,
+            )
+        except GatehouseParseError as exc:
+            _write_file_error(buffer, filepath, str(exc), output_format)
+            result = None
+    return result, buffer.getvalue()
+
+
+def scan_files(
+    filepaths: list[str],
+    schema_path: str,
+    *,
+    output_format: str = "",
+    skip_scope: bool = False,
+    workers: int = 1,
+) -> list[Optional[ScanResult]]:
+    """Scan several files on disk, optionally across worker processes.
+
+    Each file's stderr output is written as one block, in the order of
+    ``filepaths``, whichever worker finishes first.  In JSON format the
+    per-file reports are written as the elements of one JSON array.
+
+    Args:
+        filepaths: Paths to the Python files to check.
+        schema_path: Path to the .gate_schema.yaml project config.
+        output_format: 'stderr' for human output, 'json' for structured.
+            Defaults to the value from config.
+        skip_scope: If True, skip gated_paths scope checking.
+        workers: Number of worker processes.  With 1 (or a single file)
+            the files are scanned in this process.
+
+    Returns:
+        One ScanResult per file, or None for a file that could not be
+        read or parsed (its error is written to stderr).
+    """
+    if not output_format:
+        output_format = config.get_str("formats.default")
+    as_json = output_format == config.get_str("formats.json")
+    scan_one = functools.partial(
+        _scan_path,
+        schema_path=schema_path,
+        output_format=output_format,
+        skip_scope=skip_scope,
+    )
+    if workers > 1 and len(filepaths) > 1:
+        workers = min(workers, len(filepaths))
+        # A few chunks per worker amortize inter-process overhead while
+        # still balancing uneven file sizes.
+        chunksize = max(
+            1,
+            len(filepaths)
+            // (workers * config.get_int("defaults.scan_chunks_per_worker")),
+        )
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_scan_worker,
+            initargs=(schema_path,),
+        ) as pool:
+            return _emit_scans(
+                pool.map(scan_one, filepaths, chunksize=chunksize), as_json
+            )
+    return _emit_scans(map(scan_one, filepaths), as_json)
+
+
+def _emit_scans(
+    scans: Iterable[tuple[Optional[ScanResult], str]], as_json: bool
+) -> list[Optional[ScanResult]]:
+    """Write each scan's captured output to stderr and collect the results.
+
+    Args:
+        scans: (result, captured stderr) pairs in input order.
+        as_json: Whether the captured outputs are JSON reports, joined
+            into one array so the batch output parses as JSON.
+
+    Returns:
+        The results, in input order.
+    """
+    results: list[Optional[ScanResult]] = []
+    separator = "["
+    for result, output in scans:
+        results.append(result)
+        if not as_json:
+            sys.stderr.write(output)
+        elif output:
+            sys.stderr.write(f"{separator}\n{output.rstrip()}")
+            separator = ","
+    if as_json:
+        sys.stderr.write("[]\n" if separator == "[" else "\n]\n")
+    return results
+
+
+def expand_paths(patterns: list[str]) -> list[str]:
+    """Expand glob patterns, keeping plain paths as given.
+
+    Args:
+        patterns: File paths or glob patterns (``**`` is recursive).
+
+    Returns:
+        Matching paths in pattern order; a pattern without matches is
+        kept so that opening it reports the missing file.
+    """
+    paths: list[str] = []
+    for pattern in patterns:
+        matches: list[str] = []
+        if any(c in pattern for c in "*?["):
+            matches = sorted(glob.glob(pattern, recursive=True))
+        paths.extend(matches or [pattern])
+    return paths
+
+
 def main() -> None:
     """CLI entry point for python -m gatehouse.engine."""
     import argparse
@@ -279,8 +645,21 @@ def main() -> None:
 
     parser = argparse.ArgumentParser(
         description="Gate Engine — Schema enforcement for Python files",
+        fromfile_prefix_chars="@",
     )
     parser.add_argument("--file", help="Path to the Python file to check")
+    parser.add_argument(
+        "--files",
+        nargs="+",
+        help="Paths or glob patterns of Python files to check "
+        "(@list.txt reads arguments from a file, one per line)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=config.get_int("defaults.scan_workers"),
+        help="Worker processes for --files (0 = one per CPU)",
+    )
     parser.add_argument(
         "--stdin", action="store_true", help="Read code from stdin"
     )
@@ -307,15 +686,31 @@ def main() -> None:
 
     args = parser.parse_args()
 
+    # Read raw bytes and let the parser detect the source encoding.
     if args.stdin:
-        source = sys.stdin.read()
+        source = sys.stdin.buffer.read()
         filepath = args.filename or stdin_filename
     elif args.file:
         filepath = args.file
-        with open(filepath, "r", encoding="utf-8") as fh:
+        with open(filepath, "rb") as fh:
             source = fh.read()
+    elif args.files:
+        results = scan_files(
+            expand_paths(args.files),
+            args.schema,
+            output_format=args.format,
+            skip_scope=args.no_scope,
+            workers=args.jobs if args.jobs > 0 else (os.cpu_count() or 1),
+        )
+        exit_code = exit_ok
+        for r in results:
+            if r is None:
+                exit_code = max(exit_code, exit_error)
+            elif r.blocking_count > 0:
+                exit_code = max(exit_code, exit_blocked)
+        sys.exit(exit_code)
     else:
-        parser.error("Either --file or --stdin is required")
+        parser.error("One of --file, --files or --stdin is required")
         return
 
     try:
@@ -18,6 +18,7 @@ from __future__ import annotations
 from typing import Any
 
 from gatehouse.lib import config
+from gatehouse.lib.formatter import first_line
 
 
 class GatehouseViolationError(ImportError):
@@ -63,11 +64,9 @@ class GatehouseViolationError(ImportError):
             line = v.get("line", fallback_line)
             message = v.get("message", "violation")
             parts.append(f"  {line_tpl.format(line=line, message=message)}")
-            fix = v.get("fix", "")
+            fix = first_line(v.get("fix", ""))
             if fix:
-                parts.append(
-                    f"    {fix_prefix}{fix.strip().splitlines()[0]}"
-                )
+                parts.append(f"    {fix_prefix}{fix}")
         return "\n".join(parts)
 
 
@@ -1,52 +1,236 @@
-"""SourceAnalyzer — single-parse, single-metadata-resolve analysis of Python source.
+"""SourceAnalyzer — single-parse, single-walk analysis of Python source.
 
 Every Gatehouse rule queries this object.  No rule touches raw source text.
-The CST and metadata providers give deterministic, grammar-defined checks.
-Each file is parsed exactly once into a concrete syntax tree, and a shared
-MetadataWrapper resolves all provider data in a single pass.
+The CST gives deterministic, grammar-defined checks.  Each file is parsed
+exactly once into a concrete syntax tree, and one visitor walks it once to
+collect everything the built-in queries need.
 
 Design notes:
     The single-parse strategy means each Python file is parsed into a CST
-    exactly once.  A shared MetadataWrapper resolves ParentNodeProvider and
-    PositionProvider for all visitors, avoiding redundant tree traversals.
-    Every check function receives the pre-built SourceAnalyzer rather than
-    raw source, ensuring consistent, grammar-level analysis across all rules.
+    exactly once.  One merged visitor walks the tree once to collect every
+    parameter-independent fact (literals, functions, loops, calls, names);
+    the query methods then filter those facts by rule parameters.  The walk
+    tracks parents itself, so no MetadataWrapper pre-pass is needed; line
+    numbers come from PositionProvider, resolved only when a query has a
+    violation to report.  Every check function receives the pre-built
+    SourceAnalyzer rather than raw source, ensuring consistent,
+    grammar-level analysis across all rules.
 """
 
+import ast
+import functools
+import hashlib
 import os
-from typing import Optional
+import re
+import threading
+from typing import Any, Callable, ClassVar, Iterable, Mapping, NamedTuple, Optional, Sequence, Union
 
 import libcst as cst
-from libcst.metadata import MetadataWrapper, ParentNodeProvider, PositionProvider
+from libcst.metadata import CodeRange, MetadataWrapper, PositionProvider
+
+from gatehouse.lib import config
 
 
 # ---------------------------------------------------------------------------
-# CST visitor for collecting literals inside function bodies
+# Single-pass CST visitor
 # ---------------------------------------------------------------------------
 
 
-class _LiteralCollector(cst.CSTVisitor):
-    """Walk the CST and collect literal nodes inside function/method bodies.
+# Identifiers that mark a for-loop iterable as progress-tracked, e.g.
+# ``track(items)``, ``tqdm(items)`` or ``progress.track(items)``.
+_PROGRESS_WRAPPERS = ("track", "tqdm")
+
+# ASCII characters other than ``\n`` that ``str.splitlines`` treats as line
+# boundaries.
+_OTHER_LINE_BREAKS = "\r\v\f\x1c\x1d\x1e"
+
+# Non-ASCII characters ``str.splitlines`` also treats as line boundaries.
+_UNICODE_LINE_BREAKS = "\x85\u2028\u2029"
+
+
+# Every fact the CST walk records needs one of these keywords in the
+# source: literals are only recorded inside functions, and the rest are
+# functions, classes, for-loops and print() calls.
+_WALK_TRIGGERS = ("def", "class", "for", "print")
+
+# Structural contexts in which a rule may allow literals, as bit flags so a
+# literal's context is tested against all allowed contexts at once.
+_CTX_DICT = 1  # element of a dict display
+_CTX_CALL = 2  # string passed as a call argument
+_SAFE_CONTEXT_FLAGS = {
+    "dict_key": _CTX_DICT,
+    "dict_value": _CTX_DICT,
+    "call_argument": _CTX_CALL,
+}
+
+
+class _MergedCollector(cst.CSTVisitor):
+    """Gather every per-file fact the analyzer's queries need in one CST walk.
+
+    Rule parameters (safe values, safe contexts, decorator patterns) are
+    applied afterwards by the ``SourceAnalyzer`` query methods, so a single
+    walk serves every rule that inspects the file.
+
+    The walk runs directly on the module rather than through a
+    MetadataWrapper: parents come from a stack maintained in ``on_visit`` /
+    ``on_leave``, and nodes are recorded instead of line numbers so that
+    positions are only computed for files that actually have violations.
 
     Attributes:
-        safe_values: Set of values exempt from hardcoded-literal checks.
-        safe_contexts: List of context names where literals are allowed.
-        violations: Accumulated violation dicts found during traversal.
+        lit_values: Values of the literal candidates inside function
+            bodies, before rule filtering.
+        lit_types: Value type of each literal ("numeric", "string" or
+            "boolean"), parallel to ``lit_values``.
+        lit_nodes: CST node of each literal, parallel to ``lit_values``.
+        lit_contexts: ``_CTX_*`` flags of each literal, parallel to
+            ``lit_values``.
+        undocumented: FunctionDefs without a docstring, in order.
+        decorated: Each decorated FunctionDef with the dotted names of its
+            decorators and whether it has a docstring, in order.
+        for_loops: For nodes whose iterable is not wrapped in a progress
+            tracker.
+        print_found: Whether any ``print()`` call exists.
+        func_names: Names of all functions, in order.
+        class_names: Names of all classes, in order.
+        _stack: The node being visited and its ancestors, innermost last.
         _func_depth: Nesting depth counter to track whether traversal is
             inside a function body.
+        _fstring_depth: Nesting depth of f-strings and concatenated
+            strings, whose literals are display text and never recorded.
+        _module_calls: Whether simple statements outside functions must be
+            walked to look for ``print()`` calls.
     """
 
-    METADATA_DEPENDENCIES = (ParentNodeProvider, PositionProvider)
-
-    def __init__(self, safe_values: set, safe_contexts: list) -> None:
-        self.safe_values = safe_values
-        self.safe_contexts = safe_contexts
-        self.violations: list[dict] = []
+    def __init__(self, module_calls: bool = True) -> None:
+        # Parallel lists rather than one record object per literal: files
+        # hold many literals and most are filtered out as safe.
+        self.lit_values: list[object] = []
+        self.lit_types: list[str] = []
+        self.lit_nodes: list[cst.CSTNode] = []
+        self.lit_contexts: list[int] = []
+        self.undocumented: list[cst.FunctionDef] = []
+        self.decorated: list[tuple[cst.FunctionDef, tuple[str, ...], bool]] = []
+        self.for_loops: list[cst.For] = []
+        self.print_found = False
+        self.func_names: list[str] = []
+        self.class_names: list[str] = []
+        self._stack: list[cst.CSTNode] = []
         self._func_depth = 0
+        self._fstring_depth = 0
+        self._module_calls = module_calls
+        self._iter_tracked: list[bool] = []
+
+    # Dispatch.  CSTVisitor looks up ``visit_<Node>`` / ``leave_<Node>`` and
+    # ``visit_<Node>_<attr>`` with a formatted getattr on every node and
+    # every child attribute, and calls libcst's no-op stubs for the ones
+    # not overridden; these tables resolve each node class once and keep
+    # only the handlers defined here.  Values are plain functions (or None),
+    # shared by all instances.
+    _VISIT: ClassVar[dict[type, Optional[Callable[..., Any]]]] = {}
+    _LEAVE: ClassVar[dict[type, Optional[Callable[..., Any]]]] = {}
+    _ATTR_VISIT: ClassVar[dict[type, dict[str, Callable[..., Any]]]] = {}
+    _ATTR_LEAVE: ClassVar[dict[type, dict[str, Callable[..., Any]]]] = {}
+
+    @classmethod
+    def _hook(cls, table: dict, node_type: type, prefix: str) -> Optional[Callable[..., Any]]:
+        """Resolve and memoize the handler for a node class, or None."""
+        try:
+            return table[node_type]
+        except KeyError:
+            func = cls._own(f"{prefix}{node_type.__name__}")
+            table[node_type] = func
+            return func
+
+    @classmethod
+    def _attr_hooks(cls, table: dict, node_type: type, prefix: str) -> dict[str, Callable[..., Any]]:
+        """Resolve and memoize the per-attribute handlers for a node class."""
+        try:
+            return table[node_type]
+        except KeyError:
+            start = f"{prefix}{node_type.__name__}_"
+            hooks = {
+                name[len(start):]: func
+                for name in dir(cls)
+                if name.startswith(start) and (func := cls._own(name)) is not None
+            }
+            table[node_type] = hooks
+            return hooks
+
+    @classmethod
+    def _own(cls, name: str) -> Optional[Callable[..., Any]]:
+        """Return the handler called name unless it is libcst's no-op stub."""
+        func = getattr(cls, name, None)
+        if func is None or func is getattr(cst.CSTVisitor, name, None):
+            return None
+        return func
+
+    def on_visit(self, node: cst.CSTNode) -> bool:
+        """Push node onto the parent stack, then dispatch to ``visit_<Node>``."""
+        self._stack.append(node)
+        func = self._hook(self._VISIT, type(node), "visit_")
+        if func is None:
+            return True
+        return func(self, node) is not False
+
+    def on_leave(self, original_node: cst.CSTNode) -> None:
+        """Dispatch to ``leave_<Node>``, then pop the parent stack."""
+        func = self._hook(self._LEAVE, type(original_node), "leave_")
+        if func is not None:
+            func(self, original_node)
+        self._stack.pop()
+
+    def on_visit_attribute(self, node: cst.CSTNode, attribute: str) -> None:
+        """Dispatch to ``visit_<Node>_<attribute>`` if defined."""
+        hooks = self._attr_hooks(self._ATTR_VISIT, type(node), "visit_")
+        if hooks:
+            func = hooks.get(attribute)
+            if func is not None:
+                func(self, node)
+
+    def on_leave_attribute(self, original_node: cst.CSTNode, attribute: str) -> None:
+        """Dispatch to ``leave_<Node>_<attribute>`` if defined."""
+        hooks = self._attr_hooks(self._ATTR_LEAVE, type(original_node), "leave_")
+        if hooks:
+            func = hooks.get(attribute)
+            if func is not None:
+                func(self, original_node)
+
+    def _parent(self, depth: int = 1) -> Optional[cst.CSTNode]:
+        """Return the ancestor depth levels above the current node."""
+        index = -1 - depth
+        return self._stack[index] if len(self._stack) > depth else None
+
+    # Pruning: subtrees that cannot contain anything recorded below
+
+    def visit_SimpleStatementLine(self, node: cst.SimpleStatementLine) -> bool:
+        """Skip module- and class-level simple statements unless calls matter.
+
+        Outside functions no literals are recorded, and a simple statement
+        cannot contain a function, class or for-loop; only a print() call
+        could be found there.
+        """
+        return self._func_depth > 0 or self._module_calls
+
+    def visit_Import(self, node: cst.Import) -> bool:
+        """Skip import statements; they hold no literals or calls."""
+        return False
+
+    def visit_ImportFrom(self, node: cst.ImportFrom) -> bool:
+        """Skip from-import statements; they hold no literals or calls."""
+        return False
+
+    # Functions, classes and calls
 
-    # Track function nesting depth
     def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:
-        """Enter a function body."""
+        """Record the function and enter its body."""
+        documented = _has_docstring(node)
+        if not documented:
+            self.undocumented.append(node)
+        if node.decorators:
+            self.decorated.append((node, tuple(
+                _get_cst_decorator_name(dec.decorator) for dec in node.decorators
+            ), documented))
+        self.func_names.append(node.name.value)
         self._func_depth += 1
         return True
 
@@ -54,261 +238,217 @@ class _LiteralCollector(cst.CSTVisitor):
         """Leave a function body."""
         self._func_depth -= 1
 
-    def _is_safe_value(self, value: object) -> bool:
-        """Type-aware safe value check. Prevents True==1 / False==0 collision."""
-        for sv in self.safe_values:
-            # Use type() identity instead of isinstance() because bool is a
-            # subclass of int in Python; isinstance(True, int) is True, so
-            # True == 1 and False == 0 would incorrectly pass an int check.
-            if type(sv) is type(value) and sv == value:
-                return True
-        return False
+    def visit_ClassDef(self, node: cst.ClassDef) -> None:
+        """Record class name."""
+        self.class_names.append(node.name.value)
 
-    def _is_docstring(self, node: cst.CSTNode) -> bool:
-        """Check if a string node is a docstring (first Expr statement in a body)."""
-        # Traverse a 4-level parent chain: String → Expr → SimpleStatementLine
-        # → IndentedBlock.  A docstring is a bare string expression that is the
-        # first statement inside an indented block (function, class, or module).
-        parent = self.get_metadata(ParentNodeProvider, node, None)
-        if not isinstance(parent, cst.Expr):
-            return False
-        grandparent = self.get_metadata(ParentNodeProvider, parent, None)
-        if not isinstance(grandparent, cst.SimpleStatementLine):
-            return False
-        greatgrand = self.get_metadata(ParentNodeProvider, grandparent, None)
-        if isinstance(greatgrand, cst.IndentedBlock) and greatgrand.body and greatgrand.body[0] is grandparent:
-            return True
-        return False
-
-    def _check_literal(self, node: cst.CSTNode, value: object, value_type: str) -> None:
-        """Check a single literal node against rules."""
-        if self._func_depth == 0:
-            return
+    def visit_Call(self, node: cst.Call) -> None:
+        """Note print() calls."""
+        if type(node.func) is cst.Name and node.func.value == "print":
+            self.print_found = True
 
-        if self._is_safe_value(value):
-            return
+    def visit_For_iter(self, node: cst.For) -> None:
+        """Start looking for a progress wrapper in the loop's iterable."""
+        self._iter_tracked.append(False)
 
-        parent = self.get_metadata(ParentNodeProvider, node, None)
+    def leave_For_iter(self, node: cst.For) -> None:
+        """Record the loop if no name in its iterable mentions track/tqdm."""
+        if not self._iter_tracked.pop():
+            self.for_loops.append(node)
 
-        if ("dict_key" in self.safe_contexts or "dict_value" in self.safe_contexts) and isinstance(parent, cst.DictElement):
-            return
+    # Literals
 
-        if "call_argument" in self.safe_contexts and value_type == "string":
-            if isinstance(parent, cst.Arg):
-                return
+    def _recording(self) -> bool:
+        """Return whether literals at the current position are recorded."""
+        return self._func_depth > 0 and not self._fstring_depth
 
-        pos = self.get_metadata(PositionProvider, node, None)
-        line = pos.start.line if pos else 0
+    def _is_docstring(self, parent: cst.CSTNode) -> bool:
+        """Check if a string whose parent is given is a docstring.
 
-        self.violations.append({
-            "line": line,
-            "value": str(value),
-            "value_type": value_type,
-        })
+        A docstring is a bare string expression that is the first statement
+        inside an indented block (function or class), i.e. the chain
+        String → Expr → SimpleStatementLine → IndentedBlock.
+        """
+        if type(parent) is not cst.Expr:
+            return False
+        grandparent = self._parent(2)
+        if type(grandparent) is not cst.SimpleStatementLine:
+            return False
+        greatgrand = self._parent(3)
+        if type(greatgrand) is cst.IndentedBlock and greatgrand.body and greatgrand.body[0] is grandparent:
+            return True
+        return False
 
-    def _parent_is_negation(self, node: cst.CSTNode) -> bool:
-        """Check if the node's parent is a UnaryOperation with Minus operator."""
-        parent = self.get_metadata(ParentNodeProvider, node, None)
-        return isinstance(parent, cst.UnaryOperation) and isinstance(parent.operator, cst.Minus)
+    def _record_literal(
+        self,
+        node: cst.CSTNode,
+        value: object,
+        value_type: str,
+        parent: Optional[cst.CSTNode],
+    ) -> None:
+        """Record a literal inside a function body with its parent context."""
+        if type(parent) is cst.DictElement:
+            context = _CTX_DICT
+        elif type(parent) is cst.Arg and value_type == "string":
+            context = _CTX_CALL
+        else:
+            context = 0
+        self.lit_values.append(value)
+        self.lit_types.append(value_type)
+        self.lit_nodes.append(node)
+        self.lit_contexts.append(context)
 
     def visit_Integer(self, node: cst.Integer) -> None:
-        """Check integer literals. Skip if parent is negation (handled by visit_UnaryOperation)."""
-        if self._parent_is_negation(node):
+        """Record integer literals. Skip if parent is negation (handled by visit_UnaryOperation)."""
+        if not self._recording():
+            return
+        parent = self._parent()
+        if type(parent) is cst.UnaryOperation and type(parent.operator) is cst.Minus:
             return
         try:
             value = int(node.value)
         except (ValueError, TypeError):
             value = node.value
-        self._check_literal(node, value, "numeric")
+        self._record_literal(node, value, "numeric", parent)
 
     def visit_Float(self, node: cst.Float) -> None:
-        """Check float literals. Skip if parent is negation (handled by visit_UnaryOperation)."""
-        if self._parent_is_negation(node):
+        """Record float literals. Skip if parent is negation (handled by visit_UnaryOperation)."""
+        if not self._recording():
+            return
+        parent = self._parent()
+        if type(parent) is cst.UnaryOperation and type(parent.operator) is cst.Minus:
             return
         try:
             value = float(node.value)
         except (ValueError, TypeError):
             value = node.value
-        self._check_literal(node, value, "numeric")
+        self._record_literal(node, value, "numeric", parent)
 
     def visit_SimpleString(self, node: cst.SimpleString) -> None:
-        """Check simple string literals (not f-strings)."""
+        """Record simple string literals (not f-strings).
+
+        The cheap scope and parent checks run first: evaluating the string
+        costs an ``ast.literal_eval``, and most strings are either outside
+        function bodies, or are ordinary arguments and operands whose parent
+        is not an ``Expr`` and so can never be docstrings.
+        """
+        if not self._recording():
+            return
+        parent = self._parent()
+        if self._is_docstring(parent):
+            return
         raw = node.evaluated_value
         if raw is None:
             return
-        if self._is_docstring(node):
-            return
-        self._check_literal(node, raw, "string")
+        self._record_literal(node, raw, "string", parent)
 
     def visit_ConcatenatedString(self, node: cst.ConcatenatedString) -> None:
-        """Skip concatenated strings — they may contain f-string parts."""
-        return False
+        """Ignore literals in concatenated strings — they may contain f-string parts."""
+        self._fstring_depth += 1
+
+    def leave_ConcatenatedString(self, node: cst.ConcatenatedString) -> None:
+        """Leave a concatenated string."""
+        self._fstring_depth -= 1
 
     def visit_FormattedString(self, node: cst.FormattedString) -> None:
-        """Skip f-strings entirely — they are display text, not config values."""
-        return False
+        """Ignore literals in f-strings — they are display text, not config values."""
+        self._fstring_depth += 1
+
+    def leave_FormattedString(self, node: cst.FormattedString) -> None:
+        """Leave an f-string."""
+        self._fstring_depth -= 1
 
     def visit_Name(self, node: cst.Name) -> None:
-        """Check True/False as hardcoded boolean values. None is exempt."""
-        if node.value == "None":
+        """Note progress wrappers in loop iterables; record True/False literals.
+
+        None is exempt from the literal check.
+        """
+        if self._iter_tracked and not self._iter_tracked[-1]:
+            if any(w in node.value for w in _PROGRESS_WRAPPERS):
+                self._iter_tracked[-1] = True
+        if node.value not in ("True", "False") or not self._recording():
             return
-        if node.value not in ("True", "False"):
-            return
-        python_val = node.value == "True"
-        self._check_literal(node, python_val, "boolean")
+        self._record_literal(node, node.value == "True", "boolean", self._parent())
 
     def visit_UnaryOperation(self, node: cst.UnaryOperation) -> None:
         """Handle negative numbers: -1 is UnaryOperation(Minus, Integer)."""
         # In the CST, negative literals like -1 are not Integer(-1) but
         # UnaryOperation(operator=Minus, expression=Integer("1")).  This
         # visitor reconstructs the negative value for safe-value matching.
-        if not isinstance(node.operator, cst.Minus):
-            return
-        if self._func_depth == 0:
+        if type(node.operator) is not cst.Minus or not self._recording():
             return
 
         expr = node.expression
-        if isinstance(expr, cst.Integer):
-            try:
-                neg_val = -int(expr.value)
-            except (ValueError, TypeError):
-                return
-            if self._is_safe_value(neg_val):
-                return
-        elif isinstance(expr, cst.Float):
-            try:
+        try:
+            if type(expr) is cst.Integer:
+                neg_val: object = -int(expr.value)
+            elif type(expr) is cst.Float:
                 neg_val = -float(expr.value)
-            except (ValueError, TypeError):
-                return
-            if self._is_safe_value(neg_val):
+            else:
                 return
-        else:
-            return
-
-        parent = self.get_metadata(ParentNodeProvider, node, None)
-        if ("dict_key" in self.safe_contexts or "dict_value" in self.safe_contexts) and isinstance(parent, cst.DictElement):
+        except (ValueError, TypeError):
             return
 
-        pos = self.get_metadata(PositionProvider, node, None)
-        line = pos.start.line if pos else 0
-        self.violations.append({
-            "line": line,
-            "value": str(neg_val),
-            "value_type": "numeric",
-        })
-
-
-# ---------------------------------------------------------------------------
-# CST visitor for docstring-less functions
-# ---------------------------------------------------------------------------
-
-class _FunctionDocstringCollector(cst.CSTVisitor):
-    """Collect functions that are missing docstrings.
-
-    Attributes:
-        violations: Accumulated violation dicts for functions without docstrings.
-    """
-
-    METADATA_DEPENDENCIES = (PositionProvider,)
-
-    def __init__(self) -> None:
-        self.violations: list[dict] = []
-
-    def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:
-        """Check if function has a docstring as first statement."""
-        if not _has_docstring(node):
-            params = _format_params(node.params)
-            pos = self.get_metadata(PositionProvider, node, None)
-            line = pos.start.line if pos else 0
-            self.violations.append({
-                "line": line,
-                "source": "",
-                "function_name": node.name.value,
-                "params": params,
-            })
-        return True
+        self._record_literal(node, neg_val, "numeric", self._parent())
 
 
 # ---------------------------------------------------------------------------
-# CST visitor for decorated function checks
+# Helper functions
 # ---------------------------------------------------------------------------
 
-class _DecoratedFunctionCollector(cst.CSTVisitor):
-    """Check decorated functions for docstrings or try/except.
-
-    Attributes:
-        decorator_patterns: Substrings to match against decorator names.
-        check_type: The kind of check to perform (``"docstring"`` or ``"try_except"``).
-        violations: Accumulated violation dicts for failing functions.
-    """
-
-    METADATA_DEPENDENCIES = (PositionProvider,)
-
-    def __init__(self, decorator_patterns: list, check_type: str) -> None:
-        self.decorator_patterns = decorator_patterns
-        self.check_type = check_type
-        self.violations: list[dict] = []
+# Fields through which a compound statement (or one of its clauses) holds
+# nested statements, in the order the CST walk visits them.
+_CLAUSE_FIELDS = ("body", "handlers", "orelse", "finalbody", "cases")
 
-    def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:
-        """Check decorated functions."""
-        for dec in node.decorators:
-            dec_name = _get_cst_decorator_name(dec.decorator)
-            if not any(p in dec_name for p in self.decorator_patterns):
-                continue
 
-            pos = self.get_metadata(PositionProvider, node, None)
-            line = pos.start.line if pos else 0
+def _collect_def_names(
+    node: cst.CSTNode, func_names: list[str], class_names: list[str]
+) -> None:
+    """Append the names of functions and classes nested in node, in walk order.
 
-            if self.check_type == "docstring" and not _has_docstring(node):
-                self.violations.append({"line": line, "function_name": node.name.value})
-            elif self.check_type == "try_except" and not _has_try_except(node):
-                self.violations.append({"line": line, "function_name": node.name.value})
-        return True
-
-
-# ---------------------------------------------------------------------------
-# CST visitor for for-loop progress checks
-# ---------------------------------------------------------------------------
-
-class _ForLoopProgressCollector(cst.CSTVisitor):
-    """Check for loops that don't use progress tracking.
-
-    Attributes:
-        violations: Accumulated violation dicts for loops missing progress wrappers.
+    Only statement blocks are followed: definitions cannot occur inside
+    expressions or simple statements, so those are never visited.
     """
+    for field in _CLAUSE_FIELDS:
+        part = getattr(node, field, None)
+        if part is None:
+            continue
+        if isinstance(part, (list, tuple)):
+            # except handlers or match cases
+            for clause in part:
+                _collect_def_names(clause, func_names, class_names)
+        elif type(part) is cst.IndentedBlock:
+            _collect_block_def_names(part.body, func_names, class_names)
+        elif isinstance(part, cst.CSTNode) and not isinstance(part, cst.BaseSuite):
+            _collect_def_names(part, func_names, class_names)
+
+
+def _collect_block_def_names(
+    statements: Sequence[cst.BaseStatement],
+    func_names: list[str],
+    class_names: list[str],
+) -> None:
+    """Collect definition names from a sequence of statements."""
+    for stmt in statements:
+        if not isinstance(stmt, cst.BaseCompoundStatement):
+            continue
+        if type(stmt) is cst.FunctionDef:
+            func_names.append(stmt.name.value)
+        elif type(stmt) is cst.ClassDef:
+            class_names.append(stmt.name.value)
+        _collect_def_names(stmt, func_names, class_names)
 
-    METADATA_DEPENDENCIES = (PositionProvider,)
-
-    def __init__(self) -> None:
-        self.violations: list[dict] = []
-
-    def visit_For(self, node: cst.For) -> bool:
-        """Check if the iterable is wrapped in track() or tqdm()."""
-        iter_code = self._module_for_codegen.code_for_node(node.iter)
-        if "track" not in iter_code and "tqdm" not in iter_code:
-            pos = self.get_metadata(PositionProvider, node, None)
-            line = pos.start.line if pos else 0
-            self.violations.append({
-                "line": line,
-                "source": "",
-            })
-        return True
-
-
-# ---------------------------------------------------------------------------
-# Helper functions
-# ---------------------------------------------------------------------------
 
 def _has_docstring(func_node: cst.FunctionDef) -> bool:
     """Check if a FunctionDef has a docstring as its first statement."""
     body = func_node.body
-    if isinstance(body, cst.IndentedBlock) and body.body:
+    if type(body) is cst.IndentedBlock and body.body:
         first_stmt = body.body[0]
-        if isinstance(first_stmt, cst.SimpleStatementLine) and first_stmt.body:
+        if type(first_stmt) is cst.SimpleStatementLine and first_stmt.body:
             expr = first_stmt.body[0]
-            if isinstance(expr, cst.Expr) and isinstance(expr.value, (cst.SimpleString, cst.ConcatenatedString, cst.FormattedString)):
+            if type(expr) is cst.Expr and isinstance(expr.value, (cst.SimpleString, cst.ConcatenatedString, cst.FormattedString)):
                 raw = expr.value
-                if isinstance(raw, cst.SimpleString):
+                if type(raw) is cst.SimpleString:
                     val = raw.evaluated_value
                     return isinstance(val, str)
                 return True
@@ -317,10 +457,7 @@ def _has_docstring(func_node: cst.FunctionDef) -> bool:
 
 def _format_params(params: cst.Parameters) -> str:
     """Format function parameters as a string."""
-    parts = []
-    for p in params.params:
-        parts.append(p.name.value)
-    return ", ".join(parts)
+    return ", ".join([p.name.value for p in params.params])
 
 
 def _get_cst_decorator_name(dec: cst.BaseExpression) -> str:
@@ -341,6 +478,65 @@ def _get_cst_decorator_name(dec: cst.BaseExpression) -> str:
     return ""
 
 
+_NO_SAFE_VALUES: frozenset = frozenset()
+
+
+def _safe_values_by_type(safe_values: Iterable[object]) -> dict[type, frozenset]:
+    """Bucket safe values by exact type for constant-time lookups.
+
+    Keyed by ``type()`` rather than checked with ``isinstance()`` because
+    bool is a subclass of int in Python; True == 1 and False == 0 would
+    otherwise make an int safe value exempt a boolean and vice versa.
+    The buckets are built once per distinct list of safe values.
+    """
+    return _bucket_safe_values(tuple((type(sv), sv) for sv in safe_values))
+
+
+@functools.lru_cache(maxsize=256)
+def _bucket_safe_values(typed: tuple[tuple[type, object], ...]) -> dict[type, frozenset]:
+    """Build the per-type buckets for ``_safe_values_by_type``.
+
+    Values that compare equal collapse to the first one given, as they
+    would when the list is turned into a set.
+
+    Args:
+        typed: (type, value) pairs; pairing each value with its type keeps
+            ``1`` and ``True`` distinct as cache keys.
+
+    Returns:
+        Mapping from type to the safe values of exactly that type.
+    """
+    seen: set = set()
+    buckets: dict[type, set] = {}
+    for value_type, sv in typed:
+        if sv in seen:
+            continue
+        seen.add(sv)
+        buckets.setdefault(value_type, set()).add(sv)
+    return {t: frozenset(vals) for t, vals in buckets.items()}
+
+
+def _is_safe_value(value: object, safe_by_type: dict[type, frozenset]) -> bool:
+    """Type-aware safe value check. Prevents True==1 / False==0 collision."""
+    return value in safe_by_type.get(type(value), _NO_SAFE_VALUES)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_decorator_patterns(patterns: tuple[str, ...]) -> Optional[re.Pattern[str]]:
+    """Compile decorator substrings into one alternation regex.
+
+    Args:
+        patterns: Substrings, any of which marks a decorator as matching.
+
+    Returns:
+        Pattern matching any of the substrings literally, or None when
+        there are no patterns (nothing matches).
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(map(re.escape, patterns)))
+
+
 def _has_try_except(func_node: cst.FunctionDef) -> bool:
     """Check if a function body contains a Try statement."""
     body = func_node.body
@@ -352,6 +548,104 @@ def _has_try_except(func_node: cst.FunctionDef) -> bool:
     return False
 
 
+# ---------------------------------------------------------------------------
+# Parse cache
+# ---------------------------------------------------------------------------
+
+class _ModuleInfo(NamedTuple):
+    """Facts about a module's top-level statements, gathered in one pass."""
+
+    header_comments: tuple[str, ...]
+    docstring: Optional[str]
+    has_import: bool
+    has_main_guard: bool
+    constants: tuple[str, ...]
+
+
+class _ParsedSource:
+    """Parse results shared by every analyzer built from the same source.
+
+    Attributes:
+        module: Parsed libcst Module node.
+        source: Decoded source text.
+        source_lines: Source text split into individual lines, built the
+            first time a caller needs them.
+        wrapper: MetadataWrapper over ``module``, built on first use.
+        facts: Results of the single CST walk, filled in on first query.
+        positions: Node start positions, resolved the first time a
+            violation needs a line number.
+        module_info: Top-level statement facts, filled in on first query.
+        ast_tree: Standard-library ``ast`` parse of ``source`` for plugins,
+            built on first use.
+        result_memo: Caller-owned memo of results derived from this
+            content, created on first use.
+    """
+
+    __slots__ = (
+        "module", "source", "source_lines", "wrapper", "facts", "positions",
+        "module_info", "ast_tree", "result_memo",
+    )
+
+    def __init__(self, source: Union[str, bytes]) -> None:
+        self.module = cst.parse_module(source)
+        if isinstance(source, bytes):
+            source = source.decode(self.module.encoding)
+        self.source = source
+        self.source_lines: Optional[list[str]] = None
+        self.wrapper: Optional[MetadataWrapper] = None
+        self.facts: Optional[_MergedCollector] = None
+        self.positions: Optional[Mapping[cst.CSTNode, CodeRange]] = None
+        self.module_info: Optional[_ModuleInfo] = None
+        self.ast_tree: Optional[ast.Module] = None
+        self.result_memo: Optional[dict[Any, Any]] = None
+
+
+# Content digest -> parse results, least recently used first.
+_PARSE_CACHE: dict[bytes, _ParsedSource] = {}
+
+
+def _parse(source: Union[str, bytes]) -> _ParsedSource:
+    """Return the parse results for source, reusing them for repeated content.
+
+    Editors and hooks re-scan unchanged files, and packages repeat trivial
+    files such as empty ``__init__.py``; identical content is parsed and
+    walked once.  Keyed by a digest of the content and whether it was given
+    as bytes, since bytes are decoded using their own encoding cookie.
+
+    Args:
+        source: Python source as text or raw bytes.
+
+    Returns:
+        The shared parse results.
+
+    Raises:
+        libcst.ParserSyntaxError: If the source cannot be parsed.
+    """
+    if isinstance(source, bytes):
+        key = b"b" + hashlib.blake2b(source, digest_size=16).digest()
+    else:
+        encoded = source.encode("utf-8", "surrogatepass")
+        key = b"s" + hashlib.blake2b(encoded, digest_size=16).digest()
+    limit = config.get_int("defaults.parse_cache_size")
+    parsed = _PARSE_CACHE.pop(key, None)
+    if parsed is None:
+        parsed = _ParsedSource(source)
+    if limit > 0:
+        while len(_PARSE_CACHE) >= limit:
+            del _PARSE_CACHE[next(iter(_PARSE_CACHE))]
+        _PARSE_CACHE[key] = parsed
+    return parsed
+
+
+# Guards the lazy wrapper and position resolution when rules run in threads.
+_RESOLVE_LOCK = threading.Lock()
+
+
+def clear_cache() -> None:
+    """Drop all cached parse results."""
+    _PARSE_CACHE.clear()
+
+
 # ---------------------------------------------------------------------------
 # SourceAnalyzer — the single entry point for all rule checks
 # ---------------------------------------------------------------------------
@@ -364,42 +658,213 @@ class SourceAnalyzer:
 
     Attributes:
         source: Raw source text of the file.
+        source_bytes: The source as bytes, for hashing.
         filepath: Absolute or relative path to the source file.
-        source_lines: Source text split into individual lines.
+        source_lines: Source text split into individual lines, built on
+            first access.
         module: Parsed libcst Module node.
-        wrapper: MetadataWrapper providing resolved metadata for all visitors.
+        wrapper: MetadataWrapper over ``module`` for plugins that need
+            metadata providers, built on first access.
+        ast_tree: Standard-library ``ast`` parse of the source for plugins
+            written against ``ast``, built on first access.
     """
 
-    def __init__(self, source: str, filepath: str) -> None:
-        """Parse source and resolve metadata providers."""
-        self.source = source
+    __slots__ = ("module", "_source_bytes", "source", "filepath", "_parsed")
+
+    def __init__(self, source: Union[str, bytes], filepath: str) -> None:
+        """Parse source (or reuse the parse of identical earlier content).
+
+        ``source`` may be raw bytes, in which case libcst detects the
+        encoding (PEP 263 cookie or BOM) while parsing and ``self.source``
+        holds the text decoded with that encoding.
+        """
+        parsed = _parse(source)
+        self.module = parsed.module
+        self._source_bytes: Optional[bytes] = source if isinstance(source, bytes) else None
+        self.source = parsed.source
         self.filepath = filepath
-        self.source_lines = source.splitlines()
-        self.module = cst.parse_module(source)
-        self.wrapper = MetadataWrapper(self.module)
+        self._parsed = parsed
+
+    @property
+    def source_lines(self) -> list[str]:
+        """Return the source split into lines, splitting on first access."""
+        parsed = self._parsed
+        if parsed.source_lines is None:
+            parsed.source_lines = parsed.source.splitlines()
+        return parsed.source_lines
+
+    @property
+    def source_bytes(self) -> bytes:
+        """Return the source bytes (the original input, or UTF-8 encoded text)."""
+        if self._source_bytes is None:
+            self._source_bytes = self.source.encode()
+        return self._source_bytes
+
+    @property
+    def wrapper(self) -> MetadataWrapper:
+        """Return a MetadataWrapper over the module, creating it on first use.
+
+        The built-in queries do not need it; it is kept for plugins.
+        """
+        parsed = self._parsed
+        if parsed.wrapper is None:
+            with _RESOLVE_LOCK:
+                if parsed.wrapper is None:
+                    # The parsed module is never mutated, so the defensive
+                    # deep copy is skipped and metadata keys are the same
+                    # node objects the analyzer's queries see.
+                    parsed.wrapper = MetadataWrapper(self.module, unsafe_skip_copy=True)
+        return parsed.wrapper
+
+    @property
+    def ast_tree(self) -> ast.Module:
+        """Return the source parsed with the stdlib ``ast`` module, parsing once.
+
+        Shared by every plugin and every analyzer over identical content,
+        so callers must not modify it.
+        """
+        parsed = self._parsed
+        if parsed.ast_tree is None:
+            parsed.ast_tree = ast.parse(parsed.source)
+        return parsed.ast_tree
+
+    @property
+    def result_memo(self) -> dict[Any, Any]:
+        """Return a memo shared by every analyzer over identical content.
+
+        Lets callers keep results computed from the source (such as rule
+        outcomes) for as long as the parse itself stays cached.  Keys must
+        capture anything besides the content that the result depends on.
+        """
+        parsed = self._parsed
+        if parsed.result_memo is None:
+            parsed.result_memo = {}
+        return parsed.result_memo
+
+    def collect_facts(self) -> None:
+        """Run the shared CST walk up front.
+
+        Queries run the walk lazily on first use.  Calling this before
+        running checks from several threads means they all share the one
+        walk instead of racing to perform it.
+        """
+        self._collect()
+
+    def _collect(self) -> _MergedCollector:
+        """Run the single CST walk on first use and return its results."""
+        parsed = self._parsed
+        if parsed.facts is None:
+            with _RESOLVE_LOCK:
+                if parsed.facts is None:
+                    source = self.source
+                    # Without the token, no print() call exists anywhere,
+                    # so module-level statements need not be walked.
+                    collector = _MergedCollector(module_calls="print" in source)
+                    # A file with none of the trigger keywords (e.g. an
+                    # import-only __init__.py) has nothing to collect.
+                    if any(token in source for token in _WALK_TRIGGERS):
+                        self.module.visit(collector)
+                    parsed.facts = collector
+        return parsed.facts
+
+    def _line(self, node: cst.CSTNode) -> int:
+        """Return the 1-based start line of a node, or 0 if unknown.
+
+        Positions need a code-generation pass over the whole module, so
+        they are resolved once, on the first violation that needs one.
+        """
+        parsed = self._parsed
+        if parsed.positions is None:
+            wrapper = self.wrapper
+            with _RESOLVE_LOCK:
+                if parsed.positions is None:
+                    parsed.positions = wrapper.resolve(PositionProvider)
+        pos = parsed.positions.get(node)
+        return pos.start.line if pos else 0
 
     # ------------------------------------------------------------------
     # File-level queries
     # ------------------------------------------------------------------
 
     def line_count(self) -> int:
-        """Return the number of lines in the source."""
+        """Return the number of lines in the source.
+
+        Text with only ``\\n`` line endings is counted without splitting
+        it; anything else defers to ``str.splitlines`` so the result always
+        equals ``len(self.source_lines)``.
+        """
+        lines = self._parsed.source_lines
+        if lines is not None:
+            return len(lines)
+        source = self.source
+        if not any(c in source for c in _OTHER_LINE_BREAKS) and (
+            source.isascii() or not any(c in source for c in _UNICODE_LINE_BREAKS)
+        ):
+            count = source.count("\n")
+            if source and not source.endswith("\n"):
+                count += 1
+            return count
         return len(self.source_lines)
 
+    def _module_info(self) -> _ModuleInfo:
+        """Scan the module's top-level statements once and cache the results."""
+        parsed = self._parsed
+        if parsed.module_info is None:
+            parsed.module_info = self._inspect_module_body()
+        return parsed.module_info
+
+    def _inspect_module_body(self) -> _ModuleInfo:
+        """Collect every top-level fact in a single pass over ``module.body``."""
+        body = self.module.body
+        comments = [
+            line.comment.value
+            for line in self.module.header
+            if isinstance(line, cst.EmptyLine) and line.comment
+        ]
+        docstring: Optional[str] = None
+        if body:
+            first = body[0]
+            # Also check leading_lines of the first body statement
+            for ll in getattr(first, "leading_lines", ()):
+                if isinstance(ll, cst.EmptyLine) and ll.comment:
+                    comments.append(ll.comment.value)
+            if isinstance(first, cst.SimpleStatementLine) and first.body:
+                expr = first.body[0]
+                if isinstance(expr, cst.Expr) and isinstance(expr.value, cst.SimpleString):
+                    docstring = expr.value.evaluated_value
+                elif isinstance(expr, cst.Expr) and isinstance(expr.value, cst.ConcatenatedString):
+                    docstring = str(expr.value)
+
+        has_import = False
+        has_main_guard = False
+        constants: list[str] = []
+        for stmt in body:
+            stmt_type = type(stmt)
+            if stmt_type is cst.SimpleStatementLine:
+                for item in stmt.body:
+                    item_type = type(item)
+                    if item_type is cst.Import or item_type is cst.ImportFrom:
+                        has_import = True
+                    elif item_type is cst.Assign:
+                        for target in item.targets:
+                            if type(target.target) is cst.Name:
+                                name = target.target.value
+                                if name == name.upper() and len(name) >= 2 and not name.startswith("_"):
+                                    constants.append(name)
+            elif stmt_type is cst.If and not has_main_guard:
+                has_main_guard = self._is_main_guard(stmt)
+
+        return _ModuleInfo(
+            header_comments=tuple(comments),
+            docstring=docstring,
+            has_import=has_import,
+            has_main_guard=has_main_guard,
+            constants=tuple(constants),
+        )
+
     def header_comments(self) -> list[str]:
         """Return comment text from the Module.header (top-of-file comments)."""
-        comments = []
-        for line in self.module.header:
-            if isinstance(line, cst.EmptyLine) and line.comment:
-                comments.append(line.comment.value)
-        # Also check leading_lines of the first body statement
-        if self.module.body:
-            first = self.module.body[0]
-            if hasattr(first, "leading_lines"):
-                for ll in first.leading_lines:
-                    if isinstance(ll, cst.EmptyLine) and ll.comment:
-                        comments.append(ll.comment.value)
-        return comments
+        return list(self._module_info().header_comments)
 
     def has_module_docstring(self) -> bool:
         """Check if the module has a docstring (first statement is a string expression)."""
@@ -407,115 +872,106 @@ class SourceAnalyzer:
 
     def get_module_docstring(self) -> Optional[str]:
         """Return the module docstring text, or None."""
-        if not self.module.body:
-            return None
-        first = self.module.body[0]
-        if isinstance(first, cst.SimpleStatementLine) and first.body:
-            expr = first.body[0]
-            if isinstance(expr, cst.Expr) and isinstance(expr.value, cst.SimpleString):
-                return expr.value.evaluated_value
-            if isinstance(expr, cst.Expr) and isinstance(expr.value, cst.ConcatenatedString):
-                return str(expr.value)
-        return None
+        return self._module_info().docstring
 
     def has_import(self) -> bool:
         """Check if the module has any import statements."""
-        for stmt in self.module.body:
-            if isinstance(stmt, cst.SimpleStatementLine):
-                for item in stmt.body:
-                    if isinstance(item, (cst.Import, cst.ImportFrom)):
-                        return True
-        return False
+        return self._module_info().has_import
 
     def has_main_guard(self) -> bool:
         """Check for a module-level if __name__ == '__main__' guard via CST structure."""
-        for stmt in self.module.body:
-            if not isinstance(stmt, cst.If):
-                continue
-            test = stmt.test
-            if not isinstance(test, cst.Comparison):
-                continue
-            left = test.left
-            comparisons = test.comparisons
-            if not comparisons:
-                continue
-            right = comparisons[0].comparator
-            if self._is_name_main_comparison(left, right):
-                return True
-            if self._is_name_main_comparison(right, left):
-                return True
-        return False
+        return self._module_info().has_main_guard
 
     def has_print_call(self) -> bool:
         """Check if the module contains any print() call."""
-        class _PrintFinder(cst.CSTVisitor):
-            """Find print() calls."""
-            METADATA_DEPENDENCIES = (PositionProvider,)
-            def __init__(self) -> None:
-                self.found = False
-            def visit_Call(self, node: cst.Call) -> None:
-                """Check call target."""
-                if isinstance(node.func, cst.Name) and node.func.value == "print":
-                    self.found = True
-        finder = _PrintFinder()
-        self.wrapper.visit(finder)
-        return finder.found
+        return self._collect().print_found
 
     def module_level_constants(self) -> list[dict]:
         """Return module-level UPPER_SNAKE_CASE assignments."""
-        constants = []
-        for stmt in self.module.body:
-            if isinstance(stmt, cst.SimpleStatementLine):
-                for item in stmt.body:
-                    if isinstance(item, cst.Assign):
-                        for target in item.targets:
-                            if isinstance(target.target, cst.Name):
-                                name = target.target.value
-                                if name == name.upper() and len(name) >= 2 and not name.startswith("_"):
-                                    constants.append({"name": name})
-        return constants
+        return [{"name": name} for name in self._module_info().constants]
+
+    def module_level_constant_count(self) -> int:
+        """Return how many module-level UPPER_SNAKE_CASE assignments exist."""
+        return len(self._module_info().constants)
 
     # ------------------------------------------------------------------
     # Function-level queries
     # ------------------------------------------------------------------
 
     def functions_missing_docstrings(self) -> list[dict]:
-        """Return violations for functions missing docstrings."""
-        collector = _FunctionDocstringCollector()
-        self.wrapper.visit(collector)
-        return collector.violations
+        """Return violations for functions missing docstrings.
+
+        Documented functions are filtered out during the walk, so parameter
+        lists are only formatted for functions that are reported.
+        """
+        return [
+            {
+                "line": self._line(node),
+                "source": "",
+                "function_name": node.name.value,
+                "params": _format_params(node.params),
+            }
+            for node in self._collect().undocumented
+        ]
 
     def decorated_functions_check(self, decorator_patterns: list, check_type: str) -> list[dict]:
         """Check decorated functions for docstrings or try/except."""
-        collector = _DecoratedFunctionCollector(decorator_patterns, check_type)
-        self.wrapper.visit(collector)
-        return collector.violations
+        violations: list[dict] = []
+        pattern_re = _compile_decorator_patterns(tuple(decorator_patterns))
+        if pattern_re is None:
+            return violations
+        for node, dec_names, documented in self._collect().decorated:
+            for dec_name in dec_names:
+                if pattern_re.search(dec_name) is None:
+                    continue
+                if check_type == "docstring" and not documented:
+                    violations.append({"line": self._line(node), "function_name": node.name.value})
+                elif check_type == "try_except" and not _has_try_except(node):
+                    violations.append({"line": self._line(node), "function_name": node.name.value})
+        return violations
 
     def for_loops_without_progress(self) -> list[dict]:
         """Return violations for for-loops without progress tracking."""
-        collector = _ForLoopProgressCollector()
-        collector._module_for_codegen = self.module
-        self.wrapper.visit(collector)
-        return collector.violations
+        return [
+            {"line": self._line(node), "source": ""}
+            for node in self._collect().for_loops
+        ]
 
     # ------------------------------------------------------------------
     # Hardcoded values (scope-aware literal detection)
     # ------------------------------------------------------------------
 
-    def literals_in_function_bodies(self, safe_values: set, safe_contexts: list) -> list[dict]:
+    def literals_in_function_bodies(
+        self, safe_values: Iterable[object], safe_contexts: list
+    ) -> list[dict]:
         """Find literal values inside function bodies that violate the no-hardcoded-values rule."""
-        collector = _LiteralCollector(safe_values, safe_contexts)
-        self.wrapper.visit(collector)
-
-        # Attach source lines to violations
-        for v in collector.violations:
-            line = v.get("line", 0)
-            if line and line <= len(self.source_lines):
-                v["source"] = self.source_lines[line - 1].rstrip()
+        safe_mask = 0
+        for name in safe_contexts:
+            safe_mask |= _SAFE_CONTEXT_FLAGS.get(name, 0)
+        safe_by_type = _safe_values_by_type(safe_values)
+        facts = self._collect()
+        violations: list[dict] = []
+        for value, value_type, node, context in zip(
+            facts.lit_values, facts.lit_types, facts.lit_nodes, facts.lit_contexts
+        ):
+            if _is_safe_value(value, safe_by_type):
+                continue
+            if context & safe_mask:
+                continue
+            # Attach source lines to violations
+            line = self._line(node)
+            lines = self.source_lines
+            if line and line <= len(lines):
+                source = lines[line - 1].rstrip()
             else:
-                v["source"] = ""
-
-        return collector.violations
+                source = ""
+            violations.append({
+                "line": line,
+                "value": str(value),
+                "value_type": value_type,
+                "source": source,
+            })
+        return violations
 
     # ------------------------------------------------------------------
     # Variable injection helpers
@@ -537,21 +993,17 @@ class SourceAnalyzer:
             "line_count": self.line_count(),
         }
 
-        # 3. Collect function and class names via a lightweight CST visitor
-        func_names = []
-        class_names = []
-
-        class _NameCollector(cst.CSTVisitor):
-            """Collect function and class names."""
-            METADATA_DEPENDENCIES = (PositionProvider,)
-            def visit_FunctionDef(self, node: cst.FunctionDef) -> None:
-                """Record function name."""
-                func_names.append(node.name.value)
-            def visit_ClassDef(self, node: cst.ClassDef) -> None:
-                """Record class name."""
-                class_names.append(node.name.value)
-
-        self.wrapper.visit(_NameCollector())
+        # 3. Function and class names come from the shared CST walk when
+        # it has already run; otherwise only statement blocks are scanned
+        # instead of walking every expression just for these names.
+        facts = self._parsed.facts
+        if facts is not None:
+            func_names = facts.func_names
+            class_names = facts.class_names
+        else:
+            func_names = []
+            class_names = []
+            _collect_block_def_names(self.module.body, func_names, class_names)
 
         # 4. Join collected names into comma-separated strings
         variables["function_names"] = ", ".join(func_names)
@@ -567,6 +1019,19 @@ class SourceAnalyzer:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    @classmethod
+    def _is_main_guard(cls, stmt: cst.If) -> bool:
+        """Check whether an if statement tests ``__name__ == '__main__'``."""
+        test = stmt.test
+        if not isinstance(test, cst.Comparison):
+            return False
+        comparisons = test.comparisons
+        if not comparisons:
+            return False
+        left = test.left
+        right = comparisons[0].comparator
+        return cls._is_name_main_comparison(left, right) or cls._is_name_main_comparison(right, left)
+
     @staticmethod
     def _is_name_main_comparison(left: cst.BaseExpression, right: cst.BaseExpression) -> bool:
         """Check if left is __name__ and right is '__main__'."""
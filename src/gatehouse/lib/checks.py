@@ -1,10 +1,11 @@
 """checks — check-type dispatch and rule evaluation against SourceAnalyzer.
 
 Each check type is implemented as a pure function that receives a
-SourceAnalyzer and returns a list of violation dicts.  The ``run_check()``
-dispatcher maps the check-type string from rule YAML to the corresponding
-function, following a strategy pattern where new check types only require a
-new function and a dispatch branch.
+SourceAnalyzer and returns a list of violation dicts.  ``bind_check()`` maps
+the check-type string from rule YAML to the corresponding function and binds
+the rule's configuration, following a strategy pattern where new check types
+only require a new function and a dispatch-table entry.  ``run_check()`` binds and
+evaluates in one call.
 
 Plugin trust model (v0.3.0):
     - Plugins are loaded ONLY from gate_home/plugins/ (first-party trusted).
@@ -15,12 +16,20 @@ Plugin trust model (v0.3.0):
 
 from __future__ import annotations
 
+import bisect
+import functools
 import importlib.util
 import os
 import re
 import sys
 from pathlib import Path
-from typing import Any
+from types import ModuleType
+from typing import Any, Callable, Optional
+
+try:
+    import ahocorasick as _ahocorasick
+except ImportError:  # pragma: no cover - exercised when pyahocorasick is absent
+    _ahocorasick = None
 
 from gatehouse._paths import plugins_dir
 from gatehouse.lib import config
@@ -32,49 +41,122 @@ from gatehouse.lib.analyzer import SourceAnalyzer
 # ---------------------------------------------------------------------------
 
 
-def run_check(
+def bind_check(
     rule_obj: dict[str, Any],
-    analyzer: SourceAnalyzer,
     gate_home: Path,
-) -> list[dict[str, Any]]:
-    """Dispatch a single rule's check to the appropriate implementation.
+) -> Optional[Callable[[SourceAnalyzer], list[dict[str, Any]]]]:
+    """Resolve a rule's check function once, with its config bound in.
+
+    The returned callable only needs the analyzer, so the check-type
+    dispatch is paid once per rule rather than once per evaluation.
 
     Args:
         rule_obj: Resolved rule object with 'rule_data', 'params', etc.
-        analyzer: The SourceAnalyzer for the file being checked.
         gate_home: Gate home directory for plugin resolution.
 
     Returns:
-        List of violation dicts. Empty list means the rule passed.
+        Callable taking a SourceAnalyzer and returning violation dicts,
+        or None if the check type is unknown (a warning is written).
     """
     rule_data = rule_obj["rule_data"]
     check_config: dict[str, Any] = rule_data.get("check", {})
     params: dict[str, Any] = rule_obj.get("params", {})
     check_type = check_config.get("type", "")
 
-    ct = config.get("check_types")
-    if check_type == ct["pattern_exists"]:
-        return check_pattern_exists(analyzer, check_config, params)
-    elif check_type == ct["ast_node_exists"]:
-        return check_ast_node_exists(analyzer, check_config, params)
-    elif check_type == ct["ast_check"]:
-        return check_ast_check(analyzer, check_config, params)
-    elif check_type == ct["token_scan"]:
-        return check_token_scan(analyzer, check_config, params)
-    elif check_type == ct["uppercase_assignments"]:
-        return check_uppercase_assignments(analyzer, check_config, params)
-    elif check_type == ct["docstring_contains"]:
-        return check_docstring_contains(analyzer, check_config, params)
-    elif check_type == ct["file_metric"]:
-        return check_file_metric(analyzer, check_config, params)
-    elif check_type == ct["custom"]:
-        return check_custom(analyzer, check_config, params, gate_home)
-    else:
+    func = _check_dispatch(id(config.load_defaults())).get(check_type)
+    if func is None:
         msg = config.get_str("messages.unknown_check_type")
         sys.stderr.write(
             msg.format(check_type=check_type, rule_id=rule_obj["id"]) + "\n"
         )
+        return None
+    if func is check_custom:
+        return functools.partial(
+            check_custom,
+            check_config=check_config,
+            params=params,
+            gate_home=gate_home,
+        )
+
+    return functools.partial(func, check_config=check_config, params=params)
+
+
+def check_cost(rule_obj: dict[str, Any]) -> int:
+    """Return the relative evaluation cost of a rule's check type.
+
+    Args:
+        rule_obj: Resolved rule object with 'rule_data'.
+
+    Returns:
+        The ``check_costs`` entry for the rule's check type; lower runs
+        faster.
+    """
+    check_type = rule_obj["rule_data"].get("check", {}).get("type", "")
+    costs, unknown = _check_costs(id(config.load_defaults()))
+    return costs.get(check_type, unknown)
+
+
+@functools.lru_cache(maxsize=None)
+def _check_costs(defaults_id: int) -> tuple[dict[str, int], int]:
+    """Map each configured check-type string to its relative cost.
+
+    Args:
+        defaults_id: Identity of the loaded config, so a config reload
+            rebuilds the table.
+
+    Returns:
+        Dict from the check-type value used in rule YAML to its cost, and
+        the cost of types missing from it.
+    """
+    ct = config.get("check_types")
+    costs = config.get("check_costs")
+    table = {ct[name]: cost for name, cost in costs.items() if name in ct}
+    return table, config.get_int("check_costs.unknown")
+
+
+@functools.lru_cache(maxsize=None)
+def _check_dispatch(defaults_id: int) -> dict[str, Callable[..., Any]]:
+    """Map each configured check-type string to its implementation.
+
+    Args:
+        defaults_id: Identity of the loaded config, so a config reload
+            rebuilds the table.
+
+    Returns:
+        Dict from the check-type value used in rule YAML to its function.
+    """
+    ct = config.get("check_types")
+    return {
+        ct["pattern_exists"]: check_pattern_exists,
+        ct["ast_node_exists"]: check_ast_node_exists,
+        ct["ast_check"]: check_ast_check,
+        ct["token_scan"]: check_token_scan,
+        ct["uppercase_assignments"]: check_uppercase_assignments,
+        ct["docstring_contains"]: check_docstring_contains,
+        ct["file_metric"]: check_file_metric,
+        ct["custom"]: check_custom,
+    }
+
+
+def run_check(
+    rule_obj: dict[str, Any],
+    analyzer: SourceAnalyzer,
+    gate_home: Path,
+) -> list[dict[str, Any]]:
+    """Dispatch a single rule's check to the appropriate implementation.
+
+    Args:
+        rule_obj: Resolved rule object with 'rule_data', 'params', etc.
+        analyzer: The SourceAnalyzer for the file being checked.
+        gate_home: Gate home directory for plugin resolution.
+
+    Returns:
+        List of violation dicts. Empty list means the rule passed.
+    """
+    check = bind_check(rule_obj, gate_home)
+    if check is None:
         return []
+    return check(analyzer)
 
 
 # ---------------------------------------------------------------------------
@@ -82,6 +164,53 @@ def run_check(
 # ---------------------------------------------------------------------------
 
 
+# Characters with a special meaning in a regex.
+_REGEX_METACHARS = frozenset(".^$*+?{}[]|()\\")
+
+# Rule ``value`` text -> compiled regex, or None if it is not a valid regex.
+# Cleared when it reaches ``defaults.pattern_cache_size`` entries so that
+# ad-hoc patterns (e.g. from ``gatehouse test-rule``) cannot grow it unbounded.
+_PATTERN_CACHE: dict[str, Optional[re.Pattern[str]]] = {}
+
+
+def _compile_value_pattern(value: str) -> Optional[re.Pattern[str]]:
+    """Compile a rule's ``value`` as a regex once per process.
+
+    Args:
+        value: Pattern text from the rule YAML.
+
+    Returns:
+        The compiled pattern, or None if value is not a valid regex (it is
+        then only matched as a plain substring).
+    """
+    try:
+        return _PATTERN_CACHE[value]
+    except KeyError:
+        pass
+    if len(_PATTERN_CACHE) >= config.get_int("defaults.pattern_cache_size"):
+        _PATTERN_CACHE.clear()
+    try:
+        compiled: Optional[re.Pattern[str]] = re.compile(value)
+    except re.error:
+        compiled = None
+    _PATTERN_CACHE[value] = compiled
+    return compiled
+
+
+@functools.lru_cache(maxsize=None)
+def _literal_prefixes(substrings: tuple[str, ...]) -> tuple[str, ...]:
+    """Reduce required substrings to their text before any ``{placeholder}``.
+
+    Args:
+        substrings: ``required_substrings`` from the rule YAML.
+
+    Returns:
+        The non-empty literal prefixes, in order.
+    """
+    prefixes = (sub.split("{")[0] for sub in substrings)
+    return tuple(p for p in prefixes if p)
+
+
 def check_pattern_exists(
     analyzer: SourceAnalyzer,
     check_config: dict[str, Any],
@@ -115,31 +244,22 @@ def check_pattern_exists(
         value = check_config.get("value", "")
         required_substrings = check_config.get("required_substrings", [])
         header = analyzer.header_comments()
-        header_text = "\n".join(header)
 
         if value and not any(value in c for c in header):
             violations.append({"line": error_line, "source": ""})
 
         if not violations and required_substrings:
-            for sub in required_substrings:
-                clean_sub = sub.split("{")[0] if "{" in sub else sub
-                if clean_sub and clean_sub not in header_text:
-                    violations.append({"line": error_line, "source": ""})
-                    break
+            header_text = "\n".join(header)
+            prefixes = _literal_prefixes(tuple(required_substrings))
+            if any(p not in header_text for p in prefixes):
+                violations.append({"line": error_line, "source": ""})
 
     else:
         value = check_config.get("value", pattern)
         location = check_config.get("location", locations["anywhere"])
-        source_lines = analyzer.source_lines
 
         if location == locations["first_non_empty_line"]:
-            first_line = ""
-            first_line_num = 0
-            for i, line in enumerate(source_lines):
-                if line.strip():
-                    first_line = line
-                    first_line_num = i + 1
-                    break
+            first_line, first_line_num = _first_non_empty_line(analyzer.source)
             if value and value not in first_line:
                 violations.append({
                     "line": first_line_num or error_line,
@@ -147,20 +267,22 @@ def check_pattern_exists(
                 })
 
         elif location == locations["anywhere"]:
-            found = any(value in line for line in source_lines) if value else False
-            if not found and value:
-                try:
-                    if re.search(value, analyzer.source):
-                        found = True
-                except re.error:
-                    pass
+            found = bool(value) and value in analyzer.source
+            # A value without metacharacters matches as a regex exactly
+            # where it matches as text, so only real patterns are searched.
+            if not found and value and not _REGEX_METACHARS.isdisjoint(value):
+                compiled = _compile_value_pattern(value)
+                if compiled is not None:
+                    found = compiled.search(analyzer.source) is not None
             if not found:
+                source_lines = analyzer.source_lines
                 violations.append({
                     "line": error_line,
                     "source": source_lines[0].rstrip() if source_lines else "",
                 })
 
         elif location == locations["end_of_file"]:
+            source_lines = analyzer.source_lines
             if source_lines and value not in source_lines[-1]:
                 violations.append({
                     "line": len(source_lines),
@@ -232,25 +354,185 @@ def check_ast_check(
         List of violation dicts from the delegated AST check.
     """
     check_name = check_config.get("check", "")
-    violations: list[dict[str, Any]] = []
+    run = _ast_check_dispatch(id(config.load_defaults())).get(check_name)
+    if run is None:
+        return []
+    return run(analyzer, check_config)
+
+
+@functools.lru_cache(maxsize=None)
+def _ast_check_dispatch(
+    defaults_id: int,
+) -> dict[str, Callable[[SourceAnalyzer, dict[str, Any]], list[dict[str, Any]]]]:
+    """Map each configured ``ast_check`` name to the analyzer query it runs.
+
+    Args:
+        defaults_id: Identity of the loaded config, so a config reload
+            rebuilds the table.
+
+    Returns:
+        Dict from the check name used in rule YAML to a callable taking
+        the analyzer and the check config.
+    """
     ac = config.get("ast_checks")
     cm = config.get("check_modes")
 
-    if check_name == ac["all_functions_docstrings"]:
-        violations = analyzer.functions_missing_docstrings()
+    def decorated(mode: str) -> Callable[[SourceAnalyzer, dict[str, Any]], list[dict[str, Any]]]:
+        return lambda analyzer, check_config: analyzer.decorated_functions_check(
+            check_config.get("decorator_pattern", []), mode
+        )
 
-    elif check_name == ac["for_loops_progress"]:
-        violations = analyzer.for_loops_without_progress()
+    return {
+        ac["all_functions_docstrings"]: (
+            lambda analyzer, check_config: analyzer.functions_missing_docstrings()
+        ),
+        ac["for_loops_progress"]: (
+            lambda analyzer, check_config: analyzer.for_loops_without_progress()
+        ),
+        ac["decorated_docstrings"]: decorated(cm["docstring"]),
+        ac["decorated_try_except"]: decorated(cm["try_except"]),
+    }
 
-    elif check_name == ac["decorated_docstrings"]:
-        patterns = check_config.get("decorator_pattern", [])
-        violations = analyzer.decorated_functions_check(patterns, cm["docstring"])
 
-    elif check_name == ac["decorated_try_except"]:
-        patterns = check_config.get("decorator_pattern", [])
-        violations = analyzer.decorated_functions_check(patterns, cm["try_except"])
+# Line boundaries recognised by str.splitlines.
+_LINE_BREAK_RE = re.compile("\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+# Any character str.strip() would keep.
+_NON_SPACE_RE = re.compile(r"\S")
+
+
+def _first_non_empty_line(text: str) -> tuple[str, int]:
+    """Return the first line of text that is not blank, and its number.
+
+    Finds the first non-whitespace character with one C-level regex scan
+    instead of stripping every leading line; lines are numbered as
+    ``str.splitlines`` numbers them.
+
+    Args:
+        text: Source text.
+
+    Returns:
+        Tuple of ``(line, 1-based line number)``, or ``("", 0)`` if every
+        line is blank.
+    """
+    match = _NON_SPACE_RE.search(text)
+    if match is None:
+        return "", 0
+    pos = match.start()
+    line_num = 1
+    line_start = 0
+    for brk in _LINE_BREAK_RE.finditer(text, 0, pos):
+        line_num += 1
+        line_start = brk.end()
+    line_end = _LINE_BREAK_RE.search(text, pos)
+    return text[line_start:line_end.start() if line_end else len(text)], line_num
+
+
+def _line_bounds(text: str) -> tuple[list[int], list[int]]:
+    """Return the start and end offsets of each line in text.
+
+    Lines are split exactly as ``str.splitlines`` splits them, so index
+    ``i`` in either list refers to ``text.splitlines()[i]`` and the end
+    offset excludes the line terminator.
+
+    Args:
+        text: Text to index.
+
+    Returns:
+        Tuple of ``(starts, ends)`` offset lists.
+    """
+    starts = [0]
+    ends: list[int] = []
+    for match in _LINE_BREAK_RE.finditer(text):
+        ends.append(match.start())
+        starts.append(match.end())
+    if starts[-1] == len(text):
+        starts.pop()
+    else:
+        ends.append(len(text))
+    return starts, ends
+
+
+@functools.lru_cache(maxsize=None)
+def _needle_automaton(needles: tuple[str, ...]) -> Any:
+    """Build an Aho-Corasick automaton over needles, once per needle list.
+
+    Args:
+        needles: Non-empty strings to search for.
+
+    Returns:
+        An ``ahocorasick.Automaton`` whose values are the needles.
+    """
+    automaton = _ahocorasick.Automaton()
+    for needle in needles:
+        automaton.add_word(needle, needle)
+    automaton.make_automaton()
+    return automaton
 
-    return violations
+
+def _needle_lines(text: str, needles: tuple[str, ...], starts: list[int]) -> set[int]:
+    """Return the indexes of the lines of text in which any needle starts.
+
+    Uses one Aho-Corasick pass over text when ``pyahocorasick`` is
+    installed, otherwise one ``str.find`` scan per needle that skips to
+    the next line after each hit.
+
+    Args:
+        text: Text to search.
+        needles: Strings to look for.
+        starts: Start offset of each line of text, from ``_line_bounds``.
+
+    Returns:
+        Set of 0-based line indexes.
+    """
+    if "" in needles:
+        return set(range(len(starts)))
+    lines: set[int] = set()
+    if _ahocorasick is not None:
+        for end, needle in _needle_automaton(needles).iter(text):
+            lines.add(bisect.bisect_right(starts, end - len(needle) + 1) - 1)
+        return lines
+    for needle in needles:
+        pos = text.find(needle)
+        while pos != -1:
+            i = bisect.bisect_right(starts, pos) - 1
+            lines.add(i)
+            if i + 1 == len(starts):
+                break
+            pos = text.find(needle, starts[i + 1])
+    return lines
+
+
+@functools.lru_cache(maxsize=None)
+def _lowered_needles(needles: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+    """Pair each needle with its lower-case form, once per needle list.
+
+    Args:
+        needles: Strings from the rule YAML, e.g. ``forbidden_strings``.
+
+    Returns:
+        ``(original, lowered)`` pairs in the original order.
+    """
+    return tuple((n, n.lower()) for n in needles)
+
+
+@functools.lru_cache(maxsize=None)
+def _log_keyword_pattern(defaults_id: int) -> Optional[re.Pattern[str]]:
+    """Compile ``defaults.log_keywords`` into one alternation regex.
+
+    Args:
+        defaults_id: Identity of the loaded config, so a config reload
+            recompiles the pattern.
+
+    Returns:
+        Pattern matching any of the lower-case keywords that mark a
+        logging call literally, or None if no keywords are configured.
+    """
+    keywords = config.get_list("defaults.log_keywords")
+    if not keywords:
+        return None
+    return re.compile("|".join(re.escape(kw) for kw in keywords))
 
 
 def check_token_scan(
@@ -273,23 +555,34 @@ def check_token_scan(
     st = config.get("scan_types")
 
     if scan_type == st["hardcoded_literals"]:
-        safe_values: set[object] = set()
-        for v in check_config.get("safe_values", []):
-            safe_values.add(v)
+        safe_values: list[object] = check_config.get("safe_values", [])
         safe_contexts: list[str] = check_config.get("safe_contexts", [])
         violations = analyzer.literals_in_function_bodies(safe_values, safe_contexts)
 
     elif scan_type == st["log_calls_containing"]:
-        log_keywords = tuple(config.get_list("defaults.log_keywords"))
         forbidden: list[str] = check_config.get("forbidden_strings", [])
-        for i, line in enumerate(analyzer.source_lines):
-            lower_line = line.lower()
-            if any(kw in lower_line for kw in log_keywords):
-                for forbidden_str in forbidden:
-                    if forbidden_str.lower() in lower_line:
+        lower_source = analyzer.source.lower()
+        lowered = _lowered_needles(tuple(forbidden))
+        # Whole-file prefilter: most files never mention a forbidden string.
+        if not any(fl in lower_source for _, fl in lowered):
+            return violations
+        log_re = _log_keyword_pattern(id(config.load_defaults()))
+        if log_re is None:
+            return violations
+        starts, ends = _line_bounds(lower_source)
+        # Map each forbidden-string hit to its line by offset so only those
+        # lines are checked for a logging call.
+        candidates = _needle_lines(
+            lower_source, tuple(fl for _, fl in lowered), starts
+        )
+        for i in sorted(candidates):
+            lower_line = lower_source[starts[i]:ends[i]]
+            if log_re.search(lower_line):
+                for forbidden_str, fl in lowered:
+                    if fl in lower_line:
                         violations.append({
                             "line": i + 1,
-                            "source": line.rstrip(),
+                            "source": analyzer.source_lines[i].rstrip(),
                             "value": forbidden_str,
                         })
 
@@ -316,8 +609,7 @@ def check_uppercase_assignments(
     violations: list[dict[str, Any]] = []
     error_line = config.get_int("defaults.error_line")
 
-    count = len(analyzer.module_level_constants())
-    if count < min_count:
+    if analyzer.module_level_constant_count() < min_count:
         violations.append({"line": error_line, "source": ""})
 
     return violations
@@ -392,6 +684,44 @@ def check_file_metric(
 # ---------------------------------------------------------------------------
 
 
+# plugin path -> ((mtime_ns, size), loaded module)
+_PLUGIN_CACHE: dict[str, tuple[tuple[int, int], ModuleType]] = {}
+
+
+def _load_plugin(plugin_path: str) -> ModuleType:
+    """Import a plugin file, reusing the module while the file is unchanged.
+
+    Args:
+        plugin_path: Absolute path to the plugin ``.py`` file.
+
+    Returns:
+        The executed plugin module.
+
+    Raises:
+        OSError: If the plugin file cannot be stat'ed.
+        ImportError: If no import spec can be built for the file.
+    """
+    st = os.stat(plugin_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _PLUGIN_CACHE.get(plugin_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    plugin_spec_name = config.get_str("defaults.plugin_spec_name")
+    spec = importlib.util.spec_from_file_location(plugin_spec_name, plugin_path)
+    if spec is None or spec.loader is None:
+        msg = config.get_str("messages.plugin_load_error")
+        raise ImportError(msg.format(path=plugin_path))
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    _PLUGIN_CACHE[plugin_path] = (stamp, mod)
+    return mod
+
+
+# Set once the inline-expression notice has been written.
+_EXPRESSION_WARNED = False
+
+
 def check_custom(
     analyzer: SourceAnalyzer,
     check_config: dict[str, Any],
@@ -418,9 +748,14 @@ def check_custom(
     error_line = config.get_int("defaults.error_line")
 
     if "expression" in check_config:
-        sys.stderr.write(
-            config.get_str("messages.expression_deprecated") + "\n"
-        )
+        # Expressions are never evaluated; the notice is shown once per
+        # process rather than once per scanned file.
+        global _EXPRESSION_WARNED  # noqa: PLW0603
+        if not _EXPRESSION_WARNED:
+            _EXPRESSION_WARNED = True
+            sys.stderr.write(
+                config.get_str("messages.expression_deprecated") + "\n"
+            )
         return violations
 
     if "plugin" not in check_config:
@@ -434,13 +769,7 @@ def check_custom(
     )
 
     try:
-        plugin_spec_name = config.get_str("defaults.plugin_spec_name")
-        spec = importlib.util.spec_from_file_location(plugin_spec_name, plugin_path)
-        if spec is None or spec.loader is None:
-            msg = config.get_str("messages.plugin_load_error")
-            raise ImportError(msg.format(path=plugin_path))
-        mod = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(mod)
+        mod = _load_plugin(plugin_path)
         func = getattr(mod, func_name)
         result = func(analyzer)
         if isinstance(result, list):
@@ -9,8 +9,10 @@ effects — config is loaded lazily.
 Design notes:
     Configuration is loaded once and cached in a module-level sentinel so that
     every caller shares the same snapshot and the YAML file is only read from
-    disk a single time.  The ``reset()`` function exists solely for test
-    isolation.
+    disk a single time.  On load every nested value is also indexed under its
+    dotted key, so each lookup is a single dict hit; only misses walk the
+    mapping, to report the missing segment.  The ``reset()`` function
+    exists solely for test isolation.
 """
 
 from __future__ import annotations
@@ -18,10 +20,14 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-import yaml
+from gatehouse.lib.yaml_loader import load_yaml
 
 _DEFAULTS: dict[str, Any] | None = None
 
+# Dotted key -> value for the current ``_DEFAULTS`` snapshot, filled when
+# the file is loaded.
+_RESOLVED: dict[str, Any] = {}
+
 _CONFIG_FILE = Path(__file__).resolve().parent.parent / "config" / "defaults.yaml"
 
 
@@ -42,15 +48,37 @@ def load_defaults() -> dict[str, Any]:
     """
     global _DEFAULTS  # noqa: PLW0603
     if _DEFAULTS is None:
-        with open(_CONFIG_FILE, encoding="utf-8") as fh:
-            data = yaml.safe_load(fh)
+        data = load_yaml(_CONFIG_FILE)
         if not isinstance(data, dict):
             msg = f"defaults.yaml must be a YAML mapping, got {type(data).__name__}"
             raise TypeError(msg)
         _DEFAULTS = data
+        _RESOLVED.clear()
+        _flatten(data, "", _RESOLVED)
     return _DEFAULTS
 
 
+def _flatten(node: dict[str, Any], prefix: str, out: dict[str, Any]) -> None:
+    """Record every nested value of node under its dotted key.
+
+    Keys that are not strings, or that contain a dot themselves, cannot be
+    addressed unambiguously by a dotted path; they are left to the
+    segment-by-segment walk in ``get``.
+
+    Args:
+        node: Mapping to flatten.
+        prefix: Dotted path of node, including the trailing dot.
+        out: Dict receiving ``dotted_key -> value`` entries.
+    """
+    for key, value in node.items():
+        if not isinstance(key, str) or "." in key:
+            continue
+        path = prefix + key
+        out[path] = value
+        if isinstance(value, dict):
+            _flatten(value, path + ".", out)
+
+
 # ---------------------------------------------------------------------------
 # Accessors
 # ---------------------------------------------------------------------------
@@ -68,13 +96,17 @@ def get(dotted_key: str) -> Any:
     Raises:
         KeyError: If any segment of the path is missing.
     """
-    parts = dotted_key.split(".")
+    try:
+        return _RESOLVED[dotted_key]
+    except KeyError:
+        pass
     node: Any = load_defaults()
-    for part in parts:
+    for part in dotted_key.split("."):
         if not isinstance(node, dict) or part not in node:
             msg = f"Config key not found: {dotted_key!r} (missing segment: {part!r})"
             raise KeyError(msg)
         node = node[part]
+    _RESOLVED[dotted_key] = node
     return node
 
 
@@ -147,3 +179,4 @@ def reset() -> None:
     """Clear the cached config (used by tests)."""
     global _DEFAULTS  # noqa: PLW0603
     _DEFAULTS = None
+    _RESOLVED.clear()
@@ -4,15 +4,21 @@ Provides stderr (human-readable), JSON (structured), and traceback-style
 (SyntaxError-like) formatters for violation output.  Template variables
 from ``SourceAnalyzer.build_variables()`` are injected into error message
 and fix templates via simple ``{key}`` placeholder replacement before each
-formatter renders its final output.
+formatter renders its final output.  Templates are split into literal and
+placeholder segments once and the parsed form is cached, so each render is
+a single pass; callers rendering many violations of one rule compile its
+templates once, outside the per-violation loop.
 """
 
 from __future__ import annotations
 
-from typing import Any
+import functools
+import re
+from typing import Any, Mapping, NamedTuple, Optional
 
 from gatehouse.lib import config
 from gatehouse.lib.theme import code as _c
+from gatehouse.lib.theme import is_tty
 
 
 # ---------------------------------------------------------------------------
@@ -20,20 +26,117 @@ from gatehouse.lib.theme import code as _c
 # ---------------------------------------------------------------------------
 
 
-def inject_variables(template: str, variables: dict[str, Any]) -> str:
+# Placeholders are identifiers, so braces in code samples inside fix hints
+# (dict literals, f-strings) stay literal text.
+_PLACEHOLDER_RE = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+
+_NO_OVERRIDES: Mapping[str, Any] = {}
+
+# A compiled template: (literal_text, placeholder_key) pairs, the last key None.
+TemplateSegments = tuple[tuple[str, Optional[str]], ...]
+
+
+@functools.lru_cache(maxsize=None)
+def compile_template(template: str) -> TemplateSegments:
+    """Split a template into (literal, placeholder) segments.
+
+    Templates come from rule YAML, so the set of distinct strings is small
+    and each one is parsed only once per process.  Callers that render one
+    template for many violations compile it once and pass the result to
+    ``render_template``.
+
+    Args:
+        template: String containing {key} placeholders.
+
+    Returns:
+        Tuple of (literal_text, key) pairs.  The final pair has key None.
+    """
+    segments: list[tuple[str, Optional[str]]] = []
+    pos = 0
+    for match in _PLACEHOLDER_RE.finditer(template):
+        segments.append((template[pos:match.start()], match.group(1)))
+        pos = match.end()
+    segments.append((template[pos:], None))
+    return tuple(segments)
+
+
+def render_template(
+    segments: TemplateSegments,
+    variables: Mapping[str, Any],
+    *,
+    overrides: Optional[Mapping[str, Any]] = None,
+) -> str:
+    """Render a compiled template.
+
+    Args:
+        segments: Result of ``compile_template``.
+        variables: Mapping of key names to replacement values.
+        overrides: Values that take precedence over ``variables``, such as
+            a violation's own fields.  Looked up directly instead of
+            merging the two mappings.
+
+    Returns:
+        The rendered text.  Unknown placeholders are left as-is.
+    """
+    if len(segments) == 1:
+        return segments[0][0]
+    if overrides is None:
+        overrides = _NO_OVERRIDES
+    parts: list[str] = []
+    for literal, key in segments:
+        parts.append(literal)
+        if key is not None:
+            if key in overrides:
+                parts.append(str(overrides[key]))
+            elif key in variables:
+                parts.append(str(variables[key]))
+            else:
+                parts.append(f"{{{key}}}")
+    return "".join(parts)
+
+
+def inject_variables(
+    template: str,
+    variables: Mapping[str, Any],
+    *,
+    overrides: Optional[Mapping[str, Any]] = None,
+) -> str:
     """Replace {variable} placeholders in a template string.
 
     Args:
         template: String containing {key} placeholders.
         variables: Mapping of key names to replacement values.
+        overrides: Values that take precedence over ``variables``.
+
+    Returns:
+        Template with all recognized placeholders replaced.  Unknown
+        placeholders are left as-is.
+    """
+    if "{" not in template:
+        return template
+    return render_template(
+        compile_template(template), variables, overrides=overrides
+    )
+
+
+# Characters str.splitlines() treats as line boundaries.
+_FIRST_LINE_RE = re.compile(r"[^\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]*")
+
+
+def first_line(text: str) -> str:
+    """Return the first line of stripped text without splitting all of it.
+
+    Equivalent to ``text.strip().splitlines()[0]`` but only scans up to the
+    first line break, and returns an empty string for blank text.
+
+    Args:
+        text: Possibly multi-line text such as a rendered fix hint.
 
     Returns:
-        Template with all recognized placeholders replaced.
+        The first line of the stripped text.
     """
-    result = template
-    for key, val in variables.items():
-        result = result.replace(f"{{{key}}}", str(val))
-    return result
+    return _FIRST_LINE_RE.match(text.strip()).group()
 
 
 # ---------------------------------------------------------------------------
@@ -45,6 +148,9 @@ def format_violation_stderr(
     rule_obj: dict[str, Any],
     violation: dict[str, Any],
     variables: dict[str, Any],
+    *,
+    message: Optional[str] = None,
+    fix: Optional[str] = None,
 ) -> str:
     """Format a single violation for stderr output.
 
@@ -52,38 +158,28 @@ def format_violation_stderr(
         rule_obj: The resolved rule object.
         violation: Single violation dict with line, source, etc.
         variables: Template variables for message injection.
+        message: Already-rendered message.  When given together with
+            ``fix``, the rule's templates are not interpolated again.
+        fix: Already-rendered fix hint.
 
     Returns:
         Formatted multi-line string for stderr.
     """
-    rule_data = rule_obj["rule_data"]
-    error_config: dict[str, Any] = rule_data.get("error", {})
-    default_msg = config.get_str("messages.default_violation").format(
-        rule_id=rule_obj["id"]
-    )
-    message = error_config.get("message", default_msg)
-    fix = error_config.get("fix", "")
-
-    merged = dict(variables)
-    merged.update(violation)
-
-    message = inject_variables(message, merged)
-    fix = inject_variables(fix, merged)
-
-    filepath = merged.get("filepath", "")
-    fallback_line = config.get_int("defaults.fallback_line")
-    line = violation.get("line", fallback_line)
+    if message is None or fix is None:
+        error_config: dict[str, Any] = rule_obj["rule_data"].get("error", {})
+        default_msg = config.get_str("messages.default_violation").format(
+            rule_id=rule_obj["id"]
+        )
+        message = inject_variables(
+            error_config.get("message", default_msg), variables, overrides=violation
+        )
+        fix = inject_variables(error_config.get("fix", ""), variables, overrides=violation)
+    filepath = violation.get("filepath", variables.get("filepath", ""))
+    tpl = _stderr_templates(is_tty(), id(config.load_defaults()))
+    line = violation.get("line", tpl.fallback_line)
     source = violation.get("source", "")
 
-    file_line_tpl = config.get_str("traceback.file_line_template")
-    caret = config.get_str("formatting.caret_char")
-    fix_prefix = config.get_str("messages.fix_prefix")
-
-    parts: list[str] = []
-    parts.append(
-        f"  {_c('file_path')}{file_line_tpl.format(filepath=filepath, line=line)}"
-        f"{_c('reset')}"
-    )
+    parts: list[str] = [tpl.location.format(filepath=filepath, line=line)]
     if source:
         parts.append(f"    {source}")
         if violation.get("value"):
@@ -91,20 +187,73 @@ def format_violation_stderr(
             col = source.find(val_str)
             if col >= 0:
                 parts.append(
-                    f"    {_c('caret')}{' ' * col}"
-                    f"{caret * len(val_str)}{_c('reset')}"
+                    tpl.caret_line.format(
+                        pad=" " * col, marks=tpl.caret_char * len(val_str)
+                    )
                 )
-    parts.append(f"  {_c('error')}{message}{_c('reset')}")
-    if fix:
-        fix_lines = fix.strip().splitlines()
-        parts.append(f"  {_c('fix')}{fix_prefix}{fix_lines[0]}{_c('reset')}")
-        for fl in fix_lines[1:]:
-            padding = " " * len(fix_prefix)
-            parts.append(f"  {_c('fix')}{padding}{fl}{_c('reset')}")
+    parts.append(tpl.message.format(text=message))
+    fix_lines = fix.strip().splitlines() if fix else []
+    if fix_lines:
+        parts.append(tpl.fix_first.format(text=fix_lines[0]))
+        parts.extend(tpl.fix_next.format(text=fl) for fl in fix_lines[1:])
 
     return "\n".join(parts)
 
 
+class _StderrTemplates(NamedTuple):
+    """Per-violation stderr line templates with theme codes baked in."""
+
+    location: str
+    caret_line: str
+    message: str
+    fix_first: str
+    fix_next: str
+    caret_char: str
+    fallback_line: int
+
+
+def _escape_braces(text: str) -> str:
+    """Escape literal braces so text can sit inside a format string."""
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+@functools.lru_cache(maxsize=None)
+def _stderr_templates(tty: bool, defaults_id: int) -> _StderrTemplates:
+    """Build the stderr line templates for one colour mode.
+
+    The theme codes, prefixes and config strings are fixed for the process,
+    so they are resolved once and formatting a violation only fills in its
+    own fields.
+
+    Args:
+        tty: Whether colour codes are emitted.
+        defaults_id: Identity of the loaded config, so a config reload
+            rebuilds the templates.
+
+    Returns:
+        The prepared templates.
+    """
+    def code(role: str) -> str:
+        return _escape_braces(_c(role)) if tty else ""
+
+    reset = code("reset")
+    raw_prefix = config.get_str("messages.fix_prefix")
+    fix_prefix = _escape_braces(raw_prefix)
+    fix_padding = " " * len(raw_prefix)
+    return _StderrTemplates(
+        location=(
+            f"  {code('file_path')}"
+            f"{config.get_str('traceback.file_line_template')}{reset}"
+        ),
+        caret_line=f"    {code('caret')}{{pad}}{{marks}}{reset}",
+        message=f"  {code('error')}{{text}}{reset}",
+        fix_first=f"  {code('fix')}{fix_prefix}{{text}}{reset}",
+        fix_next=f"  {code('fix')}{fix_padding}{{text}}{reset}",
+        caret_char=config.get_str("formatting.caret_char"),
+        fallback_line=config.get_int("defaults.fallback_line"),
+    )
+
+
 # ---------------------------------------------------------------------------
 # JSON formatting
 # ---------------------------------------------------------------------------
@@ -134,28 +283,31 @@ def format_violations_json(
     fallback_line = config.get_int("defaults.fallback_line")
 
     all_violations: list[dict[str, Any]] = []
+    blocking = 0
+    warnings = 0
     for rule_obj, violations in rule_violations:
-        rule_data = rule_obj["rule_data"]
-        error_config: dict[str, Any] = rule_data.get("error", {})
+        if not violations:
+            continue
+        # Per-rule fields are looked up once, not once per violation.
+        rule_id = rule_obj["id"]
+        severity = rule_obj["severity"]
+        error_config: dict[str, Any] = rule_obj["rule_data"].get("error", {})
+        message_tpl = compile_template(error_config.get("message", ""))
+        fix_tpl = compile_template(error_config.get("fix", ""))
+        if severity == sev_block:
+            blocking += len(violations)
+        elif severity == sev_warn:
+            warnings += len(violations)
         for v in violations:
-            merged = dict(variables)
-            merged.update(v)
             all_violations.append({
-                "rule": rule_obj["id"],
-                "severity": rule_obj["severity"],
+                "rule": rule_id,
+                "severity": severity,
                 "line": v.get("line", fallback_line),
                 "source": v.get("source", ""),
-                "message": inject_variables(error_config.get("message", ""), merged),
-                "fix": inject_variables(error_config.get("fix", ""), merged),
+                "message": render_template(message_tpl, variables, overrides=v),
+                "fix": render_template(fix_tpl, variables, overrides=v),
             })
 
-    blocking = sum(
-        1 for ro, vs in rule_violations for _ in vs if ro["severity"] == sev_block
-    )
-    warnings = sum(
-        1 for ro, vs in rule_violations for _ in vs if ro["severity"] == sev_warn
-    )
-
     return {
         "status": status_rejected if blocking > 0 else status_passed,
         "file": variables.get("filepath", ""),
@@ -190,37 +342,73 @@ def format_summary_stderr(
     Returns:
         Formatted summary string.
     """
+    tpl = _summary_templates(is_tty(), id(config.load_defaults()))
+    parts: list[str] = [
+        f"\n{tpl.bar}",
+        tpl.schema.format(name=schema_name, version=schema_version),
+        tpl.violations.format(blocking=blocking_count, warnings=warning_count),
+        tpl.blocked if blocking_count > 0 else tpl.allowed,
+        tpl.bar,
+    ]
+    return "\n".join(parts)
+
+
+class _SummaryTemplates(NamedTuple):
+    """Summary footer lines with theme codes and labels baked in."""
+
+    bar: str
+    schema: str
+    violations: str
+    blocked: str
+    allowed: str
+
+
+@functools.lru_cache(maxsize=None)
+def _summary_templates(tty: bool, defaults_id: int) -> _SummaryTemplates:
+    """Build the summary footer lines for one colour mode.
+
+    Args:
+        tty: Whether colour codes are emitted.
+        defaults_id: Identity of the loaded config, so a config reload
+            rebuilds the templates.
+
+    Returns:
+        The prepared lines; ``schema`` and ``violations`` still take the
+        per-scan values as format fields.
+    """
+    def raw(role: str) -> str:
+        return _c(role) if tty else ""
+
+    def code(role: str) -> str:
+        return _escape_braces(raw(role))
+
+    def label(key: str) -> str:
+        return _escape_braces(config.get_str(f"labels.{key}"))
+
+    reset = code("reset")
     bar_width = config.get_int("formatting.summary_bar_width")
     bar_char = config.get_str("formatting.summary_bar_char")
-    lbl_schema = config.get_str("labels.schema")
-    lbl_violations = config.get_str("labels.violations")
-    lbl_blocking = config.get_str("labels.blocking")
-    lbl_warnings = config.get_str("labels.warnings")
-    lbl_blocked = config.get_str("labels.execution_blocked")
-    lbl_allowed = config.get_str("labels.execution_allowed")
-
-    bar = f"{_c('summary_bar')}{bar_char * bar_width}{_c('reset')}"
-    parts: list[str] = [f"\n{bar}"]
-    parts.append(
-        f"  {_c('bold')}{lbl_schema}{_c('reset')} "
-        f"{_c('info')}{schema_name}{_c('reset')} "
-        f"{_c('dim')}(v{schema_version}){_c('reset')}"
+    return _SummaryTemplates(
+        bar=f"{raw('summary_bar')}{bar_char * bar_width}{raw('reset')}",
+        schema=(
+            f"  {code('bold')}{label('schema')}{reset} "
+            f"{code('info')}{{name}}{reset} "
+            f"{code('dim')}(v{{version}}){reset}"
+        ),
+        violations=(
+            f"  {code('bold')}{label('violations')}{reset} "
+            f"{code('error')}{{blocking}} {label('blocking')}{reset}, "
+            f"{code('warning')}{{warnings}} {label('warnings')}{reset}"
+        ),
+        blocked=(
+            f"  {raw('blocked')}{raw('bold')}"
+            f"{config.get_str('labels.execution_blocked')}{raw('reset')}"
+        ),
+        allowed=(
+            f"  {raw('allowed')}"
+            f"{config.get_str('labels.execution_allowed')}{raw('reset')}"
+        ),
     )
-    parts.append(
-        f"  {_c('bold')}{lbl_violations}{_c('reset')} "
-        f"{_c('error')}{blocking_count} {lbl_blocking}{_c('reset')}, "
-        f"{_c('warning')}{warning_count} {lbl_warnings}{_c('reset')}"
-    )
-    if blocking_count > 0:
-        parts.append(
-            f"  {_c('blocked')}{_c('bold')}{lbl_blocked}{_c('reset')}"
-        )
-    else:
-        parts.append(
-            f"  {_c('allowed')}{lbl_allowed}{_c('reset')}"
-        )
-    parts.append(bar)
-    return "\n".join(parts)
 
 
 # ---------------------------------------------------------------------------
@@ -257,7 +445,7 @@ def format_violation_traceback(
         if source:
             parts.append(f"    {source}")
         parts.append(f"{exc_prefix}{message}")
-        fix = v.get("fix", "")
+        fix = first_line(v.get("fix", ""))
         if fix:
-            parts.append(f"  {fix_prefix}{fix.strip().splitlines()[0]}")
+            parts.append(f"  {fix_prefix}{fix}")
     return "\n".join(parts)
@@ -0,0 +1,66 @@
+"""json_encoder — unified JSON serialization for Gatehouse output.
+
+Wraps JSON encoding behind a single entry point so the engine, logger, and
+CLI agree on one serializer.  When the optional ``orjson`` package is
+installed (``pip install gatehouse[fast]``) it is used for the layouts it
+can reproduce exactly; everything else falls back to the standard library
+``json`` module.  Both backends emit non-ASCII characters unescaped so the
+output does not depend on which one is installed.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Optional
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    _orjson = None
+
+# orjson only supports a two-space indent and, without indent, the most
+# compact separators; other layouts use the stdlib.
+_ORJSON_INDENT = 2
+_ORJSON_SEPARATORS = (",", ":")
+
+
+def dumps(
+    data: Any,
+    *,
+    indent: Optional[int] = None,
+    separators: Optional[tuple[str, str]] = None,
+) -> str:
+    """Serialize data to a JSON string.
+
+    Args:
+        data: JSON-compatible value to serialize.
+        indent: Spaces per indentation level, or None for single-line
+            output.
+        separators: ``(item_separator, key_separator)`` as accepted by
+            ``json.dumps``; None uses the stdlib defaults.
+
+    Returns:
+        The JSON document as a string.
+
+    Raises:
+        TypeError: If data contains a value that cannot be serialized.
+    """
+    if _orjson is not None:
+        option = None
+        if indent == _ORJSON_INDENT and separators is None:
+            option = _orjson.OPT_INDENT_2
+        elif indent is None and separators is not None and (
+            tuple(separators) == _ORJSON_SEPARATORS
+        ):
+            option = 0
+        if option is not None:
+            try:
+                return _orjson.dumps(
+                    data, option=option | _orjson.OPT_NON_STR_KEYS
+                ).decode("utf-8")
+            except _orjson.JSONEncodeError:
+                # e.g. integers beyond 64 bits; let the stdlib decide.
+                pass
+    return json.dumps(
+        data, indent=indent, separators=separators, ensure_ascii=False
+    )
@@ -5,17 +5,153 @@ the configured log directory.  Every entry captures the scanned file path,
 schema version, pass/reject status, violation details, a truncated SHA-256 hash
 of the source, and timing information.  The log file name and formatting
 constants are read from ``config/defaults.yaml``.
+
+Design notes:
+    Log files are opened once per process as unbuffered ``O_APPEND``
+    descriptors, so a batch of scans costs one write per entry rather than
+    an open/write/close cycle each.  Every entry is encoded up front and
+    written with a single ``os.write``: nothing is held in a buffer that
+    a worker process (which exits without running ``atexit`` handlers)
+    could lose, and each entry lands as one append, so concurrent writers
+    do not split each other's lines.
 """
 
 from __future__ import annotations
 
-import datetime
+import atexit
+import functools
 import hashlib
-import json
 import os
-from typing import Any
+import time
+from typing import Any, NamedTuple, Optional, Union
+
+from gatehouse.lib import config, json_encoder
+
+# log directory -> append-mode file descriptor
+_HANDLES: dict[str, int] = {}
+# Line breaks other than "\n" that str.splitlines() recognises in ASCII text.
+_OTHER_LINE_BREAKS = "\r\v\f\x1c\x1d\x1e"
+
+
+def _close_handles() -> None:
+    """Close every cached log file descriptor."""
+    for fd in _HANDLES.values():
+        os.close(fd)
+    _HANDLES.clear()
+
+
+atexit.register(_close_handles)
+
+
+class _LogSettings(NamedTuple):
+    """Per-entry formatting constants read from ``defaults.yaml``."""
+
+    ts_format: str
+    utc_rep: str
+    hash_prefix: str
+    hash_trunc: int
+    separators: tuple[str, ...]
+
+
+@functools.lru_cache(maxsize=None)
+def _log_settings(defaults_id: int) -> _LogSettings:
+    """Read the scan log formatting constants once per config snapshot.
+
+    Args:
+        defaults_id: Identity of the loaded config, so a config reload
+            re-reads the values.
+
+    Returns:
+        The settings used for every entry.
+    """
+    return _LogSettings(
+        ts_format=config.get_str("formatting.timestamp_format"),
+        utc_rep=config.get_str("formatting.utc_offset_replacement"),
+        hash_prefix=config.get_str("formatting.hash_prefix"),
+        hash_trunc=config.get_int("defaults.hash_truncation_length"),
+        separators=tuple(config.get_list("formatting.json_separators")),
+    )
+
+
+def _utc_timestamp(fmt: str, suffix: str) -> str:
+    """Format the current UTC time with microseconds and a zone suffix.
+
+    Equivalent to ``datetime.now(timezone.utc).isoformat()`` with the
+    offset replaced by suffix, without building a datetime object.
+
+    Args:
+        fmt: ``strftime`` format for the whole-second part.
+        suffix: Text appended after the microseconds, e.g. ``"Z"``.
+
+    Returns:
+        The timestamp string.
+    """
+    secs, nanos = divmod(time.time_ns(), 1_000_000_000)
+    return f"{time.strftime(fmt, time.gmtime(secs))}.{nanos // 1000:06d}{suffix}"
 
-from gatehouse.lib import config
+
+def _short_hash(data: bytes, length: int) -> str:
+    """Return the first length hex characters of data's SHA-256 digest.
+
+    Only the digest bytes that survive truncation are hex-encoded.
+
+    Args:
+        data: Bytes to hash.
+        length: Number of hex characters to keep.
+
+    Returns:
+        The truncated hex digest.
+    """
+    digest = hashlib.sha256(data, usedforsecurity=False).digest()
+    return digest[: (length + 1) // 2].hex()[:length]
+
+
+def _count_lines(source: Union[str, bytes]) -> int:
+    """Count lines as ``str.splitlines()`` would on the source text.
+
+    Bytes are counted as their UTF-8 decoding, since ``bytes.splitlines()``
+    only breaks on ``\\n`` and ``\\r`` and would disagree with the text
+    for form feeds and the other separators.  ASCII sources whose only
+    line break is ``\\n`` are counted without building the list of lines.
+
+    Args:
+        source: The scanned source, as text or bytes.
+
+    Returns:
+        The number of lines.
+    """
+    if isinstance(source, bytes):
+        if not source.isascii() or any(
+            ord(c) in source for c in _OTHER_LINE_BREAKS
+        ):
+            return len(source.decode("utf-8", "surrogateescape").splitlines())
+        newline = b"\n"
+    else:
+        if not source.isascii() or any(c in source for c in _OTHER_LINE_BREAKS):
+            return len(source.splitlines())
+        newline = "\n"
+    count = source.count(newline)
+    if source and not source.endswith(newline):
+        count += 1
+    return count
+
+
+def _get_handle(log_dir: str) -> int:
+    """Return the append-mode scan log descriptor for a log directory.
+
+    Args:
+        log_dir: Directory holding the scan log file.
+
+    Returns:
+        Open file descriptor, created (with its directory) on first use.
+    """
+    fd = _HANDLES.get(log_dir)
+    if fd is None:
+        os.makedirs(log_dir, exist_ok=True)
+        log_path = os.path.join(log_dir, config.get_str("filenames.scan_log"))
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+        fd = _HANDLES[log_dir] = os.open(log_path, flags, 0o666)
+    return fd
 
 
 def log_scan(
@@ -27,9 +163,10 @@ def log_scan(
     violations_data: list[dict[str, Any]],
     passed_rules: list[str],
     total_rules: int,
-    source: str,
+    source: Union[str, bytes],
     scan_ms: int,
     iteration: int = 1,
+    line_count: Optional[int] = None,
 ) -> None:
     """Write a JSONL log entry for a scan result.
 
@@ -42,28 +179,24 @@ def log_scan(
         violations_data: List of violation summary dicts.
         passed_rules: List of rule IDs that passed.
         total_rules: Total number of active rules.
-        source: The source code that was scanned.
+        source: The source code that was scanned.  Bytes are hashed as-is,
+            text is hashed as UTF-8.
         scan_ms: Scan duration in milliseconds.
         iteration: Iteration number for retry loops.
+        line_count: Number of source lines, if already known; otherwise
+            counted from source.
     """
     if not log_dir:
         return
-    os.makedirs(log_dir, exist_ok=True)
-    log_filename = config.get_str("filenames.scan_log")
-    log_path = os.path.join(log_dir, log_filename)
 
-    utc_src = config.get_str("formatting.utc_offset_source")
-    utc_rep = config.get_str("formatting.utc_offset_replacement")
-    hash_prefix = config.get_str("formatting.hash_prefix")
-    hash_trunc = config.get_int("defaults.hash_truncation_length")
-    separators = tuple(config.get_list("formatting.json_separators"))
+    settings = _log_settings(id(config.load_defaults()))
+
+    source_bytes = source if isinstance(source, bytes) else source.encode()
+    if line_count is None:
+        line_count = _count_lines(source)
 
     entry: dict[str, Any] = {
-        "timestamp": (
-            datetime.datetime.now(datetime.timezone.utc)
-            .isoformat()
-            .replace(utc_src, utc_rep)
-        ),
+        "timestamp": _utc_timestamp(settings.ts_format, settings.utc_rep),
         "event": "scan",
         "file": filepath,
         "schema": schema_name,
@@ -73,10 +206,12 @@ def log_scan(
         "violations": violations_data,
         "passed_rules": passed_rules,
         "total_rules": total_rules,
-        "code_length_lines": len(source.splitlines()),
-        "code_hash": hash_prefix + hashlib.sha256(source.encode()).hexdigest()[:hash_trunc],
+        "code_length_lines": line_count,
+        "code_hash": (
+            settings.hash_prefix + _short_hash(source_bytes, settings.hash_trunc)
+        ),
         "scan_ms": scan_ms,
     }
 
-    with open(log_path, "a", encoding="utf-8") as fh:
-        fh.write(json.dumps(entry, separators=separators) + "\n")
+    line = json_encoder.dumps(entry, separators=settings.separators) + "\n"
+    os.write(_get_handle(log_dir), line.encode("utf-8"))
@@ -21,7 +21,7 @@ from typing import Any, Optional, Union
 
 from gatehouse._paths import get_gate_home, rules_dir, schemas_dir
 from gatehouse.lib import config
-from gatehouse.lib.yaml_loader import load_yaml
+from gatehouse.lib.yaml_loader import load_yaml_cached
 
 
 def find_gate_home() -> Optional[Path]:
@@ -44,13 +44,11 @@ def load_rule(rule_id: str, gate_home: Path) -> Optional[dict[str, Any]]:
         gate_home: The gate home directory for rule discovery.
 
     Returns:
-        Parsed rule dict, or None if the rule file does not exist.
+        Parsed rule dict, or None if the rule file does not exist.  The
+        dict is cached and shared across calls; treat it as read-only.
     """
     ext = config.get_str("filenames.rule_extension")
-    rule_path = rules_dir(gate_home) / f"{rule_id}{ext}"
-    if not rule_path.is_file():
-        return None
-    return load_yaml(str(rule_path))
+    return load_yaml_cached(rules_dir(gate_home) / f"{rule_id}{ext}")
 
 
 def load_schema(schema_name: str, gate_home: Path) -> Optional[dict[str, Any]]:
@@ -61,13 +59,11 @@ def load_schema(schema_name: str, gate_home: Path) -> Optional[dict[str, Any]]:
         gate_home: The gate home directory for schema discovery.
 
     Returns:
-        Parsed schema dict, or None if the schema file does not exist.
+        Parsed schema dict, or None if the schema file does not exist.  The
+        dict is cached and shared across calls; treat it as read-only.
     """
     ext = config.get_str("filenames.schema_extension")
-    schema_path = schemas_dir(gate_home) / f"{schema_name}{ext}"
-    if not schema_path.is_file():
-        return None
-    return load_yaml(str(schema_path))
+    return load_yaml_cached(schemas_dir(gate_home) / f"{schema_name}{ext}")
 
 
 def resolve_rules(
@@ -90,12 +86,14 @@ def resolve_rules(
     default_enabled = config.get("defaults.enabled")
     msg_tpl = config.get_str("messages.rule_not_found")
 
-    rules: list[dict[str, Any]] = []
+    # Keyed by rule ID so a child entry replaces its parent's in place
+    # while keeping the parent's position in the evaluation order.
+    by_id: dict[str, dict[str, Any]] = {}
 
     if schema_data.get("extends"):
         parent = load_schema(schema_data["extends"], gate_home)
         if parent:
-            rules = resolve_rules(parent, gate_home)
+            by_id = {r["id"]: r for r in resolve_rules(parent, gate_home)}
 
     schema_rules = schema_data.get("rules", [])
     if isinstance(schema_rules, list):
@@ -125,15 +123,14 @@ def resolve_rules(
                 "enabled": entry.get(
                     "enabled", defaults.get("enabled", default_enabled)
                 ),
-                "params": entry.get("params", {}),
+                # Copied: project overrides update params in place, and
+                # the schema dict is shared through the YAML cache.
+                "params": dict(entry.get("params") or {}),
             }
 
-            existing_ids = [r["id"] for r in rules]
-            if rule_id in existing_ids:
-                idx = existing_ids.index(rule_id)
-                rules[idx] = rule_obj
-            else:
-                rules.append(rule_obj)
+            by_id[rule_id] = rule_obj
+
+    rules = list(by_id.values())
 
     for entry in schema_data.get("additional_rules", []):
         if isinstance(entry, str):
@@ -175,12 +172,10 @@ def load_project_config(
         schema_path: Path to the .gate_schema.yaml file.
 
     Returns:
-        Parsed config dict, or None if loading fails.
+        Parsed config dict, or None if the file does not exist.  The dict
+        is cached until the file changes; treat it as read-only.
     """
-    try:
-        return load_yaml(str(schema_path))
-    except FileNotFoundError:
-        return None
+    return load_yaml_cached(schema_path)
 
 
 def apply_project_overrides(
@@ -214,3 +209,147 @@ def apply_project_overrides(
                 rule["params"].update(ovr["params"])
 
     return rules
+
+
+def _freeze(value: Any) -> Any:
+    """Convert nested YAML data into a hashable, order-independent form.
+
+    Args:
+        value: A dict, list, or scalar loaded from YAML.
+
+    Returns:
+        A hashable equivalent of value.
+    """
+    if isinstance(value, dict):
+        items = ((str(k), _freeze(v)) for k, v in value.items())
+        return tuple(sorted(items, key=lambda kv: kv[0]))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def dedupe_rules(rules: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Drop rules whose check and params repeat an earlier rule's.
+
+    Two rules with the same ``check`` block and the same params would walk
+    the source identically, so only one of them is evaluated.  The kept rule
+    is the one with the stronger severity (the first one on a tie), and a
+    warning naming the skipped rule is written to stderr.
+
+    Args:
+        rules: Active rule objects, in evaluation order.
+
+    Returns:
+        The rules list with redundant entries removed, order preserved.
+    """
+    sev_block = config.get_str("severities.block")
+    msg_tpl = config.get_str("messages.redundant_rule")
+
+    kept: dict[Any, int] = {}
+    result: list[dict[str, Any]] = []
+    for rule in rules:
+        key = _freeze((rule["rule_data"].get("check", {}), rule.get("params") or {}))
+        idx = kept.get(key)
+        if idx is None:
+            kept[key] = len(result)
+            result.append(rule)
+            continue
+        current = result[idx]
+        if rule["severity"] == sev_block and current["severity"] != sev_block:
+            result[idx] = rule
+            rule, current = current, rule
+        sys.stderr.write(
+            msg_tpl.format(rule_id=rule["id"], kept_id=current["id"]) + "\n"
+        )
+    return result
+
+
+# Active rule sets keyed by (gate home, schema name).  Each entry keeps the
+# cached YAML objects it was built from, so any edited schema, rule, project
+# config, or defaults file yields a new object and invalidates the entry.
+_ACTIVE_CACHE: dict[
+    tuple[str, str], tuple[tuple[Any, ...], tuple[dict[str, Any], ...]]
+] = {}
+
+
+def _rule_sources(
+    schema_data: dict[str, Any],
+    gate_home: Path,
+) -> tuple[Any, ...]:
+    """Collect every cached YAML object a schema's rule set depends on.
+
+    Args:
+        schema_data: Parsed schema YAML dict.
+        gate_home: The gate home directory for rule discovery.
+
+    Returns:
+        The schema chain followed by each referenced rule dict (None for
+        rules whose file is missing), in resolution order.
+    """
+    chain: list[Any] = []
+    seen: set[int] = set()
+    schema: Optional[dict[str, Any]] = schema_data
+    while schema and id(schema) not in seen:
+        seen.add(id(schema))
+        chain.append(schema)
+        parent = schema.get("extends")
+        schema = load_schema(parent, gate_home) if parent else None
+
+    sources: list[Any] = list(chain)
+    for schema in chain:
+        entries = list(schema.get("rules", []) or [])
+        entries += list(schema.get("additional_rules", []) or [])
+        for entry in entries:
+            rule_id = entry if isinstance(entry, str) else entry.get("id")
+            if rule_id:
+                sources.append(load_rule(rule_id, gate_home))
+    return tuple(sources)
+
+
+def get_active_rules(
+    schema_name: str,
+    schema_data: dict[str, Any],
+    gate_home: Path,
+    project_config: dict[str, Any],
+) -> tuple[dict[str, Any], ...]:
+    """Return the enabled, overridden, de-duplicated rules for a schema.
+
+    Resolving inheritance, applying project overrides, and de-duplicating
+    give the same answer for every file gated by one schema, so the result
+    is computed once and reused until one of its source files changes.
+
+    Args:
+        schema_name: The schema identifier, used as the cache key.
+        schema_data: Parsed schema YAML dict for schema_name.
+        gate_home: The gate home directory for rule discovery.
+        project_config: Parsed .gate_schema.yaml config.
+
+    Returns:
+        Active rule objects in evaluation order.  The tuple and its rule
+        dicts are shared across calls; treat them as read-only.
+    """
+    sources = (
+        config.load_defaults(),
+        project_config,
+        *_rule_sources(schema_data, gate_home),
+    )
+    key = (str(gate_home), schema_name)
+    cached = _ACTIVE_CACHE.get(key)
+    if cached is not None:
+        cached_sources, active = cached
+        if len(cached_sources) == len(sources) and all(
+            a is b for a, b in zip(cached_sources, sources)
+        ):
+            return active
+
+    sev_off = config.get_str("severities.off")
+    rules = apply_project_overrides(
+        resolve_rules(schema_data, gate_home), project_config
+    )
+    active = tuple(
+        dedupe_rules(
+            [r for r in rules if r["enabled"] and r["severity"] != sev_off]
+        )
+    )
+    _ACTIVE_CACHE[key] = (sources, active)
+    return active
@@ -10,11 +10,19 @@ name — or to ``None`` if the path is explicitly exempted.
 from __future__ import annotations
 
 import fnmatch
+import functools
 import os
-from typing import Any, Optional
+import re
+from typing import Any, Callable, Optional
 
 from gatehouse.lib import config
 
+# Scope decisions keyed by (filepath, gated_paths, exempt_paths,
+# exempt_files).  Keying on the scope values rather than the schema dict
+# keeps entries valid across schema reloads.  Cleared when it reaches
+# ``defaults.scope_cache_size`` entries.
+_SCOPE_CACHE: dict[tuple[Any, ...], bool] = {}
+
 
 def is_file_in_scope(
     filepath: str,
@@ -29,30 +37,99 @@ def is_file_in_scope(
         project_config: Parsed .gate_schema.yaml config.
 
     Returns:
-        True if the file should be checked, False if exempt.
+        True if the file should be checked, False if exempt.  Decisions
+        are memoized per filepath and scope settings.
     """
     scope: dict[str, Any] = schema_data.get("scope", {})
-    gated_paths: list[str] = scope.get("gated_paths", [])
-    exempt_paths: list[str] = scope.get("exempt_paths", [])
-    exempt_files: list[str] = scope.get("exempt_files", [])
+    key = (
+        filepath,
+        tuple(scope.get("gated_paths", [])),
+        tuple(scope.get("exempt_paths", [])),
+        frozenset(scope.get("exempt_files", [])),
+    )
+    cached = _SCOPE_CACHE.get(key)
+    if cached is None:
+        if len(_SCOPE_CACHE) >= config.get_int("defaults.scope_cache_size"):
+            _SCOPE_CACHE.clear()
+        cached = _SCOPE_CACHE[key] = _match_scope(*key)
+    return cached
 
-    filename = os.path.basename(filepath)
 
-    if filename in exempt_files:
+def _match_scope(
+    filepath: str,
+    gated_paths: tuple[str, ...],
+    exempt_paths: tuple[str, ...],
+    exempt_files: frozenset[str],
+) -> bool:
+    """Evaluate the scope rules for one filepath (uncached).
+
+    Args:
+        filepath: Path to the file being checked.
+        gated_paths: Path prefixes under enforcement.
+        exempt_paths: Path prefixes excluded from enforcement.
+        exempt_files: Basenames excluded from enforcement.
+
+    Returns:
+        True if the file should be checked, False if exempt.
+    """
+    if os.path.basename(filepath) in exempt_files:
         return False
 
-    for ep in exempt_paths:
-        if filepath.startswith(ep) or f"/{ep}" in filepath:
-            return False
+    if _under_any(filepath, exempt_paths):
+        return False
 
     if not gated_paths:
         return True
 
-    for gp in gated_paths:
-        if filepath.startswith(gp) or f"/{gp}" in filepath:
-            return True
+    return _under_any(filepath, gated_paths)
+
+
+@functools.lru_cache(maxsize=None)
+def _slash_prefixed_search(paths: tuple[str, ...]) -> Callable[[str], Any]:
+    """Compile one regex finding any path preceded by a slash.
+
+    A single alternation scans the filepath once instead of once per path.
+
+    Args:
+        paths: Scope path prefixes from the schema.
+
+    Returns:
+        The compiled pattern's ``search`` method.
+    """
+    return re.compile("/(?:" + "|".join(map(re.escape, paths)) + ")").search
 
-    return False
+
+def _under_any(filepath: str, paths: tuple[str, ...]) -> bool:
+    """Check whether filepath starts with a path or contains it after a slash.
+
+    Args:
+        filepath: Path to the file being checked.
+        paths: Scope path prefixes from the schema.
+
+    Returns:
+        True if any of the paths matches.
+    """
+    if not paths:
+        return False
+    if filepath.startswith(paths):
+        return True
+    return _slash_prefixed_search(paths)(filepath) is not None
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_glob(pattern: str) -> Callable[[str], Any]:
+    """Compile an override glob once into a regex match function.
+
+    Equivalent to ``fnmatch.fnmatch`` for inputs already passed through
+    ``os.path.normcase``.
+
+    Args:
+        pattern: Shell-style glob from the project ``overrides`` section.
+
+    Returns:
+        The compiled pattern's ``match`` method.
+    """
+    return re.compile(fnmatch.translate(os.path.normcase(pattern))).match
 
 
 def resolve_effective_schema(
@@ -75,17 +152,20 @@ def resolve_effective_schema(
         "schema", config.get_str("defaults.schema_name")
     )
     overrides: dict[str, Any] = project_config.get("overrides", {})
+    if not overrides:
+        return base_schema
+
+    norm_path = os.path.normcase(filepath)
+    norm_name = os.path.normcase(os.path.basename(filepath))
 
     for pattern, ovr in overrides.items():
         if ovr and ovr.get("schema") is None:
-            if (
-                fnmatch.fnmatch(filepath, pattern)
-                or fnmatch.fnmatch(os.path.basename(filepath), pattern)
-            ):
+            match = _compile_glob(pattern)
+            if match(norm_path) or match(norm_name):
                 return None
         elif ovr and ovr.get("schema"):
             if (
-                fnmatch.fnmatch(filepath, pattern)
+                _compile_glob(pattern)(norm_path)
                 or filepath.startswith(pattern.rstrip("*"))
             ):
                 return ovr["schema"]
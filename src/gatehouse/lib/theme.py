@@ -29,6 +29,29 @@ class Theme:
     def __init__(self) -> None:
         """Initialize with deferred loading."""
         self._resolved: Optional[dict[str, str]] = None
+        # The reset code, read from the mapping once it is loaded.
+        self._reset = ""
+        # Last stream checked and its isatty() result; formatting a report
+        # asks about the same stream for every line.
+        self._tty_stream: Any = None
+        self._tty_value = False
+
+    def _is_tty(self, stream: Any) -> bool:
+        """Return whether stream is a TTY, remembering the last answer.
+
+        Args:
+            stream: The output stream to check, or None for sys.stderr.
+
+        Returns:
+            True if the stream reports itself as a TTY.
+        """
+        target = stream or sys.stderr
+        if target is self._tty_stream:
+            return self._tty_value
+        value = bool(hasattr(target, "isatty") and target.isatty())
+        self._tty_stream = target
+        self._tty_value = value
+        return value
 
     def _load(self) -> dict[str, str]:
         """Load and resolve the role-to-ANSI mapping so colour data is only read from disk once."""
@@ -53,6 +76,7 @@ class Theme:
         """Return the resolved role-to-ANSI-code mapping, loading on first access."""
         if self._resolved is None:
             self._resolved = self._load()
+            self._reset = self._resolved.get("reset", "")
         return self._resolved
 
     def colorize(self, text: str, role: str, *, stream: Any = None) -> str:
@@ -66,14 +90,12 @@ class Theme:
         Returns:
             Colorized text if the stream is a TTY, plain text otherwise.
         """
-        target = stream or sys.stderr
-        if not hasattr(target, "isatty") or not target.isatty():
+        if not self._is_tty(stream):
             return text
         code = self.resolved.get(role, "")
         if not code:
             return text
-        reset = self.resolved.get("reset", "")
-        return f"{code}{text}{reset}"
+        return f"{code}{text}{self._reset}"
 
     def code(self, role: str, *, stream: Any = None) -> str:
         """Return the raw ANSI escape code for a role.
@@ -85,8 +107,7 @@ class Theme:
         Returns:
             ANSI escape code string, or empty string if not a TTY.
         """
-        target = stream or sys.stderr
-        if not hasattr(target, "isatty") or not target.isatty():
+        if not self._is_tty(stream):
             return ""
         return self.resolved.get(role, "")
 
@@ -119,3 +140,15 @@ def code(role: str, *, stream: Any = None) -> str:
         ANSI escape code string, or empty string.
     """
     return _theme.code(role, stream=stream)
+
+
+def is_tty(stream: Any = None) -> bool:
+    """Return whether colour codes are emitted for a stream.
+
+    Args:
+        stream: Output stream for TTY check. Defaults to sys.stderr.
+
+    Returns:
+        True if the stream is a TTY.
+    """
+    return _theme._is_tty(stream)
@@ -1,19 +1,48 @@
 """yaml_loader — unified YAML loading for all Gatehouse configuration files.
 
-Wraps PyYAML's ``safe_load`` behind a single entry point shared by the engine,
+Wraps PyYAML's safe loader behind a single entry point shared by the engine,
 CLI, and all library modules.  A dedicated loader exists so that encoding,
 error handling, and safe-parsing choices are defined in one place rather than
 scattered across callers.  PyYAML is a required dependency — no fallback parser
-is provided.
+is provided.  The libyaml-backed ``CSafeLoader`` is used when PyYAML was built
+with it, and the pure-Python ``SafeLoader`` otherwise; both accept the same
+safe subset of YAML.  ``dump_yaml`` makes the same choice between
+``CSafeDumper`` and ``SafeDumper`` for the CLI commands that edit project
+config.
+
+Design notes:
+    ``load_yaml_cached`` keeps parsed documents for the lifetime of the
+    process, keyed by path and validated against the file's mtime and size,
+    so rule and schema files are parsed once per change rather than once per
+    scan.  Cached documents are shared between callers and must be treated
+    as read-only.  When ``$GATEHOUSE_CACHE_DIR`` is set, parsed documents
+    are also persisted there in ``marshal`` format so that short-lived
+    processes (one per ``python_gate`` call) skip YAML parsing too.
+    ``marshal`` is used rather than ``pickle`` because loading it cannot
+    run code; documents it cannot represent are simply not persisted.
 """
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import marshal
+import os
+import stat
+import tempfile
 from pathlib import Path
 from typing import Any, Optional, Union
 
 import yaml
 
+from gatehouse._paths import yaml_cache_dir
+
+_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# path -> ((mtime_ns, size), parsed document)
+_CACHE: dict[str, tuple[tuple[int, int], Any]] = {}
+
 
 def load_yaml(path: Union[str, Path]) -> Optional[dict[str, Any]]:
     """Load a YAML file and return its contents as a dict.
@@ -29,7 +58,7 @@ def load_yaml(path: Union[str, Path]) -> Optional[dict[str, Any]]:
         yaml.YAMLError: If the file contains invalid YAML.
     """
     with open(path, "r", encoding="utf-8") as fh:
-        return yaml.safe_load(fh)
+        return yaml.load(fh, Loader=_LOADER)  # noqa: S506 - safe loader
 
 
 def load_yaml_string(text: str) -> Optional[dict[str, Any]]:
@@ -44,4 +73,109 @@ def load_yaml_string(text: str) -> Optional[dict[str, Any]]:
     Raises:
         yaml.YAMLError: If the string contains invalid YAML.
     """
-    return yaml.safe_load(text)
+    return yaml.load(text, Loader=_LOADER)  # noqa: S506 - safe loader
+
+
+def dump_yaml(data: dict[str, Any], path: Union[str, Path]) -> None:
+    """Write a dict to a YAML file in block style, preserving key order.
+
+    Args:
+        data: The document to write.
+        path: Destination file path; overwritten if it exists.
+
+    Raises:
+        yaml.representer.RepresenterError: If data holds a value outside
+            the safe YAML subset.
+    """
+    with open(path, "w", encoding="utf-8") as fh:
+        yaml.dump(
+            data, fh, Dumper=_DUMPER, default_flow_style=False, sort_keys=False
+        )
+
+
+def load_yaml_cached(path: Union[str, Path]) -> Optional[dict[str, Any]]:
+    """Load a YAML file, reusing the parsed result while the file is unchanged.
+
+    Args:
+        path: Path to the YAML file.
+
+    Returns:
+        Parsed YAML contents (shared, do not mutate), or None if the file
+        is empty or is not a regular file.
+
+    Raises:
+        yaml.YAMLError: If the file contains invalid YAML.
+    """
+    key = str(path)
+    try:
+        st = os.stat(key)
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
+        _CACHE.pop(key, None)
+        return None
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    disk_dir = yaml_cache_dir()
+    disk_path = None
+    if disk_dir is not None:
+        digest = hashlib.sha256(os.path.abspath(key).encode()).hexdigest()
+        disk_path = disk_dir / f"{digest}.marshal"
+        persisted = _read_persisted(disk_path)
+        if persisted is not None and persisted[0] == stamp:
+            _CACHE[key] = (stamp, persisted[1])
+            return persisted[1]
+
+    data = load_yaml(key)
+    _CACHE[key] = (stamp, data)
+    if disk_path is not None:
+        _write_persisted(disk_path, stamp, data)
+    return data
+
+
+def _read_persisted(disk_path: Path) -> Optional[tuple[tuple[int, int], Any]]:
+    """Read a persisted (stamp, document) pair, ignoring unreadable entries.
+
+    Args:
+        disk_path: Cache file written by ``_write_persisted``.
+
+    Returns:
+        The stored pair, or None if missing or corrupt.
+    """
+    try:
+        with open(disk_path, "rb") as fh:
+            stamp, data = marshal.load(fh)
+        return tuple(stamp), data
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+
+def _write_persisted(disk_path: Path, stamp: tuple[int, int], data: Any) -> None:
+    """Atomically persist a parsed document; failures are ignored.
+
+    Args:
+        disk_path: Destination cache file.
+        stamp: The source file's (mtime_ns, size) at parse time.
+        data: The parsed document.
+    """
+    try:
+        payload = marshal.dumps((stamp, data))
+        disk_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=disk_path.parent)
+    except (OSError, ValueError):
+        return
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(payload)
+        os.replace(tmp, disk_path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+
+
+def clear_cache() -> None:
+    """Drop every document cached by ``load_yaml_cached``."""
+    _CACHE.clear()
@@ -40,61 +40,44 @@ else:
     })
 
 
-def _get_import_name(node: ast.AST) -> str:
-    """Extract the top-level module name from an import node.
-
-    The extracted name feeds into ``_classify`` to determine ordering category.
-    """
-    if isinstance(node, ast.Import):
-        return node.names[0].name.split(".")[0]
-    elif isinstance(node, ast.ImportFrom):
-        if node.module:
-            return node.module.split(".")[0]
-    return ""
-
-
-def _classify(name: str) -> int:
-    """Classify an import as stdlib (0), third-party (1), or local (2).
-
-    The numeric categories enforce the expected import sort order.
-    """
-    if name in STDLIB_MODULES:
-        return 0
-    if name.startswith("."):
-        return 2
-    return 1
-
-
 def check(analyzer: Any) -> list[dict[str, Any]]:
     """Check that imports are ordered: stdlib, then third-party, then local.
 
     Args:
-        analyzer: A SourceAnalyzer instance. Uses analyzer.source for parsing.
+        analyzer: A SourceAnalyzer instance. Uses its shared analyzer.ast_tree.
 
     Returns:
         A list of violation dicts, each with 'line' and optionally 'message'.
         Empty list if the code passes.
     """
     violations: list[dict[str, Any]] = []
-    imports: list[tuple[int, str, int]] = []
+    prev_category = -1
 
-    ast_tree = ast.parse(analyzer.source)
-    for node in ast.iter_child_nodes(ast_tree):
-        if isinstance(node, (ast.Import, ast.ImportFrom)):
-            name = _get_import_name(node)
-            category = _classify(name)
-            imports.append((node.lineno, name, category))
+    # Categories: stdlib (0), third-party (1), local (2).  ``ast`` keeps
+    # the leading dots of a relative import in ``level``, not the name.
+    for node in analyzer.ast_tree.body:
+        node_type = type(node)
+        if node_type is ast.Import:
+            name = node.names[0].name.partition(".")[0]
+            category = 0 if name in STDLIB_MODULES else 1
+        elif node_type is ast.ImportFrom:
+            name = (node.module or "").partition(".")[0]
+            if node.level:
+                category = 2
+            else:
+                category = 0 if name in STDLIB_MODULES else 1
+        else:
+            continue
 
-    prev_category = -1
-    for lineno, name, category in imports:
         if category < prev_category:
             violations.append({
-                "line": lineno,
+                "line": node.lineno,
                 "message": (
                     f"Import '{name}' is out of order "
                     f"(stdlib -> third-party -> local)"
                 ),
             })
-        prev_category = max(prev_category, category)
+        elif category > prev_category:
+            prev_category = category
 
     return violations
@@ -9,6 +9,13 @@ from typing import Any
 
 import pytest
 import yaml
+from hypothesis import settings
+
+# On CI the fuzz tests run a fixed, derandomized set of examples with no
+# example database, so runs are reproducible and skip database I/O.
+settings.register_profile("ci", derandomize=True, database=None)
+if os.environ.get("CI"):
+    settings.load_profile("ci")
 
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
@@ -0,0 +1,99 @@
+"""Unit tests for gatehouse.lib.analyzer SourceAnalyzer."""
+
+from __future__ import annotations
+
+import ast
+
+from gatehouse.lib.analyzer import SourceAnalyzer, clear_cache
+
+
+class TestParseCache:
+    """Tests for reusing parse results across analyzers."""
+
+    def test_identical_source_shares_parse(self):
+        """Analyzers over the same content share one parsed module."""
+        clear_cache()
+        source = "def f():\n    return 42\n"
+        a = SourceAnalyzer(source, "a.py")
+        b = SourceAnalyzer(source, "pkg/b.py")
+        assert a.module is b.module
+        assert b.build_variables()["filepath"] == "pkg/b.py"
+        assert a.build_variables()["function_names"] == "f"
+
+    def test_bytes_and_text_are_parsed_separately(self):
+        """Bytes honour their encoding cookie, so they never reuse a text parse."""
+        clear_cache()
+        text = "# -*- coding: latin-1 -*-\nx = 'é'\n"
+        a = SourceAnalyzer(text, "a.py")
+        b = SourceAnalyzer(text.encode("latin-1"), "a.py")
+        assert a.module is not b.module
+        assert a.source == b.source
+
+
+class TestSourceLines:
+    """Tests for the lazily split source lines."""
+
+    def test_line_count_matches_splitlines(self):
+        """line_count agrees with splitlines for every kind of line ending."""
+        for source in ["", "x = 1", "x = 1\n", "x = 1\r\ny = 2\n", "x = 1\ry = 2", "s = 'é'\n\n",
+                       "s = 'é\u2028'\n"]:
+            analyzer = SourceAnalyzer(source, "a.py")
+            assert analyzer.line_count() == len(source.splitlines())
+            assert analyzer.source_lines == source.splitlines()
+
+    def test_ast_tree_is_parsed_once_and_shared(self):
+        """Analyzers over identical content share one stdlib ast parse."""
+        clear_cache()
+        first = SourceAnalyzer("import os\n", "a.py").ast_tree
+        second = SourceAnalyzer("import os\n", "b.py").ast_tree
+        assert first is second
+        assert isinstance(first.body[0], ast.Import)
+
+
+class TestBuildVariables:
+    """Tests for template variables derived from the source."""
+
+    def test_names_without_walk_match_walk(self):
+        """Definition names are the same whether or not the walk has run."""
+        clear_cache()
+        source = (
+            "class A:\n"
+            "    def m(self):\n"
+            "        if x:\n"
+            "            def inner():\n"
+            "                pass\n"
+            "try:\n"
+            "    def g():\n"
+            "        pass\n"
+            "except ValueError:\n"
+            "    class B:\n"
+            "        pass\n"
+        )
+        before = SourceAnalyzer(source, "a.py").build_variables()
+        analyzer = SourceAnalyzer(source, "a.py")
+        analyzer.collect_facts()
+        after = analyzer.build_variables()
+        assert before["function_names"] == after["function_names"] == "m, inner, g"
+        assert before["class_names"] == after["class_names"] == "A, B"
+
+
+class TestCollect:
+    """Tests for the shared CST walk."""
+
+    def test_file_without_trigger_keywords_has_no_facts(self):
+        """Import-only modules produce empty results without a walk."""
+        analyzer = SourceAnalyzer("import os\nfrom x import y\n__all__ = ['y']\n", "a.py")
+        assert analyzer.functions_missing_docstrings() == []
+        assert analyzer.for_loops_without_progress() == []
+        assert not analyzer.has_print_call()
+        assert analyzer.literals_in_function_bodies(set(), []) == []
+
+    def test_safe_values_match_by_exact_type(self):
+        """Equal safe values of different types are cached separately."""
+        analyzer = SourceAnalyzer(
+            "def f():\n    x = 1.0\n    y = 1\n    return x, y\n", "a.py"
+        )
+        int_safe = analyzer.literals_in_function_bodies([1], [])
+        float_safe = analyzer.literals_in_function_bodies([1.0], [])
+        assert [v["value"] for v in int_safe] == ["1.0"]
+        assert [v["value"] for v in float_safe] == ["1"]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import subprocess
 import sys
 from pathlib import Path
 from unittest.mock import patch
@@ -110,6 +111,16 @@ class TestAntiDoubleScan:
             assert _already_scanned("/tmp/b.py") is True
             assert _already_scanned("/tmp/c.py") is False
 
+    def test_marks_from_another_process_are_seen(self):
+        """Entries added to the variable outside this process are honoured."""
+        with patch.dict(os.environ, {}, clear=True):
+            _mark_scanned("/tmp/a.py")
+            assert _already_scanned("/tmp/b.py") is False
+            os.environ["GATEHOUSE_OUTER_VERDICT"] += ":/tmp/b.py"
+            assert _already_scanned("/tmp/b.py") is True
+            _mark_scanned("/tmp/a.py")
+            assert os.environ["GATEHOUSE_OUTER_VERDICT"] == "/tmp/a.py:/tmp/b.py"
+
 
 class TestFindSchemaPath:
     """Tests for schema discovery."""
@@ -166,3 +177,12 @@ class TestActivateDeactivate:
             assert removed is True
             hook_count = sum(1 for f in sys.meta_path if isinstance(f, GatehouseImportHook))
             assert hook_count == 0
+
+    def test_import_defers_engine(self):
+        """Importing the hook module does not load the rule engine."""
+        code = (
+            "import sys, gatehouse.auto; "
+            "sys.exit('gatehouse.engine' in sys.modules)"
+        )
+        proc = subprocess.run([sys.executable, "-c", code])
+        assert proc.returncode == 0
@@ -4,10 +4,14 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from gatehouse.lib import checks as checks_module
 from gatehouse.lib.analyzer import SourceAnalyzer
 from gatehouse.lib.checks import (
+    bind_check,
     check_ast_check,
     check_ast_node_exists,
+    check_cost,
+    check_custom,
     check_file_metric,
     check_pattern_exists,
     check_token_scan,
@@ -38,6 +42,36 @@ class TestCheckPatternExists:
         result = check_pattern_exists(analyzer, {"pattern": "if_name_main"}, {})
         assert len(result) == 1
 
+    def test_anywhere_matches_substring_or_regex(self):
+        """'anywhere' values match as plain text first, then as a regex."""
+        analyzer = _analyzer("import torch\nmodel = Net()\n")
+        literal = {"pattern": "custom", "value": "Net()", "location": "anywhere"}
+        regex = {"pattern": "custom", "value": r"(?m)^import \w+$", "location": "anywhere"}
+        missing = {"pattern": "custom", "value": "[unclosed", "location": "anywhere"}
+        assert check_pattern_exists(analyzer, literal, {}) == []
+        assert check_pattern_exists(analyzer, regex, {}) == []
+        assert len(check_pattern_exists(analyzer, missing, {})) == 1
+
+
+    def test_first_non_empty_line_skips_blank_lines(self):
+        """Leading blank lines are skipped and the line number is kept."""
+        check = {"pattern": "custom", "value": "#!", "location": "first_non_empty_line"}
+        assert check_pattern_exists(_analyzer("\n  \n#!/usr/bin/env python\n"), check, {}) == []
+        result = check_pattern_exists(_analyzer("\n\nimport os  \n"), check, {})
+        assert result == [{"line": 3, "source": "import os"}]
+
+    def test_header_required_substrings_ignore_placeholders(self):
+        """Only the text before a {placeholder} must appear in the header."""
+        check = {
+            "pattern": "comment_block_starting_with",
+            "value": "# ===",
+            "required_substrings": ["# FILE: {filename}", "# PURPOSE:"],
+        }
+        good = _analyzer("# ===\n# FILE: a.py\n# PURPOSE: demo\nx = 1\n")
+        missing = _analyzer("# ===\n# FILE: a.py\nx = 1\n")
+        assert check_pattern_exists(good, check, {}) == []
+        assert len(check_pattern_exists(missing, check, {})) == 1
+
 
 class TestCheckAstNodeExists:
     """Tests for the ast_node_exists check type."""
@@ -79,6 +113,59 @@ class TestCheckAstCheck:
         assert len(result) == 1
         assert result[0]["function_name"] == "foo"
 
+    def test_decorated_functions_match_dotted_patterns(self):
+        """Dotted decorator patterns match route decorators, called or not."""
+        source = (
+            "@app.get('/a')\n"
+            "def a():\n"
+            "    pass\n"
+            "@cache\n"
+            "def b():\n"
+            "    pass\n"
+            "@api.app.post\n"
+            "def c():\n"
+            "    \"\"\"Doc.\"\"\"\n"
+        )
+        analyzer = _analyzer(source)
+        result = check_ast_check(
+            analyzer,
+            {
+                "check": "decorated_functions_have_docstrings",
+                "decorator_pattern": ["app.get", "app.post"],
+            },
+            {},
+        )
+        assert [v["function_name"] for v in result] == ["a"]
+
+    def test_decorator_patterns_match_literally(self):
+        """Pattern characters such as '.' never act as regex wildcards."""
+        source = "@appxget\ndef a():\n    pass\n"
+        analyzer = _analyzer(source)
+        result = check_ast_check(
+            analyzer,
+            {
+                "check": "decorated_functions_have_docstrings",
+                "decorator_pattern": ["app.get"],
+            },
+            {},
+        )
+        assert result == []
+
+    def test_for_loops_without_progress(self):
+        """Loops over track()/tqdm() pass; nested bare loops are flagged."""
+        source = (
+            "for a in tqdm(items):\n"
+            "    for b in a.children:\n"
+            "        pass\n"
+            "for c in progress.track(rows):\n"
+            "    pass\n"
+        )
+        analyzer = _analyzer(source)
+        result = check_ast_check(
+            analyzer, {"check": "for_loops_without_progress"}, {}
+        )
+        assert [v["line"] for v in result] == [2]
+
 
 class TestCheckTokenScan:
     """Tests for the token_scan check type."""
@@ -105,6 +192,67 @@ class TestCheckTokenScan:
         )
         assert result == []
 
+    def test_safe_values_match_exact_type(self):
+        """An int safe value never exempts a bool, nor the reverse."""
+        source = 'def train():\n    a = True\n    b = 1\n    c = -1\n'
+        analyzer = _analyzer(source)
+        result = check_token_scan(
+            analyzer,
+            {"scan": "hardcoded_literals", "safe_values": [1, False, -1], "safe_contexts": []},
+            {},
+        )
+        assert [(v["line"], v["value_type"]) for v in result] == [(2, "boolean")]
+
+    def test_log_calls_with_forbidden_strings(self):
+        """Only logging lines that contain a forbidden string are flagged."""
+        source = (
+            'password = "x"\n'
+            'logger.info("Password is %s", password)\n'
+            'print("token ok")\n'
+        )
+        analyzer = _analyzer(source)
+        result = check_token_scan(
+            analyzer,
+            {"scan": "log_calls_containing", "forbidden_strings": ["password", "secret"]},
+            {},
+        )
+        assert [(v["line"], v["value"]) for v in result] == [(2, "password")]
+
+    def test_log_calls_without_automaton(self, monkeypatch):
+        """The str.find fallback flags the same lines as the automaton."""
+        source = (
+            'log.info("pass")\n'
+            'x = "password"\n'
+            'logger.warning("my password")\n'
+        )
+        check = {"scan": "log_calls_containing", "forbidden_strings": ["password", "pass"]}
+        expected = [(1, "pass"), (3, "password"), (3, "pass")]
+        result = check_token_scan(_analyzer(source), check, {})
+        assert [(v["line"], v["value"]) for v in result] == expected
+        monkeypatch.setattr(checks_module, "_ahocorasick", None)
+        result = check_token_scan(_analyzer(source), check, {})
+        assert [(v["line"], v["value"]) for v in result] == expected
+
+    def test_log_call_lines_with_crlf_endings(self):
+        """Reported lines and sources are right for CRLF files."""
+        source = (
+            'x = 1\r\n'
+            'log.info("secret and password")\r\n'
+            'y = "secret"\r\n'
+            'print(secret)'
+        )
+        analyzer = _analyzer(source)
+        result = check_token_scan(
+            analyzer,
+            {"scan": "log_calls_containing", "forbidden_strings": ["password", "secret"]},
+            {},
+        )
+        assert [(v["line"], v["value"], v["source"]) for v in result] == [
+            (2, "password", 'log.info("secret and password")'),
+            (2, "secret", 'log.info("secret and password")'),
+            (4, "secret", "print(secret)"),
+        ]
+
 
 class TestCheckUppercaseAssignments:
     """Tests for the uppercase_assignments_exist check type."""
@@ -144,3 +292,64 @@ class TestCheckFileMetric:
             analyzer, {"metric": "line_count", "max_lines": 100}, {}
         )
         assert len(result) == 1
+
+
+class TestCheckCustom:
+    """Tests for the custom (plugin) check type."""
+
+    def test_inline_expression_is_never_evaluated(self, capsys):
+        """Inline expressions are ignored, with the notice shown at most once."""
+        analyzer = _analyzer("x = 1\n")
+        cfg = {"expression": "__import__('os').getcwd()"}
+        for _ in range(3):
+            assert check_custom(analyzer, cfg, {}, Path(".")) == []
+        assert capsys.readouterr().err.count("disabled") <= 1
+
+    def test_plugin_module_is_loaded_once(self, tmp_path):
+        """A plugin is executed once and reloaded only when the file changes."""
+        marker = tmp_path / "loads.txt"
+        plugin = tmp_path / "counting.py"
+        plugin.write_text(
+            f"with open({str(marker)!r}, 'a') as fh:\n"
+            "    fh.write('x')\n"
+            "def check(analyzer):\n"
+            "    return []\n"
+        )
+        analyzer = _analyzer("x = 1\n")
+        cfg = {"plugin": str(plugin)}
+        check_custom(analyzer, cfg, {}, tmp_path)
+        check_custom(analyzer, cfg, {}, tmp_path)
+        assert marker.read_text() == "x"
+        plugin.write_text(plugin.read_text() + "# edited\n")
+        check_custom(analyzer, cfg, {}, tmp_path)
+        assert marker.read_text() == "xx"
+
+
+class TestBindCheck:
+    """Tests for resolving a rule's check once with its config bound."""
+
+    def test_bound_check_matches_run_check(self):
+        """A bound check gives the same result as run_check."""
+        rule_obj = {
+            "id": "main-guard",
+            "rule_data": {"check": {"type": "pattern_exists", "pattern": "if_name_main"}},
+            "params": {},
+        }
+        analyzer = _analyzer("x = 1\n")
+        check = bind_check(rule_obj, Path("."))
+        assert check is not None
+        assert check(analyzer) == run_check(rule_obj, analyzer, Path("."))
+
+    def test_unknown_check_type(self):
+        """An unknown check type binds to None."""
+        rule_obj = {"id": "bogus", "rule_data": {"check": {"type": "bogus"}}}
+        assert bind_check(rule_obj, Path(".")) is None
+
+    def test_check_cost_orders_cheap_types_first(self):
+        """Source-text checks cost less than CST checks and plugins."""
+        def rule(check_type):
+            return {"rule_data": {"check": {"type": check_type}}}
+
+        assert check_cost(rule("pattern_exists")) < check_cost(rule("ast_check"))
+        assert check_cost(rule("ast_check")) < check_cost(rule("custom"))
+        assert check_cost(rule("bogus")) == check_cost(rule("custom"))
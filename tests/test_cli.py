@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import subprocess
 import sys
 from pathlib import Path
@@ -68,3 +69,41 @@ class TestCLIEntryPoint:
             timeout=10,
         )
         assert result.returncode == 0
+
+    def test_scan_subcommand_exit_codes(self, tmp_project, passing_source) -> None:
+        """'scan' exits non-zero for rejected or unreadable files, 0 otherwise."""
+        src = tmp_project / "src"
+        src.mkdir()
+        (src / "clean.py").write_text(passing_source, encoding="utf-8")
+        (src / "bad.py").write_text("x = 1\n", encoding="utf-8")
+        base = [PYTHON, "-m", CLI_MODULE, "scan", "--jobs", "1"]
+        ok = subprocess.run(
+            [*base, "src/clean.py"],
+            capture_output=True, text=True, timeout=30, cwd=tmp_project,
+        )
+        rejected = subprocess.run(
+            [*base, "src/*.py"],
+            capture_output=True, text=True, timeout=30, cwd=tmp_project,
+        )
+        missing = subprocess.run(
+            [*base, "src/clean.py", "src/nope.py"],
+            capture_output=True, text=True, timeout=30, cwd=tmp_project,
+        )
+        no_match = subprocess.run(
+            [*base, "nomatch/*.py"],
+            capture_output=True, text=True, timeout=30, cwd=tmp_project,
+        )
+        as_json = subprocess.run(
+            [*base, "--format", "json", "src/clean.py", "src/bad.py"],
+            capture_output=True, text=True, timeout=30, cwd=tmp_project,
+        )
+        assert ok.returncode == 0
+        assert rejected.returncode != 0
+        assert "src/bad.py" in rejected.stderr
+        for failed in (missing, no_match):
+            assert failed.returncode != 0
+            assert "Traceback" not in failed.stderr
+        assert "src/nope.py" in missing.stderr
+        assert "nomatch/*.py" in no_match.stderr
+        reports = json.loads(as_json.stderr)
+        assert [r["file"] for r in reports] == ["src/clean.py", "src/bad.py"]
@@ -53,6 +53,21 @@ class TestGet:
         with pytest.raises(KeyError):
             config.get("")
 
+    def test_resolved_keys_follow_reset(self) -> None:
+        """Memoized lookups come from the snapshot loaded after reset()."""
+        before = config.get("statuses")
+        config.reset()
+        after = config.get("statuses")
+        assert after is config.load_defaults()["statuses"]
+        assert after is not before
+
+    def test_every_nested_key_is_indexed_on_load(self) -> None:
+        """Loading indexes nested values so lookups need no walk."""
+        config.reset()
+        data = config.load_defaults()
+        assert config._RESOLVED["statuses.passed"] == data["statuses"]["passed"]
+        assert config._RESOLVED["statuses"] is data["statuses"]
+
 
 class TestTypedAccessors:
     """Tests for get_str, get_int, get_list."""
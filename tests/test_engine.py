@@ -2,13 +2,23 @@
 
 from __future__ import annotations
 
+import json
 import os
+import time
 from pathlib import Path
 
 import pytest
 
-from gatehouse.engine import ScanResult, scan_file
+from gatehouse import engine
+from gatehouse.engine import (
+    ScanResult,
+    _run_rule,
+    expand_paths,
+    scan_file,
+    scan_files,
+)
 from gatehouse.exceptions import GatehouseParseError
+from gatehouse.lib.analyzer import SourceAnalyzer, clear_cache
 
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
@@ -102,6 +112,15 @@ class TestScanFileEdgeCases:
         result = scan_file("x = 1\n", "test.py", "/nonexistent/schema.yaml")
         assert result.status == "passed"
 
+    def test_missing_schema_warns_once(self, tmp_project, capsys):
+        """An unknown schema is reported once, then passes silently."""
+        schema_file = tmp_project / ".gate_schema.yaml"
+        schema_file.write_text("schema: no-such-schema-warn-once\n")
+        for _ in range(2):
+            result = scan_file("x = 1\n", "src/x.py", str(schema_file))
+            assert result.status == "passed"
+        assert capsys.readouterr().err.count("no-such-schema-warn-once") == 1
+
     def test_scan_result_has_timing(self, tmp_project, passing_source):
         """ScanResult includes scan_ms timing."""
         schema_path = str(tmp_project / ".gate_schema.yaml")
@@ -123,3 +142,245 @@ class TestScanFileEdgeCases:
             skip_scope=True,
         )
         assert result.schema_name == "production"
+
+    def test_fail_fast_stops_at_first_blocking_rule(self, tmp_project):
+        """fail_fast reports violations from a single blocking rule only."""
+        source = "x = 1\n"
+        schema_path = str(tmp_project / ".gate_schema.yaml")
+        full = scan_file(source, "src/x.py", schema_path, skip_scope=True)
+        fast = scan_file(
+            source, "src/x.py", schema_path, skip_scope=True, fail_fast=True
+        )
+        assert len({v.rule_id for v in full.violations}) > 1
+        assert fast.status == "rejected"
+        assert len({v.rule_id for v in fast.violations}) == 1
+
+    def test_parallel_matches_sequential(self, tmp_project, failing_hardcoded_source):
+        """Threaded rule evaluation yields the same violations in order."""
+        schema_path = str(tmp_project / ".gate_schema.yaml")
+        seq = scan_file(
+            failing_hardcoded_source, "src/h.py", schema_path, skip_scope=True
+        )
+        # Drop the shared parse so the threaded run evaluates every rule
+        # instead of reusing the sequential run's outcomes.
+        clear_cache()
+        par = scan_file(
+            failing_hardcoded_source, "src/h.py", schema_path,
+            skip_scope=True, parallel=4,
+        )
+        assert par.violations == seq.violations
+        assert par.blocking_count == seq.blocking_count
+
+    def test_json_output_matches_stderr_violations(
+        self, tmp_project, failing_hardcoded_source
+    ):
+        """JSON mode builds the same structured violations as stderr mode."""
+        schema_path = str(tmp_project / ".gate_schema.yaml")
+        text = scan_file(
+            failing_hardcoded_source, "src/h.py", schema_path, skip_scope=True
+        )
+        as_json = scan_file(
+            failing_hardcoded_source, "src/h.py", schema_path,
+            output_format="json", skip_scope=True,
+        )
+        assert as_json.violations == text.violations
+
+    def test_clean_file_json_names_file(self, tmp_project, passing_source, capsys):
+        """A clean file's JSON report still carries its filepath."""
+        schema_path = str(tmp_project / ".gate_schema.yaml")
+        scan_file(
+            passing_source, "src/clean.py", schema_path,
+            output_format="json", skip_scope=True,
+        )
+        report = json.loads(capsys.readouterr().err)
+        assert report["file"] == "src/clean.py"
+        assert report["violations"] == []
+
+    def test_bytes_source_matches_text(self, tmp_project, failing_hardcoded_source):
+        """Undecoded bytes scan exactly like the equivalent text."""
+        schema_path = str(tmp_project / ".gate_schema.yaml")
+        text = scan_file(
+            failing_hardcoded_source, "src/h.py", schema_path, skip_scope=True
+        )
+        raw = scan_file(
+            failing_hardcoded_source.encode("utf-8"), "src/h.py", schema_path,
+            skip_scope=True,
+        )
+        assert raw.violations == text.violations
+
+    def test_unchanged_content_reuses_rule_outcomes(
+        self, tmp_project, failing_hardcoded_source, monkeypatch
+    ):
+        """A rescan of identical content skips rule evaluation, per path."""
+        schema_path = str(tmp_project / ".gate_schema.yaml")
+        calls = []
+        evaluate = engine._evaluate_rules
+
+        def counting(*args, **kwargs):
+            calls.append(1)
+            return evaluate(*args, **kwargs)
+
+        monkeypatch.setattr(engine, "_evaluate_rules", counting)
+        clear_cache()
+        first = scan_file(
+            failing_hardcoded_source, "src/h.py", schema_path, skip_scope=True
+        )
+        again = scan_file(
+            failing_hardcoded_source, "src/h.py", schema_path, skip_scope=True
+        )
+        assert again.violations == first.violations
+        assert len(calls) == 1
+        scan_file(
+            failing_hardcoded_source, "src/other.py", schema_path, skip_scope=True
+        )
+        assert len(calls) == 2
+
+    def test_plugin_rules_are_not_replayed(self, tmp_path, monkeypatch):
+        """Editing a plugin changes the outcome of rescanning the same file."""
+        home = tmp_path / "home"
+        for sub in ("rules", "schemas", "plugins"):
+            (home / sub).mkdir(parents=True)
+        (home / "schemas" / "s.yaml").write_text("rules:\n  - id: p\n")
+        (home / "rules" / "p.yaml").write_text(
+            "check:\n  type: custom\n  plugin: p.py\n"
+            "error:\n  message: plugin says no\n"
+        )
+        plugin = home / "plugins" / "p.py"
+        plugin.write_text("def check(analyzer):\n    return []\n")
+        schema_file = tmp_path / ".gate_schema.yaml"
+        schema_file.write_text("schema: s\n")
+        monkeypatch.setenv("GATE_HOME", str(home))
+        source = "x = 1\n"
+
+        first = scan_file(source, "a.py", str(schema_file), skip_scope=True)
+        plugin.write_text(
+            "def check(analyzer):\n    return [{'line': 1}]\n# edited\n"
+        )
+        again = scan_file(source, "a.py", str(schema_file), skip_scope=True)
+
+        assert first.violations == []
+        assert [v.message for v in again.violations] == ["plugin says no"]
+
+
+class TestScanFiles:
+    """Tests for scanning several files on disk."""
+
+    def test_workers_match_in_process_scan(
+        self, tmp_project, passing_source, failing_hardcoded_source, capsys
+    ):
+        """Worker processes return the same results, in input order."""
+        schema_path = str(tmp_project / ".gate_schema.yaml")
+        clean = tmp_project / "clean.py"
+        clean.write_text(passing_source, encoding="utf-8")
+        broken = tmp_project / "broken.py"
+        broken.write_text("def f(:\n", encoding="utf-8")
+        hard = tmp_project / "hard.py"
+        hard.write_text(failing_hardcoded_source, encoding="utf-8")
+        paths = [str(hard), str(clean), str(broken)]
+
+        serial = scan_files(paths, schema_path, skip_scope=True)
+        serial_err = capsys.readouterr().err
+        pooled = scan_files(paths, schema_path, skip_scope=True, workers=2)
+        pooled_err = capsys.readouterr().err
+
+        assert pooled_err == serial_err
+        assert [r and r.violations for r in pooled] == [
+            r and r.violations for r in serial
+        ]
+        assert serial[0].blocking_count > 0
+        assert serial[1].blocking_count == 0
+        assert serial[2] is None
+
+    def test_unreadable_paths_are_reported(self, tmp_project, passing_source, capsys):
+        """Missing files, unmatched globs and directories fail only themselves."""
+        schema_path = str(tmp_project / ".gate_schema.yaml")
+        clean = tmp_project / "clean.py"
+        clean.write_text(passing_source, encoding="utf-8")
+        missing = str(tmp_project / "missing.py")
+        no_match = str(tmp_project / "nomatch" / "*.py")
+        paths = expand_paths([str(clean), missing, no_match, str(tmp_project)])
+
+        results = scan_files(paths, schema_path, skip_scope=True)
+
+        err = capsys.readouterr().err
+        assert results[0].blocking_count == 0
+        assert results[1:] == [None, None, None]
+        assert missing in err
+        assert no_match in err
+
+    def test_json_batch_output_parses(
+        self, tmp_project, passing_source, failing_hardcoded_source, capsys
+    ):
+        """Multi-file JSON output is one array, errors included."""
+        schema_path = str(tmp_project / ".gate_schema.yaml")
+        clean = tmp_project / "clean.py"
+        clean.write_text(passing_source, encoding="utf-8")
+        hard = tmp_project / "hard.py"
+        hard.write_text(failing_hardcoded_source, encoding="utf-8")
+        missing = str(tmp_project / "missing.py")
+        paths = [str(clean), str(hard), missing]
+
+        scan_files(
+            paths, schema_path, output_format="json", skip_scope=True, workers=2
+        )
+
+        reports = json.loads(capsys.readouterr().err)
+        assert [r["file"] for r in reports] == paths
+        assert [r["status"] for r in reports] == ["passed", "rejected", "error"]
+
+    def test_workers_write_every_log_entry(self, tmp_path, passing_source):
+        """Each worker-process scan leaves its log line on disk."""
+        log_dir = tmp_path / "logs"
+        schema_file = tmp_path / ".gate_schema.yaml"
+        schema_file.write_text(
+            "schema: production\n"
+            f"logging:\n  enabled: true\n  directory: {log_dir}\n",
+            encoding="utf-8",
+        )
+        paths = []
+        for i in range(5):
+            path = tmp_path / f"mod_{i}.py"
+            path.write_text(passing_source, encoding="utf-8")
+            paths.append(str(path))
+
+        scan_files(paths, str(schema_file), skip_scope=True, workers=2)
+
+        lines = (log_dir / "violations.jsonl").read_text().splitlines()
+        assert sorted(json.loads(l)["file"] for l in lines) == sorted(paths)
+
+
+class TestRunRule:
+    """Tests for per-rule check execution."""
+
+    def test_exception_is_buffered_not_written(self, capsys):
+        """A raising check yields a violation and a buffered diagnostic."""
+        def boom(analyzer):
+            raise RuntimeError("bad check")
+
+        diagnostics: list[str] = []
+        result = _run_rule({"id": "r1"}, boom, None, diagnostics)
+        assert len(result) == 1
+        assert len(diagnostics) == 1
+        assert "r1" in diagnostics[0]
+        assert capsys.readouterr().err == ""
+
+    def test_parallel_diagnostics_keep_rule_order(self, monkeypatch):
+        """Threaded rules report their errors in rule order, not finish order."""
+        rules = tuple(
+            {"id": f"r{i}", "severity": "warn", "delay": (8 - i) * 0.005}
+            for i in range(8)
+        )
+
+        def bind(rule_obj, gate_home):
+            def check(analyzer):
+                time.sleep(rule_obj["delay"])
+                raise RuntimeError(rule_obj["id"])
+            return check
+
+        monkeypatch.setattr(engine, "bind_check", bind)
+        analyzer = SourceAnalyzer("x = 1\n", "a.py")
+        _, _, diagnostics = engine._evaluate_rules(
+            rules, Path("."), analyzer,
+            fail_fast=False, parallel=8, sev_block="block",
+        )
+        assert [d.split("'")[1] for d in diagnostics] == [r["id"] for r in rules]
@@ -28,6 +28,19 @@ class TestGatehouseViolationError:
         err = GatehouseViolationError("test.py", [], schema_name="production")
         assert err.schema_name == "production"
 
+    def test_fix_shows_first_line_only(self):
+        """Only the first line of a multi-line fix is included."""
+        err = GatehouseViolationError(
+            "test.py", [{"line": 1, "message": "m", "fix": "  add it\nthen more\n"}]
+        )
+        assert "add it" in str(err)
+        assert "then more" not in str(err)
+
+    def test_blank_fix_is_omitted(self):
+        """A whitespace-only fix adds no fix line."""
+        err = GatehouseViolationError("test.py", [{"line": 1, "message": "m", "fix": "  "}])
+        assert "Fix:" not in str(err)
+
 
 class TestGatehouseParseError:
     """Tests for the parse error exception."""
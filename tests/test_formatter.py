@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 from gatehouse.lib.formatter import (
+    compile_template,
     format_summary_stderr,
+    format_violation_stderr,
     format_violation_traceback,
     format_violations_json,
     inject_variables,
+    render_template,
 )
 
 
@@ -28,6 +31,57 @@ class TestInjectVariables:
         result = inject_variables("{unknown} text", {})
         assert result == "{unknown} text"
 
+    def test_substituted_values_are_not_rescanned(self):
+        """A value containing a placeholder is inserted literally."""
+        result = inject_variables("{a} {b}", {"a": "{b}", "b": "x"})
+        assert result == "{b} x"
+
+    def test_non_identifier_braces_are_literal(self):
+        """Braces around non-identifiers are left untouched."""
+        result = inject_variables('use {"k": 1} in {filename}', {"filename": "a.py"})
+        assert result == 'use {"k": 1} in a.py'
+
+    def test_overrides_take_precedence(self):
+        """Override values shadow variables; other keys fall through."""
+        variables = {"line": 1, "filename": "a.py"}
+        result = inject_variables("{filename}:{line}", variables, overrides={"line": 7})
+        assert result == "a.py:7"
+        assert variables == {"line": 1, "filename": "a.py"}
+
+    def test_compiled_template_renders_like_inject(self):
+        """A template compiled once renders the same as inject_variables."""
+        template = "{filename}:{line} {unknown}"
+        segments = compile_template(template)
+        for line in (1, 2):
+            assert render_template(
+                segments, {"filename": "a.py"}, overrides={"line": line}
+            ) == inject_variables(template, {"filename": "a.py", "line": line})
+
+
+class TestFormatViolationStderr:
+    """Tests for single-violation stderr formatting."""
+
+    def test_prerendered_text_matches_templates(self):
+        """Passing rendered message/fix gives the same output as templates."""
+        rule = {
+            "id": "r",
+            "rule_data": {"error": {"message": "Bad {filename}", "fix": "Fix line {line}"}},
+        }
+        v = {"line": 3, "source": "x = 1"}
+        variables = {"filepath": "src/a.py", "filename": "a.py"}
+        expected = format_violation_stderr(rule, v, variables)
+        got = format_violation_stderr(
+            rule, v, variables, message="Bad a.py", fix="Fix line 3"
+        )
+        assert got == expected
+        assert "Bad a.py" in got
+
+    def test_blank_fix_adds_no_fix_line(self):
+        """A whitespace-only fix hint is skipped instead of raising."""
+        rule = {"id": "r", "rule_data": {"error": {"message": "m", "fix": "  \n"}}}
+        out = format_violation_stderr(rule, {"line": 1}, {"filepath": "a.py"})
+        assert "Fix:" not in out
+
 
 class TestFormatViolationsJson:
     """Tests for JSON output formatting."""
@@ -66,6 +120,23 @@ class TestFormatViolationsJson:
         assert result["status"] == "passed"
         assert result["summary"]["warnings"] == 1
 
+    def test_violation_fields_shadow_variables(self):
+        """Violation fields win over file variables and leave them intact."""
+        rule_obj = {
+            "id": "test-rule",
+            "severity": "warn",
+            "rule_data": {"error": {"message": "{name} in {filepath}", "fix": ""}},
+        }
+        variables = {"filepath": "test.py", "name": "file"}
+        result = format_violations_json(
+            [(rule_obj, [{"line": 1, "name": "foo"}])],
+            variables,
+            "production",
+            "1.0.0",
+        )
+        assert result["violations"][0]["message"] == "foo in test.py"
+        assert variables == {"filepath": "test.py", "name": "file"}
+
 
 class TestFormatViolationTraceback:
     """Tests for SyntaxError-style traceback formatting."""
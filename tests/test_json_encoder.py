@@ -0,0 +1,37 @@
+"""Unit tests for gatehouse.lib.json_encoder serialization."""
+
+from __future__ import annotations
+
+import json
+
+from gatehouse.lib import json_encoder
+
+
+class TestDumps:
+    """Tests for the JSON serializer wrapper."""
+
+    def test_indented_matches_stdlib(self):
+        """Two-space output matches json.dumps regardless of backend."""
+        data = {"status": "rejected", "violations": [{"line": 3, "fix": ""}]}
+        assert json_encoder.dumps(data, indent=2) == json.dumps(data, indent=2)
+
+    def test_other_indent_uses_stdlib_layout(self):
+        """Indent widths orjson cannot produce still honour the request."""
+        data = {"a": [1, 2]}
+        assert json_encoder.dumps(data, indent=4) == json.dumps(data, indent=4)
+
+    def test_non_ascii_is_not_escaped(self):
+        """Non-ASCII text is emitted as-is by every backend."""
+        assert json_encoder.dumps({"k": "café"}, indent=2).count("é") == 1
+
+    def test_round_trip_large_int(self):
+        """Values outside orjson's integer range fall back cleanly."""
+        data = {"n": 2 ** 70}
+        assert json.loads(json_encoder.dumps(data, indent=2)) == data
+
+    def test_compact_separators_match_stdlib(self):
+        """The JSONL log layout is identical across backends."""
+        data = {"file": "src/a.py", "violations": [{"line": 1}], "ok": True}
+        expected = json.dumps(data, separators=(",", ":"))
+        assert json_encoder.dumps(data, separators=(",", ":")) == expected
+
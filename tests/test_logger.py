@@ -0,0 +1,78 @@
+"""Unit tests for gatehouse.lib.logger scan telemetry."""
+
+from __future__ import annotations
+
+import datetime
+import json
+
+from gatehouse.lib.logger import log_scan
+
+
+def _log(log_dir, status):
+    log_scan(
+        str(log_dir), "src/a.py", "production", "1.0.0", status,
+        [], ["rule-a"], 1, "x = 1\n", 3,
+    )
+
+
+class TestLogScan:
+    """Tests for JSONL scan log writing."""
+
+    def test_entries_are_visible_after_flush(self, tmp_path):
+        """Entries reach the file in the order they were logged."""
+        log_dir = tmp_path / "logs"
+        _log(log_dir, "passed")
+        _log(log_dir, "rejected")
+        lines = (log_dir / "violations.jsonl").read_text().splitlines()
+        assert [json.loads(l)["status"] for l in lines] == ["passed", "rejected"]
+
+    def test_empty_log_dir_is_noop(self, tmp_path):
+        """An empty log directory disables logging."""
+        _log("", "passed")
+        assert list(tmp_path.iterdir()) == []
+
+    def test_bytes_and_text_hash_alike(self, tmp_path):
+        """UTF-8 bytes and the equivalent text log the same code hash."""
+        log_dir = tmp_path / "logs"
+        for source in ("x = 'é'\n", "x = 'é'\n".encode("utf-8")):
+            log_scan(
+                str(log_dir), "a.py", "s", "1", "passed", [], [], 0, source, 1,
+            )
+        lines = (log_dir / "violations.jsonl").read_text().splitlines()
+        hashes = {json.loads(l)["code_hash"] for l in lines}
+        counts = {json.loads(l)["code_length_lines"] for l in lines}
+        assert len(hashes) == 1
+        assert counts == {1}
+
+    def test_timestamp_is_utc_iso8601(self, tmp_path):
+        """Timestamps parse as ISO 8601 UTC with microseconds and a Z suffix."""
+        log_dir = tmp_path / "logs"
+        _log(log_dir, "passed")
+        stamp = json.loads((log_dir / "violations.jsonl").read_text())["timestamp"]
+        assert stamp.endswith("Z")
+        parsed = datetime.datetime.fromisoformat(stamp[:-1] + "+00:00")
+        now = datetime.datetime.now(datetime.timezone.utc)
+        assert abs((now - parsed).total_seconds()) < 60
+
+    def test_line_count_matches_splitlines(self, tmp_path):
+        """Text and bytes count like str.splitlines() on the text."""
+        log_dir = tmp_path / "logs"
+        sources = ["", "a", "a\nb", "a\nb\n", "a\r\nb", "a\rb\n", "a\x0cb"]
+        for source in sources:
+            for value in (source, source.encode()):
+                log_scan(
+                    str(log_dir), "a.py", "s", "1", "passed", [], [], 0, value, 1,
+                )
+        lines = (log_dir / "violations.jsonl").read_text().splitlines()
+        counts = [json.loads(l)["code_length_lines"] for l in lines]
+        assert counts == [len(s.splitlines()) for s in sources for _ in (0, 1)]
+
+    def test_form_feed_bytes_count_like_text(self, tmp_path):
+        """A form feed splits bytes sources the way it splits the text."""
+        log_dir = tmp_path / "logs"
+        for value in ("a\x0cb\n", b"a\x0cb\n", "é\x0cb".encode()):
+            log_scan(
+                str(log_dir), "a.py", "s", "1", "passed", [], [], 0, value, 1,
+            )
+        lines = (log_dir / "violations.jsonl").read_text().splitlines()
+        assert [json.loads(l)["code_length_lines"] for l in lines] == [2, 2, 2]
@@ -3,27 +3,57 @@
 from __future__ import annotations
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
 from gatehouse.engine import scan_file
+from gatehouse.lib import config
+from gatehouse.lib.analyzer import clear_cache
 
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 PASSING_DIR = FIXTURES_DIR / "passing"
 
-MAX_SCAN_MS = 2000
+# Limits apply after a warm-up scan, so they bound steady-state cost rather
+# than one-time imports, YAML parsing and regex compilation.
+MAX_SCAN_MS = 200
+MAX_REPEAT_SCAN_MS = 100
+
+
+@pytest.fixture(scope="module")
+def clean_source() -> str:
+    """Read the clean production fixture once for the whole module."""
+    return (PASSING_DIR / "clean_production.py").read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="module")
+def schema_path(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Write one project schema shared by every timing test."""
+    project = tmp_path_factory.mktemp("perf_project")
+    schema_file = project / ".gate_schema.yaml"
+    schema_file.write_text(
+        "schema: production\nrule_overrides: {}\nlogging:\n  enabled: false\n",
+        encoding="utf-8",
+    )
+    return str(schema_file)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def warm_scan(clean_source: str, schema_path: str) -> None:
+    """Run one untimed scan so caches are populated before timing."""
+    scan_file(clean_source, "warmup.py", schema_path, skip_scope=True)
 
 
 class TestScanPerformance:
     """Timing guard tests for scan_file."""
 
-    def test_single_file_under_threshold(self, tmp_project: Path) -> None:
+    def test_single_file_under_threshold(
+        self, clean_source: str, schema_path: str
+    ) -> None:
         """A single clean file scans in under MAX_SCAN_MS."""
-        source = (PASSING_DIR / "clean_production.py").read_text(encoding="utf-8")
-        schema_path = str(tmp_project / ".gate_schema.yaml")
-
+        source = clean_source
         start = time.perf_counter()
         result = scan_file(source, "perf_test.py", schema_path, skip_scope=True)
         elapsed_ms = (time.perf_counter() - start) * 1000
@@ -33,18 +63,44 @@ class TestScanPerformance:
         )
         assert result.scan_ms >= 0
 
-    def test_repeated_scans_stable(self, tmp_project: Path) -> None:
+    def test_repeated_scans_stable(
+        self, clean_source: str, schema_path: str
+    ) -> None:
         """Running scan_file 10 times does not degrade performance."""
-        source = (PASSING_DIR / "clean_production.py").read_text(encoding="utf-8")
-        schema_path = str(tmp_project / ".gate_schema.yaml")
+        source = clean_source
         iterations = 10
 
+        # Distinct paths and a cleared parse cache make every iteration
+        # parse and evaluate rules instead of replaying a memoized result.
         start = time.perf_counter()
-        for _ in range(iterations):
-            scan_file(source, "perf_test.py", schema_path, skip_scope=True)
+        for i in range(iterations):
+            clear_cache()
+            scan_file(source, f"perf_repeat_{i}.py", schema_path, skip_scope=True)
         total_ms = (time.perf_counter() - start) * 1000
 
         per_scan = total_ms / iterations
-        assert per_scan < MAX_SCAN_MS, (
+        assert per_scan < MAX_REPEAT_SCAN_MS, (
             f"Average scan took {per_scan:.1f}ms over {iterations} runs"
         )
+
+    def test_thread_parallel_scans(
+        self, clean_source: str, schema_path: str
+    ) -> None:
+        """Concurrent scans from a thread pool agree and stay within budget."""
+        iterations = 40
+
+        def scan(i: int) -> str:
+            return scan_file(
+                clean_source, f"perf_thread_{i}.py", schema_path, skip_scope=True
+            ).status
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            statuses = list(pool.map(scan, range(iterations)))
+        total_ms = (time.perf_counter() - start) * 1000
+
+        assert statuses == [config.get_str("statuses.passed")] * iterations
+        per_scan = total_ms / iterations
+        assert per_scan < MAX_REPEAT_SCAN_MS, (
+            f"Average threaded scan took {per_scan:.1f}ms over {iterations} runs"
+        )
@@ -6,7 +6,9 @@ from pathlib import Path
 
 from gatehouse.lib.rules import (
     apply_project_overrides,
+    dedupe_rules,
     find_gate_home,
+    get_active_rules,
     load_project_config,
     load_rule,
     load_schema,
@@ -94,6 +96,47 @@ class TestResolveRules:
         assert "file-header" in rule_ids
         assert "route-docstrings" in rule_ids
 
+    def test_child_override_keeps_parent_position(self, tmp_path):
+        """A child entry for an inherited rule replaces it in place."""
+        (tmp_path / "rules").mkdir()
+        (tmp_path / "schemas").mkdir()
+        for rid in ("a", "b", "c"):
+            (tmp_path / "rules" / f"{rid}.yaml").write_text("check:\n  type: file_metric\n")
+        (tmp_path / "schemas" / "base.yaml").write_text("rules: [a, b]\n")
+        (tmp_path / "schemas" / "child.yaml").write_text(
+            "extends: base\nrules:\n  - c\n  - id: a\n    severity: block\n"
+        )
+        rules = resolve_rules(load_schema("child", tmp_path), tmp_path)
+        assert [r["id"] for r in rules] == ["a", "b", "c"]
+        assert rules[0]["severity"] == "block"
+
+    def test_param_overrides_do_not_leak_into_schema(self, tmp_path):
+        """Project param overrides never modify the cached schema data."""
+        (tmp_path / "rules").mkdir()
+        (tmp_path / "schemas").mkdir()
+        (tmp_path / "rules" / "r.yaml").write_text("check:\n  type: file_metric\n")
+        (tmp_path / "schemas" / "s.yaml").write_text(
+            "rules:\n  - id: r\n    params:\n      max: 1\n"
+        )
+        schema = load_schema("s", tmp_path)
+        rules = resolve_rules(schema, tmp_path)
+        apply_project_overrides(rules, {"rule_overrides": {"r": {"params": {"max": 9}}}})
+        fresh = resolve_rules(load_schema("s", tmp_path), tmp_path)
+        assert fresh[0]["params"] == {"max": 1}
+
+
+    def test_null_params_are_empty(self, tmp_path):
+        """A schema entry with 'params:' and no value resolves to no params."""
+        (tmp_path / "rules").mkdir()
+        (tmp_path / "schemas").mkdir()
+        (tmp_path / "rules" / "r.yaml").write_text("check:\n  type: file_metric\n")
+        (tmp_path / "schemas" / "s.yaml").write_text(
+            "rules:\n  - id: r\n    params:\n"
+        )
+        rules = resolve_rules(load_schema("s", tmp_path), tmp_path)
+        assert rules[0]["params"] == {}
+        assert len(dedupe_rules(rules)) == 1
+
 
 class TestApplyProjectOverrides:
     """Tests for project-level rule overrides."""
@@ -118,3 +161,65 @@ class TestApplyProjectOverrides:
         config = {"rule_overrides": {}}
         result = apply_project_overrides(rules, config)
         assert result[0]["severity"] == "block"
+
+
+class TestDedupeRules:
+    """Tests for dropping rules that repeat another rule's check."""
+
+    @staticmethod
+    def _rule(rule_id, severity, params=None):
+        check = {"type": "file_metric", "metric": "line_count"}
+        return {
+            "id": rule_id,
+            "severity": severity,
+            "enabled": True,
+            "params": params or {},
+            "rule_data": {"check": dict(check)},
+        }
+
+    def test_identical_checks_keep_stronger_severity(self, capsys):
+        """The blocking duplicate wins and the skipped rule is reported."""
+        rules = [self._rule("a", "warn"), self._rule("b", "block")]
+        result = dedupe_rules(rules)
+        assert [r["id"] for r in result] == ["b"]
+        assert "'a'" in capsys.readouterr().err
+
+    def test_different_params_are_kept(self):
+        """Rules with the same check but different params both run."""
+        rules = [self._rule("a", "warn", {"max": 1}), self._rule("b", "warn", {"max": 2})]
+        assert [r["id"] for r in dedupe_rules(rules)] == ["a", "b"]
+
+
+
+class TestGetActiveRules:
+    """Tests for the per-schema active rule cache."""
+
+    def _setup(self, tmp_path):
+        (tmp_path / "rules").mkdir()
+        (tmp_path / "schemas").mkdir()
+        for rid in ("a", "b"):
+            (tmp_path / "rules" / f"{rid}.yaml").write_text(
+                f"check:\n  type: file_metric\n  metric: {rid}\n"
+            )
+        (tmp_path / "schemas" / "s.yaml").write_text("rules: [a, b]\n")
+
+    def test_reuses_result_for_same_schema(self, tmp_path):
+        """Repeat calls for an unchanged schema return the cached rules."""
+        self._setup(tmp_path)
+        project = {"rule_overrides": {"b": {"enabled": False}}}
+        first = get_active_rules("s", load_schema("s", tmp_path), tmp_path, project)
+        second = get_active_rules("s", load_schema("s", tmp_path), tmp_path, project)
+        assert [r["id"] for r in first] == ["a"]
+        assert second is first
+
+    def test_rule_file_change_invalidates(self, tmp_path):
+        """Editing a referenced rule file rebuilds the active rules."""
+        self._setup(tmp_path)
+        project: dict = {}
+        first = get_active_rules("s", load_schema("s", tmp_path), tmp_path, project)
+        (tmp_path / "rules" / "b.yaml").write_text(
+            "defaults:\n  enabled: false\ncheck:\n  type: file_metric\n"
+        )
+        second = get_active_rules("s", load_schema("s", tmp_path), tmp_path, project)
+        assert [r["id"] for r in first] == ["a", "b"]
+        assert [r["id"] for r in second] == ["a"]
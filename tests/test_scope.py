@@ -33,6 +33,13 @@ class TestIsFileInScope:
         schema = {"scope": {"gated_paths": [], "exempt_paths": [], "exempt_files": []}}
         assert is_file_in_scope("any/path.py", schema, {}) is True
 
+    def test_cached_decision_tracks_scope_changes(self):
+        """A changed scope for the same filepath is re-evaluated."""
+        schema = {"scope": {"gated_paths": ["src/"], "exempt_paths": [], "exempt_files": []}}
+        assert is_file_in_scope("src/a.py", schema, {}) is True
+        schema["scope"]["exempt_paths"] = ["src/"]
+        assert is_file_in_scope("src/a.py", schema, {}) is False
+
 
 class TestResolveEffectiveSchema:
     """Tests for per-path schema overrides."""
@@ -62,3 +69,12 @@ class TestResolveEffectiveSchema:
         """Config without overrides key defaults to base schema."""
         config = {"schema": "minimal"}
         assert resolve_effective_schema("src/foo.py", config) == "minimal"
+
+    def test_exempt_matches_basename_glob(self):
+        """An exempt glob also matches against the bare filename."""
+        config = {
+            "schema": "production",
+            "overrides": {"conftest.py": {"schema": None}},
+        }
+        assert resolve_effective_schema("tests/unit/conftest.py", config) is None
+        assert resolve_effective_schema("tests/unit/helpers.py", config) == "production"
@@ -32,3 +32,32 @@ class TestTheme:
         assert theme._resolved is None
         _ = theme.resolved
         assert theme._resolved is not None
+
+    def test_tty_check_is_reused_per_stream(self):
+        """isatty() is asked once per stream, and a new stream is re-checked."""
+        class CountingStream(io.StringIO):
+            calls = 0
+
+            def isatty(self):
+                CountingStream.calls += 1
+                return True
+
+        theme = Theme()
+        tty = CountingStream()
+        for _ in range(3):
+            theme.code("error", stream=tty)
+        assert CountingStream.calls == 1
+        assert theme.code("error", stream=io.StringIO()) == ""
+
+    def test_colorize_wraps_with_reset_code(self):
+        """A TTY stream gets the role code, the text and the reset code."""
+        class TtyStream(io.StringIO):
+            def isatty(self):
+                return True
+
+        theme = Theme()
+        stream = TtyStream()
+        error = theme.code("error", stream=stream)
+        assert error
+        expected = f"{error}x{theme.resolved['reset']}"
+        assert theme.colorize("x", "error", stream=stream) == expected
@@ -4,7 +4,13 @@ from __future__ import annotations
 
 import pytest
 
-from gatehouse.lib.yaml_loader import load_yaml, load_yaml_string
+from gatehouse.lib.yaml_loader import (
+    clear_cache,
+    dump_yaml,
+    load_yaml,
+    load_yaml_cached,
+    load_yaml_string,
+)
 
 
 class TestLoadYaml:
@@ -49,3 +55,62 @@ class TestLoadYamlString:
         """Parsing an empty string returns None."""
         result = load_yaml_string("")
         assert result is None
+
+
+class TestDumpYaml:
+    """Tests for writing YAML files."""
+
+    def test_round_trip_preserves_key_order(self, tmp_path):
+        """A dumped document loads back equal, with keys in insertion order."""
+        data = {"schema": "api", "rule_overrides": {"b": {"severity": "off"}}}
+        path = tmp_path / "out.yaml"
+        dump_yaml(data, path)
+        assert load_yaml(path) == data
+        assert path.read_text().splitlines()[0] == "schema: api"
+
+
+class TestLoadYamlCached:
+    """Tests for the change-aware YAML cache."""
+
+    def test_unchanged_file_returns_same_object(self, tmp_path):
+        """A second load of an unchanged file reuses the parsed dict."""
+        yaml_file = tmp_path / "rule.yaml"
+        yaml_file.write_text("key: value\n")
+        assert load_yaml_cached(yaml_file) is load_yaml_cached(yaml_file)
+
+    def test_changed_file_is_reparsed(self, tmp_path):
+        """Rewriting the file invalidates the cached document."""
+        yaml_file = tmp_path / "rule.yaml"
+        yaml_file.write_text("key: value\n")
+        assert load_yaml_cached(yaml_file) == {"key": "value"}
+        yaml_file.write_text("key: changed value\n")
+        assert load_yaml_cached(yaml_file) == {"key": "changed value"}
+
+    def test_missing_file_returns_none(self, tmp_path):
+        """A path that is not a regular file yields None."""
+        assert load_yaml_cached(tmp_path / "absent.yaml") is None
+        assert load_yaml_cached(tmp_path) is None
+
+    def test_persists_to_cache_dir(self, tmp_path, monkeypatch):
+        """With GATEHOUSE_CACHE_DIR set, a new process reuses the parse."""
+        cache = tmp_path / "cache"
+        monkeypatch.setenv("GATEHOUSE_CACHE_DIR", str(cache))
+        yaml_file = tmp_path / "rule.yaml"
+        yaml_file.write_text("key: [1, 2]\n")
+        assert load_yaml_cached(yaml_file) == {"key": [1, 2]}
+        assert len(list(cache.glob("*.marshal"))) == 1
+        clear_cache()
+        assert load_yaml_cached(yaml_file) == {"key": [1, 2]}
+
+    def test_corrupt_cache_entry_is_ignored(self, tmp_path, monkeypatch):
+        """An unreadable cache file falls back to parsing the YAML."""
+        cache = tmp_path / "cache"
+        monkeypatch.setenv("GATEHOUSE_CACHE_DIR", str(cache))
+        yaml_file = tmp_path / "rule.yaml"
+        yaml_file.write_text("key: value\n")
+        load_yaml_cached(yaml_file)
+        for entry in cache.glob("*.marshal"):
+            entry.write_bytes(b"not marshal")
+        clear_cache()
+        assert load_yaml_cached(yaml_file) == {"key": "value"}
+